@@ -11,6 +11,10 @@ from typing import Optional
 API_BASE_URL = "https://server.123erfasst.de/api/graphql"
 API_TOKEN = os.getenv("ERFASST_API_TOKEN")
 API_USERNAME = os.getenv("ERFASST_API_USERNAME", "api")  # Default username for 123erfasst API
+# Send queries and mutations as Automatic Persisted Queries (requires server support)
+PERSISTED_QUERIES = os.getenv("ERFASST_PERSISTED_QUERIES", "false").lower() in ("1", "true", "yes")
+# Seconds to reuse identical query results (0 disables the response cache)
+CACHE_TTL = float(os.getenv("ERFASST_CACHE_TTL", "0"))
 
 # MCP Server Configuration
 SERVER_NAME = "123erfasst"
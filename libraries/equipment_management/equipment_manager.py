@@ -4,12 +4,217 @@ Equipment management functionality for construction projects.
 Follows Article I: Library-First Principle - Standalone library for equipment management.
 Follows Article V: Error Handling and Resilience - Comprehensive error handling.
 """
+import asyncio
 import logging
 from typing import Optional, List, Dict, Any
 from .exceptions import EquipmentManagementError, EquipmentNotFoundError, InvalidEquipmentDataError
 
 logger = logging.getLogger(__name__)
 
+# GraphQL documents are module constants so their persisted-query hashes are stable
+_LIST_EQUIPMENT_QUERY = """
+query GetEquipment {
+    equipments {
+        nodes {
+            ident
+            name
+        }
+        totalCount
+    }
+}
+"""
+
+_EQUIPMENT_DETAILS_QUERY = """
+query GetEquipment($id: ID!) {
+    equipment(id: $id) {
+        id
+        name
+        type
+        status
+        location
+        model
+        serialNumber
+        purchaseDate
+        lastMaintenance
+        nextMaintenance
+        assignedProjectId
+        assignedPersonId
+        maintenanceHistory {
+            id
+            date
+            description
+            cost
+            performedBy
+        }
+        createdAt
+        updatedAt
+    }
+}
+"""
+
+_SEARCH_EQUIPMENT_QUERY = """
+query SearchEquipment($query: String!, $status: String, $type: String, $limit: Int) {
+    equipment(
+        filter: { 
+            search: $query
+            status: $status
+            type: $type
+        }
+        limit: $limit
+        orderBy: relevance_DESC
+    ) {
+        id
+        name
+        type
+        status
+        location
+        model
+        serialNumber
+    }
+}
+"""
+
+_EQUIPMENT_BY_PROJECT_QUERY = """
+query GetEquipmentByProject($projectId: ID!) {
+    equipment(
+        filter: { assignedProjectId: $projectId }
+        orderBy: name_ASC
+    ) {
+        id
+        name
+        type
+        status
+        location
+        model
+        assignedProjectId
+        assignedPersonId
+    }
+}
+"""
+
+_EQUIPMENT_BY_PERSON_QUERY = """
+query GetEquipmentByPerson($personId: ID!) {
+    equipment(
+        filter: { assignedPersonId: $personId }
+        orderBy: name_ASC
+    ) {
+        id
+        name
+        type
+        status
+        location
+        model
+        assignedProjectId
+        assignedPersonId
+    }
+}
+"""
+
+_EQUIPMENT_STATISTICS_QUERY = """
+query GetEquipmentStatistics {
+    equipmentStats {
+        totalEquipment
+        operationalEquipment
+        maintenanceEquipment
+        outOfServiceEquipment
+        reservedEquipment
+        equipmentByType {
+            type
+            count
+        }
+        equipmentByStatus {
+            status
+            count
+        }
+        equipmentByLocation {
+            location
+            count
+        }
+        maintenanceDueCount
+        averageMaintenanceCost
+    }
+}
+"""
+
+_EQUIPMENT_COUNT_QUERY = """
+query GetEquipmentCount {
+    equipments {
+        totalCount
+    }
+}
+"""
+
+_CREATE_EQUIPMENT_MUTATION = """
+mutation CreateEquipment($input: CreateEquipmentInput!) {
+    createEquipment(input: $input) {
+        id
+        name
+        type
+        status
+        location
+        model
+        serialNumber
+        purchaseDate
+        createdAt
+    }
+}
+"""
+
+_UPDATE_EQUIPMENT_MUTATION = """
+mutation UpdateEquipment($id: ID!, $input: UpdateEquipmentInput!) {
+    updateEquipment(id: $id, input: $input) {
+        id
+        name
+        type
+        status
+        location
+        model
+        serialNumber
+        updatedAt
+    }
+}
+"""
+
+_ASSIGN_EQUIPMENT_TO_PROJECT_MUTATION = """
+mutation AssignEquipmentToProject($equipmentId: ID!, $projectId: ID!) {
+    assignEquipmentToProject(equipmentId: $equipmentId, projectId: $projectId) {
+        success
+        message
+    }
+}
+"""
+
+_ASSIGN_EQUIPMENT_TO_PERSON_MUTATION = """
+mutation AssignEquipmentToPerson($equipmentId: ID!, $personId: ID!) {
+    assignEquipmentToPerson(equipmentId: $equipmentId, personId: $personId) {
+        success
+        message
+    }
+}
+"""
+
+_UNASSIGN_EQUIPMENT_MUTATION = """
+mutation UnassignEquipment($equipmentId: ID!) {
+    unassignEquipment(equipmentId: $equipmentId) {
+        success
+        message
+    }
+}
+"""
+
+def _is_stats_unsupported(error: Exception) -> bool:
+    """Check whether the API rejected the query because it has no equipmentStats field."""
+    codes = getattr(error, "error_codes", None)
+    if codes:
+        return "GRAPHQL_VALIDATION_FAILED" in codes
+    return "equipmentStats" in str(error)
+
+
+def _build_equipment_statistics(total_count: int) -> Dict[str, Any]:
+    """Build the equipment statistics record from the equipments total count."""
+    # The equipments listing exposes no type, status or location to break the total down by
+    return {"totalEquipment": total_count}
+
 
 class EquipmentManager:
     """
@@ -55,20 +260,7 @@ class EquipmentManager:
             EquipmentManagementError: For equipment management errors
         """
         try:
-            # Build GraphQL query with correct schema structure
-            query = """
-            query GetEquipment {
-                equipments {
-                    nodes {
-                        ident
-                        name
-                    }
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
+            result = await self.client.query(_LIST_EQUIPMENT_QUERY)
             
             if "equipments" not in result:
                 return []
@@ -101,35 +293,7 @@ class EquipmentManager:
             EquipmentManagementError: For other equipment management errors
         """
         try:
-            query = """
-            query GetEquipment($id: ID!) {
-                equipment(id: $id) {
-                    id
-                    name
-                    type
-                    status
-                    location
-                    model
-                    serialNumber
-                    purchaseDate
-                    lastMaintenance
-                    nextMaintenance
-                    assignedProjectId
-                    assignedPersonId
-                    maintenanceHistory {
-                        id
-                        date
-                        description
-                        cost
-                        performedBy
-                    }
-                    createdAt
-                    updatedAt
-                }
-            }
-            """
-            
-            result = await self.client.query(query, {"id": equipment_id})
+            result = await self.client.query(_EQUIPMENT_DETAILS_QUERY, {"id": equipment_id})
             
             if "equipment" not in result or result["equipment"] is None:
                 raise EquipmentNotFoundError(f"Equipment {equipment_id} not found")
@@ -165,28 +329,6 @@ class EquipmentManager:
             EquipmentManagementError: For equipment management errors
         """
         try:
-            search_query = """
-            query SearchEquipment($query: String!, $status: String, $type: String, $limit: Int) {
-                equipment(
-                    filter: { 
-                        search: $query
-                        status: $status
-                        type: $type
-                    }
-                    limit: $limit
-                    orderBy: relevance_DESC
-                ) {
-                    id
-                    name
-                    type
-                    status
-                    location
-                    model
-                    serialNumber
-                }
-            }
-            """
-            
             variables = {"query": query}
             if status:
                 variables["status"] = status
@@ -195,7 +337,7 @@ class EquipmentManager:
             if limit:
                 variables["limit"] = limit
             
-            result = await self.client.query(search_query, variables)
+            result = await self.client.query(_SEARCH_EQUIPMENT_QUERY, variables)
             
             if "equipment" not in result:
                 return []
@@ -265,25 +407,7 @@ class EquipmentManager:
             EquipmentManagementError: For equipment management errors
         """
         try:
-            query = """
-            query GetEquipmentByProject($projectId: ID!) {
-                equipment(
-                    filter: { assignedProjectId: $projectId }
-                    orderBy: name_ASC
-                ) {
-                    id
-                    name
-                    type
-                    status
-                    location
-                    model
-                    assignedProjectId
-                    assignedPersonId
-                }
-            }
-            """
-            
-            result = await self.client.query(query, {"projectId": project_id})
+            result = await self.client.query(_EQUIPMENT_BY_PROJECT_QUERY, {"projectId": project_id})
             
             if "equipment" not in result:
                 return []
@@ -308,25 +432,7 @@ class EquipmentManager:
             EquipmentManagementError: For equipment management errors
         """
         try:
-            query = """
-            query GetEquipmentByPerson($personId: ID!) {
-                equipment(
-                    filter: { assignedPersonId: $personId }
-                    orderBy: name_ASC
-                ) {
-                    id
-                    name
-                    type
-                    status
-                    location
-                    model
-                    assignedProjectId
-                    assignedPersonId
-                }
-            }
-            """
-            
-            result = await self.client.query(query, {"personId": person_id})
+            result = await self.client.query(_EQUIPMENT_BY_PERSON_QUERY, {"personId": person_id})
             
             if "equipment" not in result:
                 return []
@@ -341,6 +447,9 @@ class EquipmentManager:
         """
         Get equipment statistics and metrics.
         
+        Uses the server-side equipmentStats aggregate. If the API doesn't provide
+        it, only the equipments total count is returned.
+        
         Returns:
             Dictionary containing equipment statistics
             
@@ -348,43 +457,75 @@ class EquipmentManager:
             EquipmentManagementError: For equipment management errors
         """
         try:
-            query = """
-            query GetEquipmentStatistics {
-                equipmentStats {
-                    totalEquipment
-                    operationalEquipment
-                    maintenanceEquipment
-                    outOfServiceEquipment
-                    reservedEquipment
-                    equipmentByType {
-                        type
-                        count
-                    }
-                    equipmentByStatus {
-                        status
-                        count
-                    }
-                    equipmentByLocation {
-                        location
-                        count
-                    }
-                    maintenanceDueCount
-                    averageMaintenanceCost
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
-            
-            if "equipmentStats" not in result:
+            try:
+                result = await self.client.query(_EQUIPMENT_STATISTICS_QUERY)
+            except Exception as e:
+                if not _is_stats_unsupported(e):
+                    raise
+                logger.warning(f"equipmentStats not supported by the API, using the equipment count: {e}")
+                result = {}
+            
+            if result.get("equipmentStats") is not None:
+                return result["equipmentStats"]
+            
+            result = await self.client.query(_EQUIPMENT_COUNT_QUERY)
+            if (equipments := result.get("equipments")) is None:
                 return {}
             
-            return result["equipmentStats"]
+            return _build_equipment_statistics(equipments.get("totalCount", 0))
             
         except Exception as e:
             logger.error(f"Failed to get equipment statistics: {e}")
             raise EquipmentManagementError(f"Failed to get equipment statistics: {e}")
     
+    async def bulk_fetch(
+        self,
+        project_ids: Optional[List[str]] = None,
+        person_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch equipment list, statistics and per-project/per-person assignments at once.
+        
+        The listing and assignment queries are sent through the client's
+        query_many, concurrently with get_equipment_statistics, so a dashboard
+        view waits for one round trip and keeps the statistics fallback for
+        APIs without equipmentStats.
+        
+        Args:
+            project_ids: Projects to fetch assigned equipment for
+            person_ids: Persons to fetch assigned equipment for
+            
+        Returns:
+            Dictionary with ``equipment``, ``statistics``, ``byProject`` and ``byPerson``
+            
+        Raises:
+            EquipmentManagementError: For equipment management errors
+        """
+        project_ids = list(project_ids or [])
+        person_ids = list(person_ids or [])
+        operations = [(_LIST_EQUIPMENT_QUERY, None)]
+        operations += [(_EQUIPMENT_BY_PROJECT_QUERY, {"projectId": project_id}) for project_id in project_ids]
+        operations += [(_EQUIPMENT_BY_PERSON_QUERY, {"personId": person_id}) for person_id in person_ids]
+        
+        try:
+            (listing, *assigned), statistics = await asyncio.gather(
+                self.client.query_many(operations),
+                self.get_equipment_statistics()
+            )
+        except EquipmentManagementError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to bulk fetch equipment: {e}")
+            raise EquipmentManagementError(f"Failed to bulk fetch equipment: {e}")
+        
+        assigned = [result.get("equipment") or [] for result in assigned]
+        return {
+            "equipment": (listing.get("equipments") or {}).get("nodes", []),
+            "statistics": statistics,
+            "byProject": dict(zip(project_ids, assigned)),
+            "byPerson": dict(zip(person_ids, assigned[len(project_ids):]))
+        }
+    
     async def create_equipment(self, equipment_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new equipment.
@@ -406,23 +547,7 @@ class EquipmentManager:
                 if field not in equipment_data or not equipment_data[field]:
                     raise InvalidEquipmentDataError(f"Required field '{field}' is missing or empty")
             
-            mutation = """
-            mutation CreateEquipment($input: CreateEquipmentInput!) {
-                createEquipment(input: $input) {
-                    id
-                    name
-                    type
-                    status
-                    location
-                    model
-                    serialNumber
-                    purchaseDate
-                    createdAt
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {"input": equipment_data})
+            result = await self.client.mutation(_CREATE_EQUIPMENT_MUTATION, {"input": equipment_data})
             
             if "createEquipment" not in result:
                 raise EquipmentManagementError("Failed to create equipment")
@@ -456,22 +581,7 @@ class EquipmentManager:
             EquipmentManagementError: For other equipment management errors
         """
         try:
-            mutation = """
-            mutation UpdateEquipment($id: ID!, $input: UpdateEquipmentInput!) {
-                updateEquipment(id: $id, input: $input) {
-                    id
-                    name
-                    type
-                    status
-                    location
-                    model
-                    serialNumber
-                    updatedAt
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {
+            result = await self.client.mutation(_UPDATE_EQUIPMENT_MUTATION, {
                 "id": equipment_id,
                 "input": update_data
             })
@@ -508,16 +618,7 @@ class EquipmentManager:
             EquipmentManagementError: For other equipment management errors
         """
         try:
-            mutation = """
-            mutation AssignEquipmentToProject($equipmentId: ID!, $projectId: ID!) {
-                assignEquipmentToProject(equipmentId: $equipmentId, projectId: $projectId) {
-                    success
-                    message
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {
+            result = await self.client.mutation(_ASSIGN_EQUIPMENT_TO_PROJECT_MUTATION, {
                 "equipmentId": equipment_id,
                 "projectId": project_id
             })
@@ -559,16 +660,7 @@ class EquipmentManager:
             EquipmentManagementError: For other equipment management errors
         """
         try:
-            mutation = """
-            mutation AssignEquipmentToPerson($equipmentId: ID!, $personId: ID!) {
-                assignEquipmentToPerson(equipmentId: $equipmentId, personId: $personId) {
-                    success
-                    message
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {
+            result = await self.client.mutation(_ASSIGN_EQUIPMENT_TO_PERSON_MUTATION, {
                 "equipmentId": equipment_id,
                 "personId": person_id
             })
@@ -605,16 +697,7 @@ class EquipmentManager:
             EquipmentManagementError: For other equipment management errors
         """
         try:
-            mutation = """
-            mutation UnassignEquipment($equipmentId: ID!) {
-                unassignEquipment(equipmentId: $equipmentId) {
-                    success
-                    message
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {"equipmentId": equipment_id})
+            result = await self.client.mutation(_UNASSIGN_EQUIPMENT_MUTATION, {"equipmentId": equipment_id})
             
             if "unassignEquipment" not in result:
                 raise EquipmentNotFoundError(f"Equipment {equipment_id} not found")
@@ -7,11 +7,13 @@ Follows Article IV: GraphQL-First API Design - All interactions use GraphQL as p
 
 from .client import GraphQLClient
 from .exceptions import GraphQLClientError, AuthenticationError, NetworkError, DataError
+from .runner import run_async
 
 __all__ = [
     "GraphQLClient",
     "GraphQLClientError", 
     "AuthenticationError",
     "NetworkError",
-    "DataError"
+    "DataError",
+    "run_async"
 ]
@@ -5,14 +5,148 @@ Follows Article IV: GraphQL-First API Design and Article V: Error Handling and R
 """
 import asyncio
 import base64
+import copy
+import hashlib
+import importlib.util
 import json
 import logging
-from typing import Dict, Any, Optional
+import random
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 import httpx
 from .exceptions import GraphQLClientError, AuthenticationError, NetworkError, DataError
 
+try:
+    import orjson
+except ImportError:  # Optional speedup from the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool shared by all requests of one client
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_REQUEST_TIMEOUT = httpx.Timeout(30.0)
+
+# Decorrelated-jitter backoff between retries of transient failures
+_MAX_RETRIES = 3
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 2.0
+
+# Maximum number of query results kept by the response cache
+_RESPONSE_CACHE_SIZE = 1024
+
+# Query root fields whose cached results each mutation root field can change.
+# Mutations not listed here clear the whole response cache.
+_PROJECT_FIELDS = frozenset({"project", "projects"})
+_PERSON_FIELDS = frozenset({"person", "persons", "people"})
+_EQUIPMENT_FIELDS = frozenset({"equipment", "equipments", "equipmentStats"})
+_TIME_FIELDS = frozenset({"times"})
+_MUTATION_INVALIDATES: Dict[str, FrozenSet[str]] = {
+    "createProject": _PROJECT_FIELDS,
+    "updateProject": _PROJECT_FIELDS,
+    "createPerson": _PERSON_FIELDS | _PROJECT_FIELDS,
+    "updatePerson": _PERSON_FIELDS,
+    "assignPersonToProject": _PERSON_FIELDS | _PROJECT_FIELDS,
+    "createEquipment": _EQUIPMENT_FIELDS,
+    "updateEquipment": _EQUIPMENT_FIELDS,
+    "assignEquipmentToProject": _EQUIPMENT_FIELDS | _PROJECT_FIELDS,
+    "assignEquipmentToPerson": _EQUIPMENT_FIELDS | _PERSON_FIELDS,
+    "unassignEquipment": _EQUIPMENT_FIELDS | _PROJECT_FIELDS | _PERSON_FIELDS,
+    "createStaffTime": _TIME_FIELDS,
+    "updateStaffTime": _TIME_FIELDS,
+}
+
+# Optional operation keyword, name and variable definitions up to the selection set
+_OPERATION_HEADER = re.compile(r"\s*(?:(?:query|mutation)\b[^{(]*(?:\([^)]*\))?)?\s*\{")
+_SELECTION_TOKEN = re.compile(r"[{}()]|\w+\s*:|\w+")
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a request payload as JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+@lru_cache(maxsize=256)
+def _encode_query(operation: str) -> bytes:
+    """Encode the constant query part of a request body, without its closing brace."""
+    return _dumps({"query": operation})[:-1]
+
+
+def _encode_request(operation: str, variables: Optional[Dict[str, Any]]) -> bytes:
+    """Encode a query request body, reusing the cached encoding of the document."""
+    return _encode_query(operation) + b',"variables":' + _dumps(variables or {}) + b"}"
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+@lru_cache(maxsize=256)
+def _query_hash(operation: str) -> str:
+    """SHA-256 hash of a query document as used by Automatic Persisted Queries."""
+    return hashlib.sha256(operation.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _root_fields(operation: str) -> FrozenSet[str]:
+    """
+    Names of the top-level fields selected by an operation.
+    
+    Aliases are skipped in favour of the field they alias; arguments and nested
+    selections are ignored. Returns an empty set if the document can't be read.
+    """
+    header = _OPERATION_HEADER.match(operation)
+    if header is None:
+        return frozenset()
+    
+    fields = set()
+    depth = 0
+    for token in _SELECTION_TOKEN.findall(operation, header.end()):
+        if token == "{" or token == "(":
+            depth += 1
+        elif token == "}" or token == ")":
+            if depth == 0:
+                return frozenset(fields)
+            depth -= 1
+        elif depth == 0 and not token.endswith(":"):
+            fields.add(token)
+    return frozenset()
+
+
+def _mutation_invalidates(mutation: str) -> Optional[FrozenSet[str]]:
+    """Query root fields a mutation can change, or None if it may change anything."""
+    fields = _root_fields(mutation)
+    if not fields or not fields <= _MUTATION_INVALIDATES.keys():
+        return None
+    return frozenset().union(*(_MUTATION_INVALIDATES[field] for field in fields))
+
+
+def _next_retry_delay(previous: float) -> float:
+    """
+    Pick the next retry delay with decorrelated jitter.
+    
+    Random between the base delay and three times the previous delay, capped, so
+    clients that failed together don't all retry at the same moment.
+    """
+    return min(_RETRY_MAX_DELAY, random.uniform(_RETRY_BASE_DELAY, previous * 3))
+
+
+def _is_persisted_query_miss(error: DataError) -> bool:
+    """Check whether the server does not know a persisted query hash."""
+    if "PERSISTED_QUERY_NOT_FOUND" in error.error_codes:
+        return True
+    return any(e.get("message") == "PersistedQueryNotFound" for e in error.errors)
+
 
 class GraphQLClient:
     """
@@ -22,7 +156,16 @@ class GraphQLClient:
     Follows Article V: Error Handling and Resilience - Comprehensive error handling.
     """
     
-    def __init__(self, base_url: str, token: str, username: str = None):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        username: str = None,
+        persisted_queries: bool = False,
+        max_concurrency: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize GraphQL client.
         
@@ -30,6 +173,14 @@ class GraphQLClient:
             base_url: Base URL for the GraphQL endpoint
             token: API token for authentication (can be password or full token)
             username: Username for Basic Authentication (optional, defaults to 'api')
+            persisted_queries: Send queries and mutations as Automatic Persisted
+                Queries (hash only once the server has seen the full document)
+            max_concurrency: Maximum number of requests in flight; defaults to the
+                connection pool size. Waiting requests are served in arrival order.
+            cache_ttl: Seconds to reuse query results; disabled when None or 0.
+                A mutation evicts the results of the root fields it affects.
+            transport: Optional httpx transport for the pooled HTTP client, e.g.
+                httpx.MockTransport in tests
             
         Raises:
             AuthenticationError: If token is empty or None
@@ -40,23 +191,80 @@ class GraphQLClient:
         self.base_url = base_url
         self.token = token
         self.username = username or "api"  # Default username for 123erfasst API
+        self.persisted_queries = persisted_queries
+        
+        # Hashes of queries the server has accepted as persisted queries
+        self._registered_queries = set()
+        
+        # Identical queries in flight, keyed by document and variables, share one request
+        self._inflight_queries: Dict[bytes, asyncio.Future] = {}
+        
+        # Query results by request key as (expiry, data, root fields), least recently used first
+        self.cache_ttl = cache_ttl
+        self._response_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any], FrozenSet[str]]]" = OrderedDict()
+        self._cache_generation = 0
+        
+        # Cached request keys by query root field, for evicting what a mutation touched
+        self._cache_tags: Dict[str, set] = {}
+        
+        # Pooled HTTP client, created on first request and reused for keep-alive
+        self._http: Optional[httpx.AsyncClient] = None
+        self._transport = transport
+        
+        # FIFO gate so bursts queue in arrival order instead of timing out on the pool
+        self._request_slots = asyncio.Semaphore(max_concurrency or _POOL_LIMITS.max_connections)
         
         # Implement proper Basic Authentication as per RFC 7617
         # Format: username:password encoded in base64
         credentials = f"{self.username}:{self.token}"
         encoded_credentials = base64.b64encode(credentials.encode('utf-8')).decode('utf-8')
         
-        self.headers = {
+        # Read-only: the pooled HTTP client copies these once, later edits would be lost
+        self.headers = MappingProxyType({
             "Authorization": f"Basic {encoded_credentials}",
             "Content-Type": "application/json"
-        }
+        })
         
         logger.info(f"GraphQL client initialized for {base_url} with Basic Auth")
     
+    async def __aenter__(self) -> "GraphQLClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Return the pooled HTTP client, creating it on first use.
+        
+        Auth headers and timeout are set once on the pooled client instead of
+        being passed with every request.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=_REQUEST_TIMEOUT,
+                http2=_HTTP2_AVAILABLE,
+                limits=_POOL_LIMITS,
+                transport=self._transport
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP client and its open connections.
+        """
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
     async def query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Execute a GraphQL query.
         
+        Concurrent calls with the same query and variables are coalesced into
+        a single HTTP request and all receive its result.
+        
         Args:
             query: GraphQL query string
             variables: Optional variables for the query
@@ -69,7 +277,101 @@ class GraphQLClient:
             NetworkError: If network operation fails
             DataError: If GraphQL returns errors
         """
-        return await self._execute(query, variables, operation_type="query")
+        key = hashlib.blake2b(_encode_request(query, variables), digest_size=16).digest()
+        if self.cache_ttl:
+            cached = self._response_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._response_cache.move_to_end(key)
+                return copy.deepcopy(cached[1])
+        
+        pending = self._inflight_queries.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._run_query(key, query, variables))
+            self._inflight_queries[key] = pending
+            pending.add_done_callback(lambda done: self._release_query(key, done))
+        
+        # Shield so a cancelled caller doesn't cancel the request for the others.
+        # Callers get their own copy, so editing nested rows can't reach the cache or each other
+        return copy.deepcopy(await asyncio.shield(pending))
+    
+    async def _run_query(self, key: bytes, query: str, variables: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send a query, as persisted query when enabled, and cache its result.
+        """
+        generation = self._cache_generation
+        if self.persisted_queries:
+            data = await self._execute_persisted(query, variables)
+        else:
+            data = await self._execute(query, variables, operation_type="query")
+        
+        # A mutation finished meanwhile; the result may predate it
+        tags = _root_fields(query)
+        if self.cache_ttl and tags and generation == self._cache_generation:
+            self._response_cache[key] = (time.monotonic() + self.cache_ttl, data, tags)
+            self._response_cache.move_to_end(key)
+            for tag in tags:
+                self._cache_tags.setdefault(tag, set()).add(key)
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._evict(next(iter(self._response_cache)))
+        return data
+    
+    def _evict(self, key: bytes) -> None:
+        """Drop a cached query result and its root field tags."""
+        entry = self._response_cache.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._cache_tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cache_tags[tag]
+    
+    async def query_many(
+        self,
+        operations: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute independent GraphQL queries concurrently.
+        
+        With HTTP/2 available the requests are multiplexed over one pooled
+        connection, so the batch takes about one round trip.
+        
+        Args:
+            operations: (query, variables) pairs
+            
+        Returns:
+            Query result data, in the order of the operations
+            
+        Raises:
+            AuthenticationError: If authentication fails
+            NetworkError: If network operation fails
+            DataError: If GraphQL returns errors
+        """
+        return list(await asyncio.gather(*(self.query(query, variables) for query, variables in operations)))
+    
+    def _release_query(self, key: bytes, pending: asyncio.Future) -> None:
+        """Forget a finished query unless a newer request already took its place."""
+        if self._inflight_queries.get(key) is pending:
+            del self._inflight_queries[key]
+    
+    def invalidate_cache(self, tags: Optional[FrozenSet[str]] = None) -> None:
+        """
+        Drop cached query results and stop sharing queries already in flight.
+        
+        Args:
+            tags: Query root fields whose results to drop; all results when None.
+                Queries in flight are never shared or cached past this call.
+        """
+        if tags is None:
+            self._response_cache.clear()
+            self._cache_tags.clear()
+        else:
+            for tag in tags:
+                for key in list(self._cache_tags.get(tag, ())):
+                    self._evict(key)
+        self._inflight_queries.clear()
+        self._cache_generation += 1
     
     async def mutation(self, mutation: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -87,56 +389,90 @@ class GraphQLClient:
             NetworkError: If network operation fails
             DataError: If GraphQL returns errors
         """
-        return await self._execute(mutation, variables, operation_type="mutation")
+        try:
+            if self.persisted_queries:
+                return await self._execute_persisted(mutation, variables, operation_type="mutation")
+            return await self._execute(mutation, variables, operation_type="mutation")
+        finally:
+            # Even a failed mutation may have changed data on the server
+            self.invalidate_cache(_mutation_invalidates(mutation))
     
     async def _execute(self, operation: str, variables: Optional[Dict[str, Any]], operation_type: str) -> Dict[str, Any]:
         """
-        Execute GraphQL operation with retry logic.
+        Execute a GraphQL operation by sending its full query text.
+        """
+        return await self._post(_encode_request(operation, variables), operation_type)
+    
+    async def _execute_persisted(
+        self,
+        operation: str,
+        variables: Optional[Dict[str, Any]],
+        operation_type: str = "query"
+    ) -> Dict[str, Any]:
+        """
+        Execute a query or mutation using Automatic Persisted Queries.
         
-        Follows Article V.2: Error Response - Implement retry logic for transient failures.
+        Known documents are sent as hash only. Unknown documents, or hashes the
+        server has forgotten, are sent once with the full text to register them.
+        A hash miss is answered before anything runs, so resending a mutation
+        doesn't apply it twice.
         """
-        payload = {
-            "query": operation,
-            "variables": variables or {}
-        }
+        query_hash = _query_hash(operation)
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
         
-        max_retries = 3
-        retry_delay = 1.0
+        if query_hash in self._registered_queries:
+            try:
+                return await self._post(
+                    _dumps({"variables": variables or {}, "extensions": extensions}),
+                    operation_type
+                )
+            except DataError as e:
+                if not _is_persisted_query_miss(e):
+                    raise
+                logger.debug(f"Persisted query {query_hash} not found on server, resending")
+                self._registered_queries.discard(query_hash)
         
-        for attempt in range(max_retries):
+        data = await self._post(
+            _dumps({"query": operation, "variables": variables or {}, "extensions": extensions}),
+            operation_type
+        )
+        self._registered_queries.add(query_hash)
+        return data
+    
+    async def _post(self, body: bytes, operation_type: str) -> Dict[str, Any]:
+        """
+        Send an encoded GraphQL request body with retry logic.
+        
+        Follows Article V.2: Error Response - Implement retry logic for transient failures.
+        """
+        retry_delay = _RETRY_BASE_DELAY
+        
+        for attempt in range(_MAX_RETRIES):
+            last_attempt = attempt == _MAX_RETRIES - 1
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self.base_url,
-                        headers=self.headers,
-                        json=payload,
-                        timeout=30.0
-                    )
-                    
-                    # Handle HTTP errors
-                    if response.status_code == 401:
-                        raise AuthenticationError("Invalid or expired API token")
-                    elif response.status_code >= 500:
-                        if attempt < max_retries - 1:
-                            logger.warning(f"Server error {response.status_code}, retrying in {retry_delay}s")
-                            await asyncio.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        else:
-                            raise NetworkError(f"Server error after {max_retries} attempts: {response.status_code}")
-                    elif response.status_code >= 400:
-                        raise NetworkError(f"Client error: {response.status_code}")
-                    
+                async with self._request_slots:
+                    response = await self._get_http().post(self.base_url, content=body)
+                
+                # Handle HTTP errors
+                if response.status_code == 401:
+                    raise AuthenticationError("Invalid or expired API token")
+                elif response.status_code >= 500:
+                    if last_attempt:
+                        raise NetworkError(f"Server error after {_MAX_RETRIES} attempts: {response.status_code}")
+                    reason = f"Server error {response.status_code}"
+                elif response.status_code >= 400:
+                    raise NetworkError(f"Client error: {response.status_code}")
+                else:
                     # Parse response
                     try:
-                        data = response.json()
+                        data = _loads(response.content)
                     except json.JSONDecodeError as e:
                         raise DataError(f"Invalid JSON response: {e}")
                     
                     # Check for GraphQL errors
                     if "errors" in data and data["errors"]:
                         error_messages = [error.get("message", "Unknown error") for error in data["errors"]]
-                        raise DataError(f"GraphQL errors: {'; '.join(error_messages)}")
+                        raise DataError(f"GraphQL errors: {'; '.join(error_messages)}", errors=data["errors"])
                     
                     # Return data
                     if "data" not in data:
@@ -144,26 +480,22 @@ class GraphQLClient:
                     
                     logger.debug(f"GraphQL {operation_type} executed successfully")
                     return data["data"]
-                    
+                
             except httpx.NetworkError as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Network error, retrying in {retry_delay}s: {e}")
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    raise NetworkError(f"Network error after {max_retries} attempts: {e}")
-            except (AuthenticationError, DataError):
-                # Don't retry on auth or data errors
+                if last_attempt:
+                    raise NetworkError(f"Network error after {_MAX_RETRIES} attempts: {e}")
+                reason = f"Network error: {e}"
+            except (AuthenticationError, NetworkError, DataError):
+                # Don't retry on auth, client or data errors
                 raise
             except Exception as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Unexpected error, retrying in {retry_delay}s: {e}")
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    raise GraphQLClientError(f"Unexpected error after {max_retries} attempts: {e}")
+                if last_attempt:
+                    raise GraphQLClientError(f"Unexpected error after {_MAX_RETRIES} attempts: {e}")
+                reason = f"Unexpected error: {e}"
+            
+            retry_delay = _next_retry_delay(retry_delay)
+            logger.warning(f"{reason}, retrying in {retry_delay:.2f}s")
+            await asyncio.sleep(retry_delay)
         
         # This should never be reached, but just in case
         raise GraphQLClientError("Maximum retries exceeded")
@@ -3,6 +3,8 @@ Custom exceptions for GraphQL client operations.
 
 Follows Article V: Error Handling and Resilience - Categorize errors for proper handling.
 """
+from typing import Any, Dict, List, Optional
+
 
 class GraphQLClientError(Exception):
     """Base exception for GraphQL client errors."""
@@ -18,4 +20,16 @@ class NetworkError(GraphQLClientError):
 
 class DataError(GraphQLClientError):
     """Raised when data validation or processing fails."""
-    pass
+    
+    def __init__(self, message: str, errors: Optional[List[Dict[str, Any]]] = None):
+        super().__init__(message)
+        self.errors = errors or []
+    
+    @property
+    def error_codes(self) -> List[str]:
+        """Error codes reported in the GraphQL ``extensions`` of each error."""
+        return [
+            error["extensions"]["code"]
+            for error in self.errors
+            if isinstance(error.get("extensions"), dict) and "code" in error["extensions"]
+        ]
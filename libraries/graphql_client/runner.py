@@ -0,0 +1,36 @@
+"""
+Event loop entry point shared by the server, the CLIs and the tool check script.
+
+Follows Article V: Error Handling and Resilience - Optional speedups degrade gracefully.
+"""
+import asyncio
+import logging
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup, not available on Windows
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+
+def run_async(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion in a new event loop.
+    
+    Uses the libuv-based loop when the "fast" extra is installed. uvloop.run
+    creates that loop directly instead of installing an event loop policy,
+    which is deprecated from Python 3.14.
+    
+    Args:
+        main: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is None:
+        return asyncio.run(main)
+    
+    logger.debug("Using uvloop event loop")
+    return uvloop.run(main)
@@ -4,6 +4,7 @@ MCP tools for project management functionality.
 Follows Article I: Library-First Principle - MCP tools use standalone libraries.
 """
 import logging
+from contextlib import aclosing
 from typing import Optional
 from mcp.server.fastmcp import FastMCP
 from .project_manager import ProjectManager
@@ -12,6 +13,19 @@ from .exceptions import ProjectManagementError, ProjectNotFoundError, InvalidPro
 logger = logging.getLogger(__name__)
 
 
+def _format_project_entry(index: int, project: dict) -> str:
+    """Format a single project from a projects page for the list output."""
+    return (
+        f"{index}. **{project.get('name', 'Unknown Project')}**\n"
+        f"   • ID: {project.get('ident', 'N/A')}\n"
+        f"   • Status: N/A (not available in current schema)\n"
+        f"   • Client: N/A (not available in current schema)\n"
+        f"   • Start: N/A (not available in current schema)\n"
+        f"   • End: N/A (not available in current schema)\n"
+        "\n"
+    )
+
+
 def register_project_management_tools(mcp: FastMCP, graphql_client) -> None:
     """
     Register project management MCP tools.
@@ -24,7 +38,8 @@ def register_project_management_tools(mcp: FastMCP, graphql_client) -> None:
     @mcp.tool()
     async def list_projects(
         status: Optional[str] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        after: Optional[str] = None
     ) -> str:
         """
         List all projects with optional filters.
@@ -32,29 +47,35 @@ def register_project_management_tools(mcp: FastMCP, graphql_client) -> None:
         Args:
             status: Optional status filter (active, completed, on_hold, cancelled, planning)
             limit: Optional limit on number of results
+            after: Optional cursor from a previous call to fetch the next page
             
         Returns:
             List of projects with details
         """
         try:
             manager = ProjectManager(graphql_client)
-            projects = await manager.list_projects(status=status, limit=limit)
-            
-            if not projects:
+            parts = []
+            next_cursor = None
+            
+            if limit:
+                # One page of `limit` projects; hand the cursor back for the next call
+                page = await manager.get_projects_page(status=status, first=limit, after=after)
+                for project in page["nodes"]:
+                    parts.append(_format_project_entry(len(parts) + 1, project))
+                if page["hasNextPage"]:
+                    next_cursor = page["endCursor"]
+            else:
+                async with aclosing(manager.iter_projects(status=status, after=after)) as projects:
+                    async for project in projects:
+                        parts.append(_format_project_entry(len(parts) + 1, project))
+            
+            if not parts:
                 status_text = f" with status '{status}'" if status else ""
                 return f"📋 No projects found{status_text}."
             
-            result = f"📊 Projects ({len(projects)}):\n\n"
-            
-            for i, project in enumerate(projects, 1):
-                result += f"{i}. **{project.get('name', 'Unknown Project')}**\n"
-                result += f"   • ID: {project.get('ident', 'N/A')}\n"
-                result += f"   • Status: N/A (not available in current schema)\n"
-                result += f"   • Client: N/A (not available in current schema)\n"
-                result += f"   • Start: N/A (not available in current schema)\n"
-                result += f"   • End: N/A (not available in current schema)\n"
-                result += "\n"
-            
+            result = f"📊 Projects ({len(parts)}):\n\n" + "".join(parts)
+            if next_cursor:
+                result += f"➡️ More projects available, call again with after='{next_cursor}'\n"
             return result
             
         except ProjectManagementError as e:
@@ -5,11 +5,144 @@ Follows Article I: Library-First Principle - Standalone library for project mana
 Follows Article V: Error Handling and Resilience - Comprehensive error handling.
 """
 import logging
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Optional, List, Dict, Any, AsyncIterator
 from .exceptions import ProjectManagementError, ProjectNotFoundError, InvalidProjectDataError
 
 logger = logging.getLogger(__name__)
 
+# Number of projects fetched per GraphQL page when streaming
+PROJECTS_PAGE_SIZE = 200
+
+# GraphQL documents are module constants so their persisted-query hashes are stable
+_LIST_PROJECTS_QUERY = """
+query GetProjects {
+    projects {
+        nodes {
+            ident
+            name
+        }
+        totalCount
+    }
+}
+"""
+
+_PROJECTS_PAGE_QUERY = """
+query GetProjectsPage($first: Int, $after: String) {
+    projects(first: $first, after: $after) {
+        nodes {
+            ident
+            name
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+# Status filtering is a GraphQL variable so the server only returns matching projects
+_FILTERED_PROJECTS_PAGE_QUERY = """
+query GetFilteredProjectsPage($first: Int, $after: String, $filter: ProjectFilter) {
+    projects(first: $first, after: $after, filter: $filter) {
+        nodes {
+            ident
+            name
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+_GET_PROJECT_QUERY = """
+query GetProject($id: Ident!) {
+    project(ident: $id) {
+        ident
+        name
+    }
+}
+"""
+
+_PROJECT_STATISTICS_QUERY = """
+query GetProjectStatistics {
+    projects {
+        totalCount
+    }
+}
+"""
+
+_UPDATE_PROJECT_MUTATION = """
+mutation UpdateProject($id: ID!, $input: UpdateProjectInput!) {
+    updateProject(id: $id, input: $input) {
+        id
+        name
+        status
+        startDate
+        endDate
+        description
+        clientName
+        budget
+        location
+        updatedAt
+    }
+}
+"""
+
+_DELETE_PROJECT_MUTATION = """
+mutation DeleteProject($id: ID!) {
+    deleteProject(id: $id) {
+        success
+        message
+    }
+}
+"""
+
+# Fields that must be present and non-empty when creating a project
+_REQUIRED_CREATE_FIELDS = ("name",)
+
+_CREATE_PROJECT_MUTATION = """
+mutation CreateProject($input: CreateProjectInput!) {
+    createProject(input: $input) {
+        id
+        name
+        status
+        startDate
+        endDate
+        description
+        clientName
+        budget
+        location
+        createdAt
+    }
+}
+"""
+
+
+def _is_not_found(error: Exception) -> bool:
+    """
+    Check whether an API error means the requested project does not exist.
+    
+    Uses the GraphQL error codes when the client provides them and only falls
+    back to inspecting the message for errors without structured codes.
+    """
+    codes = getattr(error, "error_codes", None)
+    if codes:
+        return "NOT_FOUND" in codes
+    return "not found" in str(error).lower()
+
+
+def _is_filter_unsupported(error: Exception) -> bool:
+    """Check whether the API rejected the query because of the filter argument."""
+    codes = getattr(error, "error_codes", None)
+    if codes:
+        return "GRAPHQL_VALIDATION_FAILED" in codes
+    message = str(error)
+    return "Unknown argument" in message or "ProjectFilter" in message
+
 
 class ProjectManager:
     """
@@ -34,7 +167,7 @@ class ProjectManager:
         self, 
         status: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        after: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         List all projects with optional filters.
@@ -42,7 +175,7 @@ class ProjectManager:
         Args:
             status: Optional status filter (active, completed, on_hold, cancelled)
             limit: Optional limit on number of results
-            offset: Optional offset for pagination
+            after: Optional cursor from a previous page to continue from
             
         Returns:
             List of project records
@@ -51,40 +184,96 @@ class ProjectManager:
             ProjectManagementError: For project management errors
         """
         try:
-            # Build GraphQL query with correct schema structure
-            query = """
-            query GetProjects {
-                projects {
-                    nodes {
-                        ident
-                        name
-                    }
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
-            
-            if "projects" not in result:
-                return []
-            
-            # Extract nodes from collection structure
-            projects = result["projects"].get("nodes", [])
+            if limit:
+                # A single page of exactly `limit` projects; the server does the slicing
+                page = await self.get_projects_page(status=status, first=limit, after=after)
+                return page["nodes"]
             
-            # Apply client-side filtering for now (until we understand the filter API)
-            if status:
-                # For now, return all projects since we don't know the status field structure
-                pass
+            return [project async for project in self.iter_projects(status=status, after=after)]
             
-            if limit:
-                projects = projects[:limit]
+        except ProjectManagementError:
+            raise
+        except Exception as e:
+            logger.error("Failed to list projects: %s", e)
+            raise ProjectManagementError(f"Failed to list projects: {e}")
+    
+    async def get_projects_page(
+        self,
+        status: Optional[str] = None,
+        first: int = PROJECTS_PAGE_SIZE,
+        after: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of projects using cursor pagination.
+        
+        Args:
+            status: Optional status filter (active, completed, on_hold, cancelled)
+            first: Number of projects to fetch
+            after: Optional cursor returned by the previous page
             
-            return projects
+        Returns:
+            Dictionary with ``nodes``, ``endCursor`` and ``hasNextPage``
             
+        Raises:
+            ProjectManagementError: For project management errors, including a
+                status filter the API does not support
+        """
+        if status:
+            query = _FILTERED_PROJECTS_PAGE_QUERY
+            variables = {"first": first, "after": after, "filter": {"status": {"eq": status}}}
+        else:
+            query = _PROJECTS_PAGE_QUERY
+            variables = {"first": first, "after": after}
+        
+        try:
+            result = await self.client.query(query, variables)
         except Exception as e:
-            logger.error(f"Failed to list projects: {e}")
+            if status and _is_filter_unsupported(e):
+                # Project nodes carry no status to match locally, so unfiltered rows would be wrong
+                logger.error("Project status filter not supported by the API: %s", e)
+                raise ProjectManagementError(f"Project status filter not supported by the API: {e}")
+            logger.error("Failed to list projects: %s", e)
             raise ProjectManagementError(f"Failed to list projects: {e}")
+        
+        page = result.get("projects") or {}
+        page_info = page.get("pageInfo") or {}
+        return {
+            "nodes": page.get("nodes", []),
+            "endCursor": page_info.get("endCursor"),
+            "hasNextPage": bool(page_info.get("hasNextPage")),
+        }
+    
+    async def iter_projects(
+        self,
+        status: Optional[str] = None,
+        page_size: int = PROJECTS_PAGE_SIZE,
+        after: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream projects page by page using cursor pagination.
+        
+        Only one page of projects is held in memory at a time, so callers
+        that stop iterating early never fetch the remaining pages.
+        
+        Args:
+            status: Optional status filter (active, completed, on_hold, cancelled)
+            page_size: Number of projects requested per page
+            after: Optional cursor to start streaming from
+            
+        Yields:
+            Project records
+            
+        Raises:
+            ProjectManagementError: For project management errors
+        """
+        while True:
+            page = await self.get_projects_page(status=status, first=page_size, after=after)
+            for project in page["nodes"]:
+                yield project
+            
+            after = page["endCursor"]
+            if not page["hasNextPage"] or not after:
+                return
     
     async def get_project_details(self, project_id: str) -> Dict[str, Any]:
         """
@@ -101,16 +290,7 @@ class ProjectManager:
             ProjectManagementError: For other project management errors
         """
         try:
-            query = """
-            query GetProject($id: Ident!) {
-                project(ident: $id) {
-                    ident
-                    name
-                }
-            }
-            """
-            
-            result = await self.client.query(query, {"id": project_id})
+            result = await self.client.query(_GET_PROJECT_QUERY, {"id": project_id})
             
             if "project" not in result or result["project"] is None:
                 raise ProjectNotFoundError(f"Project {project_id} not found")
@@ -120,7 +300,7 @@ class ProjectManager:
         except ProjectNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get project details for {project_id}: {e}")
+            logger.error("Failed to get project details for %s: %s", project_id, e)
             raise ProjectManagementError(f"Failed to get project details: {e}")
     
     async def search_projects(
@@ -144,37 +324,20 @@ class ProjectManager:
             ProjectManagementError: For project management errors
         """
         try:
-            search_query = """
-            query SearchProjects {
-                projects {
-                    nodes {
-                        ident
-                        name
-                    }
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(search_query)
-            
-            if "projects" not in result:
-                return []
+            # Same query path as list_projects; the search is applied client-side
+            projects = await self.list_projects(status=status)
             
-            # Extract nodes from collection structure
-            projects = result["projects"].get("nodes", [])
-            
-            # Apply client-side search filtering for now
             if query:
-                projects = [p for p in projects if query.lower() in p.get("name", "").lower()]
+                q = query.casefold()
+                projects = (p for p in projects if q in p.get("name", "").casefold())
             
-            if limit:
-                projects = projects[:limit]
-            
-            return projects
+            # islice stops matching as soon as `limit` projects were found
+            return list(islice(projects, limit)) if limit else list(projects)
             
+        except ProjectManagementError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to search projects: {e}")
+            logger.error("Failed to search projects: %s", e)
             raise ProjectManagementError(f"Failed to search projects: {e}")
     
     async def get_projects_by_status(self, status: str) -> List[Dict[str, Any]]:
@@ -211,19 +374,7 @@ class ProjectManager:
             ProjectManagementError: For project management errors
         """
         try:
-            query = """
-            query GetProjectsByDateRange {
-                projects {
-                    nodes {
-                        ident
-                        name
-                    }
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
+            result = await self.client.query(_LIST_PROJECTS_QUERY)
             
             if "projects" not in result:
                 return []
@@ -236,7 +387,7 @@ class ProjectManager:
             return projects
             
         except Exception as e:
-            logger.error(f"Failed to get projects by date range: {e}")
+            logger.error("Failed to get projects by date range: %s", e)
             raise ProjectManagementError(f"Failed to get projects by date range: {e}")
     
     async def get_project_statistics(self) -> Dict[str, Any]:
@@ -250,15 +401,7 @@ class ProjectManager:
             ProjectManagementError: For project management errors
         """
         try:
-            query = """
-            query GetProjectStatistics {
-                projects {
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
+            result = await self.client.query(_PROJECT_STATISTICS_QUERY)
             
             if "projects" not in result:
                 return {}
@@ -277,7 +420,7 @@ class ProjectManager:
             }
             
         except Exception as e:
-            logger.error(f"Failed to get project statistics: {e}")
+            logger.error("Failed to get project statistics: %s", e)
             raise ProjectManagementError(f"Failed to get project statistics: {e}")
     
     async def create_project(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -294,42 +437,22 @@ class ProjectManager:
             InvalidProjectDataError: If project data is invalid
             ProjectManagementError: For other project management errors
         """
+        # Validate required fields before touching the API
+        missing = [f for f in _REQUIRED_CREATE_FIELDS if not project_data.get(f)]
+        if missing:
+            raise InvalidProjectDataError(f"Required field '{missing[0]}' is missing or empty")
+        
         try:
-            # Validate required fields
-            required_fields = ["name"]
-            for field in required_fields:
-                if field not in project_data or not project_data[field]:
-                    raise InvalidProjectDataError(f"Required field '{field}' is missing or empty")
-            
-            mutation = """
-            mutation CreateProject($input: CreateProjectInput!) {
-                createProject(input: $input) {
-                    id
-                    name
-                    status
-                    startDate
-                    endDate
-                    description
-                    clientName
-                    budget
-                    location
-                    createdAt
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {"input": project_data})
+            result = await self.client.mutation(_CREATE_PROJECT_MUTATION, {"input": project_data})
             
             if "createProject" not in result:
                 raise ProjectManagementError("Failed to create project")
             
-            logger.info(f"Created project: {result['createProject']['id']}")
+            logger.info("Created project: %s", result['createProject']['id'])
             return result["createProject"]
             
-        except InvalidProjectDataError:
-            raise
         except Exception as e:
-            logger.error(f"Failed to create project: {e}")
+            logger.error("Failed to create project: %s", e)
             raise ProjectManagementError(f"Failed to create project: {e}")
     
     async def update_project(
@@ -352,24 +475,7 @@ class ProjectManager:
             ProjectManagementError: For other project management errors
         """
         try:
-            mutation = """
-            mutation UpdateProject($id: ID!, $input: UpdateProjectInput!) {
-                updateProject(id: $id, input: $input) {
-                    id
-                    name
-                    status
-                    startDate
-                    endDate
-                    description
-                    clientName
-                    budget
-                    location
-                    updatedAt
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {
+            result = await self.client.mutation(_UPDATE_PROJECT_MUTATION, {
                 "id": project_id,
                 "input": update_data
             })
@@ -377,13 +483,15 @@ class ProjectManager:
             if "updateProject" not in result:
                 raise ProjectNotFoundError(f"Project {project_id} not found")
             
-            logger.info(f"Updated project: {project_id}")
+            logger.info("Updated project: %s", project_id)
             return result["updateProject"]
             
+        except ProjectNotFoundError:
+            raise
         except Exception as e:
-            if "not found" in str(e).lower():
+            if _is_not_found(e):
                 raise ProjectNotFoundError(f"Project {project_id} not found")
-            logger.error(f"Failed to update project {project_id}: {e}")
+            logger.error("Failed to update project %s: %s", project_id, e)
             raise ProjectManagementError(f"Failed to update project: {e}")
     
     async def delete_project(self, project_id: str) -> bool:
@@ -401,30 +509,23 @@ class ProjectManager:
             ProjectManagementError: For other project management errors
         """
         try:
-            mutation = """
-            mutation DeleteProject($id: ID!) {
-                deleteProject(id: $id) {
-                    success
-                    message
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {"id": project_id})
+            result = await self.client.mutation(_DELETE_PROJECT_MUTATION, {"id": project_id})
             
             if "deleteProject" not in result:
                 raise ProjectNotFoundError(f"Project {project_id} not found")
             
             success = result["deleteProject"]["success"]
             if success:
-                logger.info(f"Deleted project: {project_id}")
+                logger.info("Deleted project: %s", project_id)
             else:
-                logger.warning(f"Failed to delete project {project_id}: {result['deleteProject']['message']}")
+                logger.warning("Failed to delete project %s: %s", project_id, result['deleteProject']['message'])
             
             return success
             
+        except ProjectNotFoundError:
+            raise
         except Exception as e:
-            if "not found" in str(e).lower():
+            if _is_not_found(e):
                 raise ProjectNotFoundError(f"Project {project_id} not found")
-            logger.error(f"Failed to delete project {project_id}: {e}")
+            logger.error("Failed to delete project %s: %s", project_id, e)
             raise ProjectManagementError(f"Failed to delete project: {e}")
@@ -6,10 +6,12 @@ Follows Article I: Library-First Principle - Standalone library for staff manage
 """
 
 from .staff_manager import StaffManager
+from .person_loader import PersonLoader
 from .exceptions import StaffManagementError, PersonNotFoundError, InvalidPersonDataError
 
 __all__ = [
     "StaffManager",
+    "PersonLoader",
     "StaffManagementError",
     "PersonNotFoundError",
     "InvalidPersonDataError"
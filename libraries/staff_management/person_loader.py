@@ -0,0 +1,123 @@
+"""
+Batched person lookups for staff management.
+
+Follows Article I: Library-First Principle - Standalone library for staff management.
+Follows Article V: Error Handling and Resilience - Comprehensive error handling.
+"""
+import asyncio
+import logging
+from typing import Optional, List, Dict, Any
+from .exceptions import PersonNotFoundError
+
+logger = logging.getLogger(__name__)
+
+_GET_PERSON_QUERY = """
+query GetPerson($id: Ident!) {
+    person(ident: $id) {
+        ident
+        firstname
+        lastname
+        formattedName
+    }
+}
+"""
+
+_GET_PERSONS_QUERY = """
+query GetPersons($ids: [Ident!]!) {
+    persons(filter: { ident: { in: $ids } }) {
+        nodes {
+            ident
+            firstname
+            lastname
+            formattedName
+        }
+    }
+}
+"""
+
+
+class PersonLoader:
+    """
+    Coalesce concurrent person lookups into a single GraphQL request.
+    
+    Every load() issued before the batch window closes is answered by one
+    query, and repeated ids within a batch are fetched only once. Nothing is
+    kept once a batch resolves, so one loader can serve every caller of a
+    client; share it between managers so their lookups batch together.
+    """
+    
+    def __init__(self, graphql_client, batch_window: float = 0.0):
+        """
+        Initialize person loader with GraphQL client.
+        
+        Args:
+            graphql_client: GraphQL client instance for API communication
+            batch_window: Seconds to wait for more loads before dispatching;
+                0 collects every load issued in the same event loop iteration
+        """
+        self.client = graphql_client
+        self.batch_window = batch_window
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._dispatch_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+    
+    async def load(self, person_id: str) -> Dict[str, Any]:
+        """
+        Load a single person, batched with other concurrent loads.
+        
+        Args:
+            person_id: Person identifier
+        
+        Returns:
+            Person record
+        
+        Raises:
+            PersonNotFoundError: If person doesn't exist
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(person_id, []).append(future)
+        
+        if self._dispatch_handle is None:
+            self._dispatch_handle = loop.call_later(self.batch_window, self._start_dispatch)
+        
+        return await future
+    
+    def _start_dispatch(self) -> None:
+        """Hand the collected batch to a dispatch task and reset the window."""
+        self._dispatch_handle = None
+        pending, self._pending = self._pending, {}
+        
+        task = asyncio.ensure_future(self._dispatch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _dispatch(self, pending: Dict[str, List[asyncio.Future]]) -> None:
+        """Fetch all pending ids with one query and resolve their futures."""
+        ids = list(pending)
+        try:
+            if len(ids) == 1:
+                result = await self.client.query(_GET_PERSON_QUERY, {"id": ids[0]})
+                person = result.get("person")
+                rows = {ids[0]: person} if person else {}
+            else:
+                result = await self.client.query(_GET_PERSONS_QUERY, {"ids": ids})
+                nodes = (result.get("persons") or {}).get("nodes", [])
+                rows = {row["ident"]: row for row in nodes}
+        except Exception as e:
+            logger.error("Failed to load %d persons: %s", len(ids), e)
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        
+        for person_id, futures in pending.items():
+            row = rows.get(person_id)
+            for future in futures:
+                if future.done():
+                    continue
+                if row is None:
+                    future.set_exception(PersonNotFoundError(f"Person {person_id} not found"))
+                else:
+                    future.set_result(row)
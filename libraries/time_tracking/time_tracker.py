@@ -5,12 +5,96 @@ Follows Article I: Library-First Principle - Standalone library for time trackin
 Follows Article V: Error Handling and Resilience - Comprehensive error handling.
 """
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, AsyncIterator
 from .exceptions import TimeTrackingError, InvalidProjectError, TimeTrackingActiveError, TimeTrackingNotActiveError
 
 logger = logging.getLogger(__name__)
 
+# Number of time records fetched per GraphQL page when streaming
+TIMES_PAGE_SIZE = 200
+
+# GraphQL documents are module constants so their persisted-query hashes are stable
+_START_MUTATION = """
+mutation CreateStaffTime($projectId: ID!, $personId: ID!, $description: String, $startTime: String!) {
+    createStaffTime(input: {
+        projectId: $projectId
+        personId: $personId
+        description: $description
+        startTime: $startTime
+        isActive: true
+    }) {
+        id
+        projectId
+        personId
+        startTime
+        isActive
+    }
+}
+"""
+
+_STOP_MUTATION = """
+mutation UpdateStaffTime($id: ID!, $endTime: String!) {
+    updateStaffTime(id: $id, input: {
+        endTime: $endTime
+        isActive: false
+    }) {
+        id
+        endTime
+        durationHours
+        isActive
+    }
+}
+"""
+
+# Current times and history select the same records until the schema's
+# time filters are known, so both share one document
+_TIMES_QUERY = """
+query GetStaffTimes {
+    times {
+        nodes {
+            ident
+            person {
+                firstname
+                lastname
+                formattedName
+            }
+            project {
+                name
+            }
+        }
+        totalCount
+    }
+}
+"""
+
+_TIME_HISTORY_PAGE_QUERY = """
+query GetStaffTimeHistoryPage($first: Int, $after: String) {
+    times(first: $first, after: $after) {
+        nodes {
+            ident
+            person {
+                firstname
+                lastname
+                formattedName
+            }
+            project {
+                name
+            }
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+
+def _utc_timestamp() -> str:
+    """Current time as an ISO 8601 UTC timestamp with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
 
 class TimeTracker:
     """
@@ -20,6 +104,8 @@ class TimeTracker:
     Follows Article VIII: Anti-Abstraction Principle - Use framework directly.
     """
     
+    __slots__ = ("client", "active_tracking")
+    
     def __init__(self, graphql_client):
         """
         Initialize time tracker with GraphQL client.
@@ -30,7 +116,7 @@ class TimeTracker:
         self.client = graphql_client
         self.active_tracking: Optional[str] = None
         
-        logger.info("TimeTracker initialized")
+        logger.debug("TimeTracker initialized")
     
     async def start_time_tracking(self, project_id: str, person_id: str, description: str = None) -> Dict[str, Any]:
         """
@@ -53,33 +139,14 @@ class TimeTracker:
             raise TimeTrackingActiveError("Time tracking is already active. Stop current tracking first.")
         
         try:
-            # GraphQL mutation to create time tracking record
-            mutation = """
-            mutation CreateStaffTime($projectId: ID!, $personId: ID!, $description: String) {
-                createStaffTime(input: {
-                    projectId: $projectId
-                    personId: $personId
-                    description: $description
-                    startTime: $startTime
-                    isActive: true
-                }) {
-                    id
-                    projectId
-                    personId
-                    startTime
-                    isActive
-                }
-            }
-            """
-            
             variables = {
                 "projectId": project_id,
                 "personId": person_id,
                 "description": description,
-                "startTime": datetime.now().isoformat()
+                "startTime": _utc_timestamp()
             }
             
-            result = await self.client.mutation(mutation, variables)
+            result = await self.client.mutation(_START_MUTATION, variables)
             
             if "createStaffTime" not in result:
                 raise TimeTrackingError("Failed to create time tracking record")
@@ -110,27 +177,12 @@ class TimeTracker:
             raise TimeTrackingNotActiveError("No active time tracking to stop")
         
         try:
-            # GraphQL mutation to update time tracking record
-            mutation = """
-            mutation UpdateStaffTime($id: ID!, $endTime: String!) {
-                updateStaffTime(id: $id, input: {
-                    endTime: $endTime
-                    isActive: false
-                }) {
-                    id
-                    endTime
-                    durationHours
-                    isActive
-                }
-            }
-            """
-            
             variables = {
                 "id": self.active_tracking,
-                "endTime": datetime.now().isoformat()
+                "endTime": _utc_timestamp()
             }
             
-            result = await self.client.mutation(mutation, variables)
+            result = await self.client.mutation(_STOP_MUTATION, variables)
             
             if "updateStaffTime" not in result:
                 raise TimeTrackingError("Failed to update time tracking record")
@@ -144,6 +196,16 @@ class TimeTracker:
         except Exception as e:
             raise TimeTrackingError(f"Failed to stop time tracking: {e}")
     
+    async def _query_times(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Run a times query and return its record nodes.
+        
+        Caching and sharing of concurrent identical queries are left to the
+        client, which honours its configured cache TTL.
+        """
+        result = await self.client.query(query)
+        return (result.get("times") or {}).get("nodes", [])
+    
     async def get_current_times(self, project_id: str = None, person_id: str = None) -> List[Dict[str, Any]]:
         """
         Get currently active time tracking records.
@@ -156,33 +218,7 @@ class TimeTracker:
             List of active time tracking records
         """
         try:
-            # Build GraphQL query with correct schema
-            query = """
-            query GetCurrentStaffTimes {
-                times {
-                    nodes {
-                        ident
-                        person {
-                            firstname
-                            lastname
-                            formattedName
-                        }
-                        project {
-                            name
-                        }
-                    }
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
-            
-            if "times" not in result:
-                return []
-            
-            # Extract nodes from collection structure
-            times = result["times"].get("nodes", [])
+            times = await self._query_times(_TIMES_QUERY)
             
             # For now, return all times since we don't have active filtering
             # TODO: Implement proper active filtering when we understand the schema
@@ -211,34 +247,11 @@ class TimeTracker:
         Returns:
             List of time tracking records
         """
+        if project_id or person_id or start_date or end_date:
+            logger.warning("Time tracking history filters are not applied yet; returning all records")
+        
         try:
-            # Build GraphQL query with correct schema
-            query = """
-            query GetStaffTimeHistory {
-                times {
-                    nodes {
-                        ident
-                        person {
-                            firstname
-                            lastname
-                            formattedName
-                        }
-                        project {
-                            name
-                        }
-                    }
-                    totalCount
-                }
-            }
-            """
-            
-            result = await self.client.query(query)
-            
-            if "times" not in result:
-                return []
-            
-            # Extract nodes from collection structure
-            times = result["times"].get("nodes", [])
+            times = await self._query_times(_TIMES_QUERY)
             
             # For now, return all times since we don't have date filtering
             # TODO: Implement proper date filtering when we understand the schema
@@ -248,6 +261,44 @@ class TimeTracker:
             logger.error(f"Failed to get time tracking history: {e}")
             raise TimeTrackingError(f"Failed to get time tracking history: {e}")
     
+    async def iter_time_tracking_history(
+        self,
+        page_size: int = TIMES_PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the full time tracking history page by page using cursor pagination.
+        
+        Only one page of records is held in memory at a time, so long
+        histories can be printed without building the full list. The records
+        carry no project, person or date fields to filter on, so no filters
+        are accepted.
+        
+        Args:
+            page_size: Number of records requested per page
+            
+        Yields:
+            Time tracking records
+            
+        Raises:
+            TimeTrackingError: For time tracking errors
+        """
+        after = None
+        while True:
+            try:
+                result = await self.client.query(_TIME_HISTORY_PAGE_QUERY, {"first": page_size, "after": after})
+            except Exception as e:
+                logger.error(f"Failed to get time tracking history: {e}")
+                raise TimeTrackingError(f"Failed to get time tracking history: {e}")
+            
+            page = result.get("times") or {}
+            for record in page.get("nodes", []):
+                yield record
+            
+            page_info = page.get("pageInfo") or {}
+            after = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not after:
+                return
+    
     def is_tracking_active(self) -> bool:
         """
         Check if time tracking is currently active.
@@ -8,6 +8,18 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup from the "fast" extra
+    orjson = None
+
+def write_json(path, data):
+    """Write data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2))
+
 def create_config_files():
     """Create configuration files for Cursor and VS Code."""
     print("🚀 Quick Setup for 123erfasst MCP Server")
@@ -50,8 +62,7 @@ def create_config_files():
     }
     
     cursor_file = Path(__file__).parent / "cursor-mcp-config.json"
-    with open(cursor_file, 'w') as f:
-        json.dump(cursor_config, f, indent=2)
+    write_json(cursor_file, cursor_config)
     print(f"✅ Created: {cursor_file}")
     
     # Create VS Code config
@@ -66,8 +77,7 @@ def create_config_files():
     }
     
     vscode_file = Path(__file__).parent / "vscode-mcp-config.json"
-    with open(vscode_file, 'w') as f:
-        json.dump(vscode_config, f, indent=2)
+    write_json(vscode_file, vscode_config)
     print(f"✅ Created: {vscode_file}")
     
     print(f"\n🎉 Setup complete!")
@@ -4,7 +4,6 @@
 Main MCP server for integrating with 123erfasst construction management system.
 Follows Article I: Library-First Principle - MCP tools are implemented using standalone libraries.
 """
-import asyncio
 import logging
 import sys
 from pathlib import Path
@@ -13,7 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "libraries"))
 
 from mcp.server.fastmcp import FastMCP
-from graphql_client import GraphQLClient
+from graphql_client import GraphQLClient, run_async
 from time_tracking.mcp_tools import register_time_tracking_tools
 from project_management.mcp_tools import register_project_management_tools
 from staff_management.mcp_tools import register_staff_management_tools
@@ -44,7 +43,13 @@ def setup_mcp_tools():
         if not api_token or api_token == "YOUR_123ERFASST_API_TOKEN_HERE":
             raise ValueError("API token not configured. Please run setup-cursor.py first.")
         
-        graphql_client = GraphQLClient(config.API_BASE_URL, api_token, api_username)
+        graphql_client = GraphQLClient(
+            config.API_BASE_URL,
+            api_token,
+            api_username,
+            persisted_queries=config.PERSISTED_QUERIES,
+            cache_ttl=config.CACHE_TTL
+        )
         
         # Register time tracking tools
         register_time_tracking_tools(mcp, graphql_client)
@@ -74,6 +79,6 @@ if __name__ == "__main__":
     # Set up MCP tools
     setup_mcp_tools()
     
-    # Run MCP server
-    mcp.run(transport='stdio')
+    # Run MCP server over stdio, on uvloop when the "fast" extra is installed
+    run_async(mcp.run_stdio_async())
 
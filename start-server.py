@@ -5,6 +5,7 @@ This script loads environment variables and starts the MCP server.
 """
 import logging
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -16,17 +17,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# KEY=value assignments, one per line; comments and blank lines never match
+_ENV_LINE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
 def load_env_file():
     """Load environment variables from .env file if it exists."""
     env_file = Path(__file__).parent / ".env"
     if env_file.exists():
         logger.info(f"📁 Loading environment from {env_file}")
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
+        os.environ.update(_ENV_LINE.findall(env_file.read_text()))
         logger.info("✅ Environment variables loaded")
     else:
         logger.warning("⚠️  No .env file found, using system environment variables")
@@ -10,7 +10,7 @@ from pathlib import Path
 # Add libraries to path
 sys.path.insert(0, str(Path(__file__).parent / "libraries"))
 
-from graphql_client import GraphQLClient
+from graphql_client import GraphQLClient, run_async
 from time_tracking.mcp_tools import register_time_tracking_tools
 from project_management.mcp_tools import register_project_management_tools
 from staff_management.mcp_tools import register_staff_management_tools
@@ -26,6 +26,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on tool probes in flight at once
+MAX_CONCURRENT_PROBES = 8
+
 async def test_mcp_tools():
     """Test all MCP tools."""
     logger.info("🧪 Testing 123erfasst MCP Tools")
@@ -71,33 +74,28 @@ async def test_mcp_tools():
         # Test a few key tools
         logger.info("\n🧪 Testing key MCP tools...")
         
-        # Test health check
-        try:
-            health_result = await mcp.call_tool("health_check", {})
-            logger.info(f"✅ Health check: {health_result}")
-        except Exception as e:
-            logger.error(f"❌ Health check failed: {e}")
-        
-        # Test project listing
-        try:
-            projects_result = await mcp.call_tool("list_projects", {})
-            logger.info(f"✅ List projects: {len(projects_result)} projects found")
-        except Exception as e:
-            logger.error(f"❌ List projects failed: {e}")
+        # Probe key tools concurrently; they share one client and connection pool
+        probes = (
+            ("health_check", "Health check", str),
+            ("list_projects", "List projects", lambda result: f"{len(result)} projects found"),
+            ("list_staff", "List staff", lambda result: f"{len(result)} staff members found"),
+            ("list_equipment", "List equipment", lambda result: f"{len(result)} equipment items found"),
+        )
+        probe_slots = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
         
-        # Test staff listing
-        try:
-            staff_result = await mcp.call_tool("list_staff", {})
-            logger.info(f"✅ List staff: {len(staff_result)} staff members found")
-        except Exception as e:
-            logger.error(f"❌ List staff failed: {e}")
+        async def call_tool(name):
+            async with probe_slots:
+                return await mcp.call_tool(name, {})
         
-        # Test equipment listing
-        try:
-            equipment_result = await mcp.call_tool("list_equipment", {})
-            logger.info(f"✅ List equipment: {len(equipment_result)} equipment items found")
-        except Exception as e:
-            logger.error(f"❌ List equipment failed: {e}")
+        results = await asyncio.gather(
+            *(call_tool(name) for name, _, _ in probes),
+            return_exceptions=True
+        )
+        for (_, label, describe), result in zip(probes, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ {label} failed: {result}")
+            else:
+                logger.info(f"✅ {label}: {describe(result)}")
         
         logger.info(f"\n🎉 All MCP tools are working!")
         logger.info(f"\n📋 Available tools by category:")
@@ -129,4 +127,5 @@ async def main():
     return 0 if success else 1
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    # Runs on uvloop when the "fast" extra is installed
+    sys.exit(run_async(main()))
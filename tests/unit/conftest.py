@@ -0,0 +1,110 @@
+"""
+Shared fixtures for unit tests.
+"""
+import asyncio
+import json
+from unittest.mock import Mock, AsyncMock
+
+import httpx
+import pytest
+
+from equipment_management import EquipmentManager
+from graphql_client import GraphQLClient
+from project_management import ProjectManager
+from staff_management import StaffManager
+from time_tracking import TimeTracker
+
+
+# GraphQL client methods that are coroutines
+_ASYNC_CLIENT_METHODS = frozenset({"query", "query_many", "mutation"})
+
+
+class _ClientMock(Mock):
+    """
+    Mock GraphQL client that creates its awaitable methods on first access.
+    
+    AsyncMock is costly to build, and most tests touch only one client method.
+    """
+    
+    def _get_child_mock(self, **kwargs):
+        if kwargs.get("name") in _ASYNC_CLIENT_METHODS:
+            return AsyncMock(**kwargs)
+        return Mock(**kwargs)
+
+
+@pytest.fixture
+def mock_client():
+    """GraphQL client double whose query methods and mutation are awaitable mocks."""
+    return _ClientMock()
+
+
+@pytest.fixture
+def equipment_manager(mock_client):
+    """EquipmentManager wired to the mock client."""
+    return EquipmentManager(mock_client)
+
+
+@pytest.fixture
+def project_manager(mock_client):
+    """ProjectManager wired to the mock client."""
+    return ProjectManager(mock_client)
+
+
+@pytest.fixture
+def staff_manager(mock_client):
+    """StaffManager wired to the mock client."""
+    return StaffManager(mock_client)
+
+
+@pytest.fixture
+def time_tracker(mock_client):
+    """TimeTracker wired to the mock client."""
+    return TimeTracker(mock_client)
+
+
+class FakeServer:
+    """
+    GraphQL endpoint served in-process through httpx.MockTransport.
+    
+    Queued responses (or exceptions to raise) are served in order; the last
+    one keeps being served once the queue is down to it.
+    """
+    
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+        self.delay = 0.0
+        self.transport = httpx.MockTransport(self._handle)
+    
+    def respond(self, body, status_code=200):
+        """Queue a JSON response."""
+        self.responses.append(httpx.Response(status_code, json=body))
+    
+    def fail(self, error):
+        """Queue an exception raised by the transport."""
+        self.responses.append(error)
+    
+    def payload(self, index=-1):
+        """Decoded JSON body of a received request."""
+        return json.loads(self.requests[index].content)
+    
+    async def _handle(self, request):
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def server():
+    """In-process GraphQL endpoint for a real client."""
+    return FakeServer()
+
+
+@pytest.fixture
+def client(server):
+    """Real GraphQLClient talking to the fake server."""
+    return GraphQLClient("https://test.api.com", "test-token", transport=server.transport)
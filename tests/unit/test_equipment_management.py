@@ -4,30 +4,22 @@ Unit tests for equipment management library.
 Follows Article III: Test-First Imperative - Tests written before implementation.
 """
 import pytest
-from unittest.mock import Mock, AsyncMock
-import sys
-from pathlib import Path
 
-# Add libraries to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "libraries"))
+from equipment_management import EquipmentManagementError, EquipmentNotFoundError, InvalidEquipmentDataError
 
-from equipment_management import EquipmentManager, EquipmentManagementError, EquipmentNotFoundError, InvalidEquipmentDataError
+pytestmark = pytest.mark.unit
 
 
 class TestEquipmentManager:
     """Test cases for EquipmentManager class."""
     
-    def test_init_with_valid_client(self):
+    def test_init_with_valid_client(self, mock_client, equipment_manager):
         """Test EquipmentManager initialization with valid GraphQL client."""
-        mock_client = Mock()
-        manager = EquipmentManager(mock_client)
-        assert manager.client == mock_client
+        assert equipment_manager.client == mock_client
     
-    @pytest.mark.asyncio
-    async def test_list_equipment_success(self):
+    async def test_list_equipment_success(self, mock_client, equipment_manager):
         """Test successful equipment listing."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -48,10 +40,9 @@ class TestEquipmentManager:
                     "serialNumber": "LTM-67890"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.list_equipment()
+        result = await equipment_manager.list_equipment()
         
         assert len(result) == 2
         assert result[0]["id"] == "eq-123"
@@ -60,11 +51,9 @@ class TestEquipmentManager:
         assert result[1]["id"] == "eq-456"
         assert result[1]["status"] == "maintenance"
     
-    @pytest.mark.asyncio
-    async def test_list_equipment_with_filters(self):
+    async def test_list_equipment_with_filters(self, mock_client, equipment_manager):
         """Test equipment listing with status filter."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -72,30 +61,24 @@ class TestEquipmentManager:
                     "status": "operational"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.list_equipment(status="operational")
+        result = await equipment_manager.list_equipment(status="operational")
         
         assert len(result) == 1
         assert result[0]["status"] == "operational"
     
-    @pytest.mark.asyncio
-    async def test_list_equipment_empty(self):
+    async def test_list_equipment_empty(self, mock_client, equipment_manager):
         """Test equipment listing when no equipment exists."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"equipment": []})
+        mock_client.query.return_value = {"equipment": []}
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.list_equipment()
+        result = await equipment_manager.list_equipment()
         
         assert result == []
     
-    @pytest.mark.asyncio
-    async def test_get_equipment_details_success(self):
+    async def test_get_equipment_details_success(self, mock_client, equipment_manager):
         """Test successful equipment details retrieval."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": {
                 "id": "eq-123",
                 "name": "Excavator EX-001",
@@ -110,32 +93,26 @@ class TestEquipmentManager:
                 "assignedProjectId": "proj-123",
                 "assignedPersonId": "person-456"
             }
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.get_equipment_details("eq-123")
+        result = await equipment_manager.get_equipment_details("eq-123")
         
         assert result["id"] == "eq-123"
         assert result["name"] == "Excavator EX-001"
         assert result["status"] == "operational"
         assert result["model"] == "CAT 320"
     
-    @pytest.mark.asyncio
-    async def test_get_equipment_details_not_found(self):
+    async def test_get_equipment_details_not_found(self, mock_client, equipment_manager):
         """Test equipment details retrieval when equipment doesn't exist."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"equipment": None})
+        mock_client.query.return_value = {"equipment": None}
         
-        manager = EquipmentManager(mock_client)
         
         with pytest.raises(EquipmentNotFoundError):
-            await manager.get_equipment_details("invalid-eq")
+            await equipment_manager.get_equipment_details("invalid-eq")
     
-    @pytest.mark.asyncio
-    async def test_search_equipment_by_name(self):
+    async def test_search_equipment_by_name(self, mock_client, equipment_manager):
         """Test searching equipment by name."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -144,19 +121,16 @@ class TestEquipmentManager:
                     "status": "operational"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.search_equipment(query="Excavator")
+        result = await equipment_manager.search_equipment(query="Excavator")
         
         assert len(result) == 1
         assert "Excavator" in result[0]["name"]
     
-    @pytest.mark.asyncio
-    async def test_search_equipment_by_type(self):
+    async def test_search_equipment_by_type(self, mock_client, equipment_manager):
         """Test searching equipment by type."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -165,30 +139,24 @@ class TestEquipmentManager:
                     "status": "operational"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.search_equipment(query="Heavy Machinery")
+        result = await equipment_manager.search_equipment(query="Heavy Machinery")
         
         assert len(result) == 1
         assert result[0]["type"] == "Heavy Machinery"
     
-    @pytest.mark.asyncio
-    async def test_search_equipment_empty(self):
+    async def test_search_equipment_empty(self, mock_client, equipment_manager):
         """Test searching equipment when no matches found."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"equipment": []})
+        mock_client.query.return_value = {"equipment": []}
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.search_equipment(query="NonExistent")
+        result = await equipment_manager.search_equipment(query="NonExistent")
         
         assert result == []
     
-    @pytest.mark.asyncio
-    async def test_get_equipment_by_status(self):
+    async def test_get_equipment_by_status(self, mock_client, equipment_manager):
         """Test getting equipment filtered by status."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -196,19 +164,16 @@ class TestEquipmentManager:
                     "status": "operational"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.get_equipment_by_status("operational")
+        result = await equipment_manager.get_equipment_by_status("operational")
         
         assert len(result) == 1
         assert result[0]["status"] == "operational"
     
-    @pytest.mark.asyncio
-    async def test_get_equipment_by_type(self):
+    async def test_get_equipment_by_type(self, mock_client, equipment_manager):
         """Test getting equipment filtered by type."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -216,19 +181,16 @@ class TestEquipmentManager:
                     "type": "Heavy Machinery"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.get_equipment_by_type("Heavy Machinery")
+        result = await equipment_manager.get_equipment_by_type("Heavy Machinery")
         
         assert len(result) == 1
         assert result[0]["type"] == "Heavy Machinery"
     
-    @pytest.mark.asyncio
-    async def test_get_equipment_by_location(self):
+    async def test_get_equipment_by_location(self, mock_client, equipment_manager):
         """Test getting equipment filtered by location."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -236,19 +198,16 @@ class TestEquipmentManager:
                     "location": "Site A"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.get_equipment_by_location("Site A")
+        result = await equipment_manager.get_equipment_by_location("Site A")
         
         assert len(result) == 1
         assert result[0]["location"] == "Site A"
     
-    @pytest.mark.asyncio
-    async def test_get_equipment_statistics(self):
+    async def test_get_equipment_statistics(self, mock_client, equipment_manager):
         """Test getting equipment statistics."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipmentStats": {
                 "totalEquipment": 25,
                 "operationalEquipment": 20,
@@ -264,30 +223,47 @@ class TestEquipmentManager:
                     {"status": "out_of_service", "count": 2}
                 ]
             }
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.get_equipment_statistics()
+        result = await equipment_manager.get_equipment_statistics()
         
         assert result["totalEquipment"] == 25
         assert result["operationalEquipment"] == 20
         assert result["maintenanceEquipment"] == 3
         assert result["outOfServiceEquipment"] == 2
     
-    @pytest.mark.asyncio
-    async def test_create_equipment_success(self):
+    async def test_get_equipment_statistics_counts_when_aggregate_missing(self, mock_client, equipment_manager):
+        """Test that statistics fall back to the equipments total count without equipmentStats."""
+        mock_client.query.side_effect = [
+            {"equipmentStats": None},
+            {"equipments": {"nodes": [{"ident": "eq-1", "name": "Excavator"}], "totalCount": 3}}
+        ]
+        
+        result = await equipment_manager.get_equipment_statistics()
+        
+        assert mock_client.query.call_count == 2
+        assert "totalCount" in mock_client.query.call_args[0][0]
+        assert result == {"totalEquipment": 3}
+    
+    async def test_get_equipment_statistics_empty_without_equipments(self, mock_client, equipment_manager):
+        """Test that statistics stay empty when neither equipmentStats nor equipments is returned."""
+        mock_client.query.side_effect = [{"equipmentStats": None}, {}]
+        
+        result = await equipment_manager.get_equipment_statistics()
+        
+        assert result == {}
+    
+    async def test_create_equipment_success(self, mock_client, equipment_manager):
         """Test successful equipment creation."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
+        mock_client.mutation.return_value = {
             "createEquipment": {
                 "id": "eq-new-123",
                 "name": "New Excavator",
                 "type": "Heavy Machinery",
                 "status": "operational"
             }
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
         equipment_data = {
             "name": "New Excavator",
             "type": "Heavy Machinery",
@@ -296,97 +272,80 @@ class TestEquipmentManager:
             "serialNumber": "CAT320-NEW"
         }
         
-        result = await manager.create_equipment(equipment_data)
+        result = await equipment_manager.create_equipment(equipment_data)
         
         assert result["id"] == "eq-new-123"
         assert result["name"] == "New Excavator"
         assert result["type"] == "Heavy Machinery"
     
-    @pytest.mark.asyncio
-    async def test_create_equipment_invalid_data(self):
+    async def test_create_equipment_invalid_data(self, mock_client, equipment_manager):
         """Test equipment creation with invalid data."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(side_effect=Exception("Invalid equipment data"))
+        mock_client.mutation.side_effect = Exception("Invalid equipment data")
         
-        manager = EquipmentManager(mock_client)
         equipment_data = {"name": ""}  # Invalid: empty name
         
         with pytest.raises(InvalidEquipmentDataError):
-            await manager.create_equipment(equipment_data)
+            await equipment_manager.create_equipment(equipment_data)
     
-    @pytest.mark.asyncio
-    async def test_update_equipment_success(self):
+    async def test_update_equipment_success(self, mock_client, equipment_manager):
         """Test successful equipment update."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
+        mock_client.mutation.return_value = {
             "updateEquipment": {
                 "id": "eq-123",
                 "name": "Updated Excavator",
                 "status": "maintenance"
             }
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
         update_data = {
             "name": "Updated Excavator",
             "status": "maintenance"
         }
         
-        result = await manager.update_equipment("eq-123", update_data)
+        result = await equipment_manager.update_equipment("eq-123", update_data)
         
         assert result["id"] == "eq-123"
         assert result["name"] == "Updated Excavator"
         assert result["status"] == "maintenance"
     
-    @pytest.mark.asyncio
-    async def test_update_equipment_not_found(self):
+    async def test_update_equipment_not_found(self, mock_client, equipment_manager):
         """Test equipment update when equipment doesn't exist."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(side_effect=Exception("Equipment not found"))
+        mock_client.mutation.side_effect = Exception("Equipment not found")
         
-        manager = EquipmentManager(mock_client)
         update_data = {"name": "Updated Name"}
         
         with pytest.raises(EquipmentNotFoundError):
-            await manager.update_equipment("invalid-eq", update_data)
+            await equipment_manager.update_equipment("invalid-eq", update_data)
     
-    @pytest.mark.asyncio
-    async def test_assign_equipment_to_project(self):
+    async def test_assign_equipment_to_project(self, mock_client, equipment_manager):
         """Test assigning equipment to a project."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
+        mock_client.mutation.return_value = {
             "assignEquipmentToProject": {
                 "success": True,
                 "message": "Equipment assigned successfully"
             }
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.assign_equipment_to_project("eq-123", "proj-456")
+        result = await equipment_manager.assign_equipment_to_project("eq-123", "proj-456")
         
         assert result is True
     
-    @pytest.mark.asyncio
-    async def test_assign_equipment_to_person(self):
+    async def test_assign_equipment_to_person(self, mock_client, equipment_manager):
         """Test assigning equipment to a person."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
+        mock_client.mutation.return_value = {
             "assignEquipmentToPerson": {
                 "success": True,
                 "message": "Equipment assigned successfully"
             }
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.assign_equipment_to_person("eq-123", "person-456")
+        result = await equipment_manager.assign_equipment_to_person("eq-123", "person-456")
         
         assert result is True
     
-    @pytest.mark.asyncio
-    async def test_get_equipment_by_project(self):
+    async def test_get_equipment_by_project(self, mock_client, equipment_manager):
         """Test getting equipment assigned to a specific project."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -394,19 +353,16 @@ class TestEquipmentManager:
                     "assignedProjectId": "proj-123"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.get_equipment_by_project("proj-123")
+        result = await equipment_manager.get_equipment_by_project("proj-123")
         
         assert len(result) == 1
         assert result[0]["assignedProjectId"] == "proj-123"
     
-    @pytest.mark.asyncio
-    async def test_get_equipment_by_person(self):
+    async def test_get_equipment_by_person(self, mock_client, equipment_manager):
         """Test getting equipment assigned to a specific person."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
+        mock_client.query.return_value = {
             "equipment": [
                 {
                     "id": "eq-123",
@@ -414,10 +370,41 @@ class TestEquipmentManager:
                     "assignedPersonId": "person-123"
                 }
             ]
-        })
+        }
         
-        manager = EquipmentManager(mock_client)
-        result = await manager.get_equipment_by_person("person-123")
+        result = await equipment_manager.get_equipment_by_person("person-123")
         
         assert len(result) == 1
         assert result[0]["assignedPersonId"] == "person-123"
+    
+    async def test_bulk_fetch_sends_all_queries_in_one_batch(self, mock_client, equipment_manager):
+        """Test that bulk_fetch batches the reads and fetches statistics alongside them."""
+        mock_client.query_many.return_value = [
+            {"equipments": {"nodes": [{"ident": "eq-1"}, {"ident": "eq-2"}]}},
+            {"equipment": [{"id": "eq-1", "assignedProjectId": "project-1"}]},
+            {"equipment": [{"id": "eq-2", "assignedPersonId": "person-1"}]}
+        ]
+        mock_client.query.return_value = {"equipmentStats": {"totalEquipment": 2}}
+        
+        result = await equipment_manager.bulk_fetch(project_ids=["project-1"], person_ids=["person-1"])
+        
+        mock_client.query_many.assert_awaited_once()
+        assert len(mock_client.query_many.call_args[0][0]) == 3
+        mock_client.query.assert_awaited_once()
+        assert len(result["equipment"]) == 2
+        assert result["statistics"]["totalEquipment"] == 2
+        assert result["byProject"]["project-1"][0]["id"] == "eq-1"
+        assert result["byPerson"]["person-1"][0]["id"] == "eq-2"
+    
+    async def test_bulk_fetch_counts_statistics_without_aggregate(self, mock_client, equipment_manager):
+        """Test that bulk_fetch still succeeds when the API has no equipmentStats."""
+        mock_client.query_many.return_value = [{"equipments": {"nodes": [{"ident": "eq-1"}]}}]
+        mock_client.query.side_effect = [
+            Exception('Cannot query field "equipmentStats" on type "Query"'),
+            {"equipments": {"totalCount": 1}}
+        ]
+        
+        result = await equipment_manager.bulk_fetch()
+        
+        assert result["equipment"] == [{"ident": "eq-1"}]
+        assert result["statistics"]["totalEquipment"] == 1
@@ -3,16 +3,14 @@ Unit tests for GraphQL client library.
 
 Follows Article III: Test-First Imperative - Tests written before implementation.
 """
+import asyncio
+import json
 import pytest
 import httpx
-from unittest.mock import Mock, patch
-import sys
-from pathlib import Path
 
-# Add libraries to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "libraries"))
+from graphql_client import GraphQLClient, GraphQLClientError, AuthenticationError, NetworkError, DataError, run_async
 
-from graphql_client import GraphQLClient, GraphQLClientError, AuthenticationError, NetworkError, DataError
+pytestmark = pytest.mark.unit
 
 
 class TestGraphQLClient:
@@ -52,122 +50,269 @@ class TestGraphQLClient:
         expected_encoded = base64.b64encode(b"custom-user:test-token").decode('utf-8')
         assert client.headers["Authorization"] == f"Basic {expected_encoded}"
     
-    @pytest.mark.asyncio
-    async def test_query_success(self):
+    async def test_query_success(self, server, client):
         """Test successful GraphQL query execution."""
-        client = GraphQLClient("https://test.api.com", "test-token")
-        
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {"test": "success"},
-            "errors": None
-        }
+        server.respond({"data": {"test": "success"}, "errors": None})
         
-        with patch("httpx.AsyncClient.post", return_value=mock_response):
-            result = await client.query("query { test }")
-            assert result == {"test": "success"}
+        result = await client.query("query { test }")
+        assert result == {"test": "success"}
     
-    @pytest.mark.asyncio
-    async def test_query_with_variables(self):
+    async def test_query_with_variables(self, server, client):
         """Test GraphQL query with variables."""
-        client = GraphQLClient("https://test.api.com", "test-token")
+        server.respond({"data": {"project": {"id": "123", "name": "Test Project"}}, "errors": None})
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {"project": {"id": "123", "name": "Test Project"}},
-            "errors": None
-        }
-        
-        with patch("httpx.AsyncClient.post", return_value=mock_response):
-            result = await client.query(
-                "query GetProject($id: ID!) { project(id: $id) { id name } }",
-                {"id": "123"}
-            )
-            assert result["project"]["id"] == "123"
-            assert result["project"]["name"] == "Test Project"
+        result = await client.query(
+            "query GetProject($id: ID!) { project(id: $id) { id name } }",
+            {"id": "123"}
+        )
+        assert result["project"]["id"] == "123"
+        assert result["project"]["name"] == "Test Project"
     
-    @pytest.mark.asyncio
-    async def test_query_authentication_error(self):
-        """Test query with authentication error."""
-        client = GraphQLClient("https://test.api.com", "test-token")
+    async def test_query_request_body(self, server, client):
+        """Test that the encoded request body carries query and variables."""
+        server.respond({"data": {"test": "success"}})
         
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {
-            "errors": [{"message": "Unauthorized"}]
+        await client.query("query GetProject($id: ID!) { project(id: $id) { id } }", {"id": "123"})
+        
+        assert server.payload() == {
+            "query": "query GetProject($id: ID!) { project(id: $id) { id } }",
+            "variables": {"id": "123"}
         }
+    
+    async def test_query_authentication_error(self, server, client):
+        """Test query with authentication error."""
+        server.respond({"errors": [{"message": "Unauthorized"}]}, status_code=401)
         
-        with patch("httpx.AsyncClient.post", return_value=mock_response):
-            with pytest.raises(AuthenticationError):
-                await client.query("query { test }")
+        with pytest.raises(AuthenticationError):
+            await client.query("query { test }")
     
-    @pytest.mark.asyncio
-    async def test_query_network_error(self):
+    async def test_query_network_error(self, server, client):
         """Test query with network error."""
-        client = GraphQLClient("https://test.api.com", "test-token")
+        server.fail(httpx.NetworkError("Network error"))
         
-        with patch("httpx.AsyncClient.post", side_effect=httpx.NetworkError("Network error")):
-            with pytest.raises(NetworkError):
-                await client.query("query { test }")
+        with pytest.raises(NetworkError):
+            await client.query("query { test }")
     
-    @pytest.mark.asyncio
-    async def test_query_graphql_errors(self):
+    async def test_query_graphql_errors(self, server, client):
         """Test query with GraphQL errors in response."""
-        client = GraphQLClient("https://test.api.com", "test-token")
+        server.respond({"data": None, "errors": [{"message": "Field 'invalid' doesn't exist"}]})
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        with pytest.raises(DataError):
+            await client.query("query { invalid }")
+    
+    async def test_query_graphql_errors_keep_error_codes(self, server, client):
+        """Test that GraphQL error codes are exposed on DataError."""
+        server.respond({
             "data": None,
-            "errors": [{"message": "Field 'invalid' doesn't exist"}]
-        }
+            "errors": [{"message": "No such project", "extensions": {"code": "NOT_FOUND"}}]
+        })
         
-        with patch("httpx.AsyncClient.post", return_value=mock_response):
-            with pytest.raises(DataError):
-                await client.query("query { invalid }")
+        with pytest.raises(DataError) as exc_info:
+            await client.query("query { project(ident: \"x\") { ident } }")
+        
+        assert exc_info.value.error_codes == ["NOT_FOUND"]
     
-    @pytest.mark.asyncio
-    async def test_mutation_success(self):
+    async def test_mutation_success(self, server, client):
         """Test successful GraphQL mutation execution."""
-        client = GraphQLClient("https://test.api.com", "test-token")
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {"createProject": {"id": "123", "name": "New Project"}},
-            "errors": None
-        }
+        server.respond({"data": {"createProject": {"id": "123", "name": "New Project"}}, "errors": None})
         
-        with patch("httpx.AsyncClient.post", return_value=mock_response):
-            result = await client.mutation(
-                "mutation CreateProject($name: String!) { createProject(name: $name) { id name } }",
-                {"name": "New Project"}
-            )
-            assert result["createProject"]["id"] == "123"
-            assert result["createProject"]["name"] == "New Project"
+        result = await client.mutation(
+            "mutation CreateProject($name: String!) { createProject(name: $name) { id name } }",
+            {"name": "New Project"}
+        )
+        assert result["createProject"]["id"] == "123"
+        assert result["createProject"]["name"] == "New Project"
     
-    @pytest.mark.asyncio
-    async def test_retry_logic_on_transient_error(self):
+    async def test_retry_logic_on_transient_error(self, server, client):
         """Test retry logic on transient network errors."""
-        client = GraphQLClient("https://test.api.com", "test-token")
-        
         # First call fails, second succeeds
-        mock_response_fail = Mock()
-        mock_response_fail.status_code = 500
-        
-        mock_response_success = Mock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {
-            "data": {"test": "success"},
-            "errors": None
-        }
+        server.respond({}, status_code=500)
+        server.respond({"data": {"test": "success"}, "errors": None})
+        
+        result = await client.query("query { test }")
+        assert result == {"test": "success"}
+    
+    async def test_retries_only_transient_errors(self, server, client):
+        """Test that server errors are retried up to the limit and client errors are not."""
+        server.respond({}, status_code=503)
+        
+        with pytest.raises(NetworkError):
+            await client.query("query { test }")
+        assert len(server.requests) == 3
+        
+        server.responses = [httpx.Response(400, json={})]
+        with pytest.raises(NetworkError):
+            await client.query("query { test }", {"n": 2})
+        assert len(server.requests) == 4
+    
+    async def test_persisted_query_sends_hash_after_registration(self, server):
+        """Test that a persisted query is sent as hash only once registered."""
+        client = GraphQLClient(
+            "https://test.api.com", "test-token", persisted_queries=True, transport=server.transport
+        )
+        server.respond({"data": {"test": "success"}})
+        
+        await client.query("query { test }")
+        await client.query("query { test }")
+        
+        first_payload = server.payload(0)
+        second_payload = server.payload(1)
+        assert first_payload["query"] == "query { test }"
+        assert "query" not in second_payload
+        assert second_payload["extensions"] == first_payload["extensions"]
+        assert len(second_payload["extensions"]["persistedQuery"]["sha256Hash"]) == 64
+    
+    async def test_persisted_query_resends_full_query_on_miss(self, server):
+        """Test fallback to the full query when the server forgot the hash."""
+        client = GraphQLClient(
+            "https://test.api.com", "test-token", persisted_queries=True, transport=server.transport
+        )
+        server.respond({"data": {"test": "success"}})
+        server.respond({
+            "errors": [{
+                "message": "PersistedQueryNotFound",
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}
+            }]
+        })
+        server.respond({"data": {"test": "success"}})
+        
+        await client.query("query { test }")
+        result = await client.query("query { test }")
         
-        with patch("httpx.AsyncClient.post", side_effect=[mock_response_fail, mock_response_success]):
-            result = await client.query("query { test }")
-            assert result == {"test": "success"}
+        assert result == {"test": "success"}
+        assert server.payload(2)["query"] == "query { test }"
+    
+    async def test_persisted_mutation_sends_hash_after_registration(self, server):
+        """Test that mutations are persisted like queries once registered."""
+        client = GraphQLClient(
+            "https://test.api.com", "test-token", persisted_queries=True, transport=server.transport
+        )
+        server.respond({"data": {"createProject": {"id": "123"}}})
+        
+        await client.mutation("mutation { createProject { id } }")
+        await client.mutation("mutation { createProject { id } }")
+        
+        assert server.payload(0)["query"] == "mutation { createProject { id } }"
+        assert "query" not in server.payload(1)
+        assert server.payload(1)["extensions"] == server.payload(0)["extensions"]
+    
+    async def test_http_client_reused_until_closed(self, server):
+        """Test that queries share one pooled HTTP client until aclose()."""
+        server.respond({"data": {"test": "success"}})
+        
+        async with GraphQLClient("https://test.api.com", "test-token", transport=server.transport) as client:
+            await client.query("query { test }")
+            http = client._http
+            await client.query("query { test }", {"n": 2})
+            
+            assert client._http is http
+        
+        assert client._http is None
+        assert http.is_closed
+    
+    async def test_max_concurrency_limits_requests_in_flight(self):
+        """Test that concurrent queries beyond the limit wait for a free slot."""
+        in_flight = 0
+        peak = 0
+        
+        async def slow_handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"data": {"test": "success"}})
+        
+        client = GraphQLClient(
+            "https://test.api.com", "test-token", max_concurrency=2,
+            transport=httpx.MockTransport(slow_handler)
+        )
+        results = await asyncio.gather(*(client.query("query { test }", {"n": n}) for n in range(5)))
+        
+        assert results == [{"test": "success"}] * 5
+        assert peak == 2
+    
+    async def test_identical_concurrent_queries_share_one_request(self, server, client):
+        """Test that identical in-flight queries are coalesced, mutations are not."""
+        server.delay = 0.01
+        server.respond({"data": {"test": "success"}})
+        
+        results = await asyncio.gather(
+            client.query("query { test }"),
+            client.query("query { test }"),
+            client.query("query { test }", {"id": "1"})
+        )
+        assert results == [{"test": "success"}] * 3
+        assert len(server.requests) == 2
+        
+        await asyncio.gather(
+            client.mutation("mutation { test }"),
+            client.mutation("mutation { test }")
+        )
+        assert len(server.requests) == 4
+    
+    async def test_cache_ttl_reuses_query_results_until_mutation(self, server):
+        """Test that cached query results are served until a mutation runs."""
+        client = GraphQLClient(
+            "https://test.api.com", "test-token", cache_ttl=30, transport=server.transport
+        )
+        server.respond({"data": {"test": "success"}})
+        
+        assert await client.query("query { test }") == {"test": "success"}
+        assert await client.query("query { test }") == {"test": "success"}
+        assert len(server.requests) == 1
+        
+        await client.mutation("mutation { test }")
+        await client.query("query { test }")
+        assert len(server.requests) == 3
+    
+    async def test_cached_and_shared_results_are_independent_copies(self, server):
+        """Test that editing nested rows of one result doesn't change cached or shared results."""
+        client = GraphQLClient(
+            "https://test.api.com", "test-token", cache_ttl=30, transport=server.transport
+        )
+        server.delay = 0.01
+        server.respond({"data": {"persons": {"nodes": [{"ident": "person-1"}]}}})
+        
+        first, second = await asyncio.gather(
+            client.query("query { persons { nodes { ident } } }"),
+            client.query("query { persons { nodes { ident } } }")
+        )
+        first["persons"]["nodes"][0]["formattedName"] = "John Doe"
+        cached = await client.query("query { persons { nodes { ident } } }")
+        
+        assert len(server.requests) == 1
+        assert second["persons"]["nodes"] == [{"ident": "person-1"}]
+        assert cached["persons"]["nodes"] == [{"ident": "person-1"}]
+    
+    async def test_mutation_evicts_only_affected_root_fields(self, server):
+        """Test that a known mutation keeps cached results of unrelated root fields."""
+        client = GraphQLClient(
+            "https://test.api.com", "test-token", cache_ttl=30, transport=server.transport
+        )
+        server.respond({"data": {"result": "success"}})
+        
+        await client.query("query { equipments { nodes { ident } } }")
+        await client.query("query { projects { totalCount } }")
+        await client.mutation("mutation Create($input: CreateEquipmentInput!) { createEquipment(input: $input) { id } }")
+        assert len(server.requests) == 3
+        
+        await client.query("query { projects { totalCount } }")
+        assert len(server.requests) == 3
+        
+        await client.query("query { equipments { nodes { ident } } }")
+        assert len(server.requests) == 4
+    
+    async def test_query_many_returns_results_in_order(self, client):
+        """Test that query_many runs queries concurrently and keeps their order."""
+        async def echo_handler(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"data": json.loads(request.content)["variables"]})
+        
+        client._transport = httpx.MockTransport(echo_handler)
+        results = await client.query_many([("query { test }", {"n": n}) for n in range(3)])
+        
+        assert results == [{"n": 0}, {"n": 1}, {"n": 2}]
     
     def test_headers_include_content_type(self):
         """Test that headers include proper content type."""
@@ -179,3 +324,22 @@ class TestGraphQLClient:
         client = GraphQLClient("https://test.api.com", "test-token")
         assert "Authorization" in client.headers
         assert client.headers["Authorization"].startswith("Basic ")
+        with pytest.raises(TypeError):
+            client.headers["Authorization"] = "Bearer other"
+    
+    async def test_pooled_client_carries_auth_headers(self, server, client):
+        """Test that requests carry the auth headers set on the pooled client."""
+        server.respond({"data": {"test": "success"}})
+        
+        await client.query("query { test }")
+        
+        assert server.requests[0].headers["Authorization"] == client.headers["Authorization"]
+        assert client._http.timeout.read == 30.0
+    
+    def test_run_async_returns_the_coroutine_result(self):
+        """Test that run_async runs a coroutine in a fresh loop and returns its result."""
+        async def answer():
+            await asyncio.sleep(0)
+            return 42
+        
+        assert run_async(answer()) == 42
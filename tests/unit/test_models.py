@@ -6,14 +6,39 @@ Follows Article III: Test-First Imperative - Tests written before implementation
 import pytest
 from datetime import datetime, date
 from decimal import Decimal
-import sys
-from pathlib import Path
-
-# Add libraries to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "libraries"))
 
 from models import Project, StaffTime, Person, Equipment, Ticket, Planning, ModelFactory
 
+pytestmark = pytest.mark.unit
+
+# (model, kwargs missing one required field) - constructing must fail validation
+MODEL_VALIDATION_CASES = [
+    pytest.param(Project, {"name": "Test Project"}, id="project-without-id"),
+    pytest.param(Project, {"id": "proj-123"}, id="project-without-name"),
+    pytest.param(StaffTime, {"id": "time-123", "person_id": "person-456", "start_time": datetime(2024, 1, 1, 9)},
+                 id="staff-time-without-project-id"),
+    pytest.param(StaffTime, {"id": "time-123", "project_id": "proj-123", "start_time": datetime(2024, 1, 1, 9)},
+                 id="staff-time-without-person-id"),
+    pytest.param(Equipment, {"name": "Test Equipment"}, id="equipment-without-id"),
+    pytest.param(Ticket, {"title": "Test Ticket"}, id="ticket-without-id"),
+]
+
+# (factory method, expected model, kwargs) - the factory must return that model with the given fields
+FACTORY_CASES = [
+    pytest.param(ModelFactory.create_project, Project,
+                 {"id": "factory-proj-123", "name": "Factory Project"}, id="project"),
+    pytest.param(ModelFactory.create_staff_time, StaffTime,
+                 {"id": "factory-time-123", "project_id": "proj-123", "person_id": "person-456"}, id="staff-time"),
+    pytest.param(ModelFactory.create_person, Person,
+                 {"id": "factory-person-123", "name": "Factory Person"}, id="person"),
+    pytest.param(ModelFactory.create_equipment, Equipment,
+                 {"id": "factory-eq-123", "name": "Factory Equipment"}, id="equipment"),
+    pytest.param(ModelFactory.create_ticket, Ticket,
+                 {"id": "factory-ticket-123", "title": "Factory Ticket"}, id="ticket"),
+    pytest.param(ModelFactory.create_planning, Planning,
+                 {"id": "factory-plan-123", "project_id": "proj-123", "milestone": "Factory Milestone"}, id="planning"),
+]
+
 
 class TestProject:
     """Test cases for Project model."""
@@ -42,16 +67,6 @@ class TestProject:
         assert project.name == "Minimal Project"
         assert project.status is None
         assert project.start_date is None
-    
-    def test_project_validation_fails_without_id(self):
-        """Test that project creation fails without ID."""
-        with pytest.raises(ValueError):
-            Project(name="Test Project")
-    
-    def test_project_validation_fails_without_name(self):
-        """Test that project creation fails without name."""
-        with pytest.raises(ValueError):
-            Project(id="proj-123")
 
 
 class TestStaffTime:
@@ -74,25 +89,6 @@ class TestStaffTime:
         assert staff_time.project_id == "proj-123"
         assert staff_time.person_id == "person-456"
         assert staff_time.duration_hours == 8.0
-    
-    def test_staff_time_validation_requires_project_id(self):
-        """Test that staff time requires project ID."""
-        with pytest.raises(ValueError):
-            StaffTime(
-                id="time-123",
-                person_id="person-456",
-                start_time=datetime.now()
-            )
-    
-    def test_staff_time_validation_requires_person_id(self):
-        """Test that staff time requires person ID."""
-        with pytest.raises(ValueError):
-            StaffTime(
-                id="time-123",
-                project_id="proj-123",
-                start_time=datetime.now()
-            )
-
 
 class TestPerson:
     """Test cases for Person model."""
@@ -138,11 +134,6 @@ class TestEquipment:
         assert equipment.type == "Heavy Machinery"
         assert equipment.location == "Site A"
         assert equipment.status == "operational"
-    
-    def test_equipment_validation_requires_id(self):
-        """Test that equipment requires ID."""
-        with pytest.raises(ValueError):
-            Equipment(name="Test Equipment")
 
 
 class TestTicket:
@@ -162,11 +153,6 @@ class TestTicket:
         assert ticket.title == "Safety Issue"
         assert ticket.status == "open"
         assert ticket.priority == "high"
-    
-    def test_ticket_validation_requires_id(self):
-        """Test that ticket requires ID."""
-        with pytest.raises(ValueError):
-            Ticket(title="Test Ticket")
 
 
 class TestPlanning:
@@ -188,72 +174,26 @@ class TestPlanning:
         assert planning.status == "completed"
 
 
+class TestModelValidation:
+    """Test cases for required model fields."""
+    
+    @pytest.mark.parametrize("model, kwargs", MODEL_VALIDATION_CASES)
+    def test_model_requires_field(self, model, kwargs):
+        """Test that model creation fails when a required field is missing."""
+        with pytest.raises(ValueError):
+            model(**kwargs)
+
+
 class TestModelFactory:
     """Test cases for ModelFactory."""
     
-    def test_create_project(self):
-        """Test creating project using factory."""
-        project = ModelFactory.create_project(
-            id="factory-proj-123",
-            name="Factory Project"
-        )
-        assert isinstance(project, Project)
-        assert project.id == "factory-proj-123"
-        assert project.name == "Factory Project"
-    
-    def test_create_staff_time(self):
-        """Test creating staff time using factory."""
-        staff_time = ModelFactory.create_staff_time(
-            id="factory-time-123",
-            project_id="proj-123",
-            person_id="person-456"
-        )
-        assert isinstance(staff_time, StaffTime)
-        assert staff_time.id == "factory-time-123"
-        assert staff_time.project_id == "proj-123"
-        assert staff_time.person_id == "person-456"
-    
-    def test_create_person(self):
-        """Test creating person using factory."""
-        person = ModelFactory.create_person(
-            id="factory-person-123",
-            name="Factory Person"
-        )
-        assert isinstance(person, Person)
-        assert person.id == "factory-person-123"
-        assert person.name == "Factory Person"
-    
-    def test_create_equipment(self):
-        """Test creating equipment using factory."""
-        equipment = ModelFactory.create_equipment(
-            id="factory-eq-123",
-            name="Factory Equipment"
-        )
-        assert isinstance(equipment, Equipment)
-        assert equipment.id == "factory-eq-123"
-        assert equipment.name == "Factory Equipment"
-    
-    def test_create_ticket(self):
-        """Test creating ticket using factory."""
-        ticket = ModelFactory.create_ticket(
-            id="factory-ticket-123",
-            title="Factory Ticket"
-        )
-        assert isinstance(ticket, Ticket)
-        assert ticket.id == "factory-ticket-123"
-        assert ticket.title == "Factory Ticket"
-    
-    def test_create_planning(self):
-        """Test creating planning using factory."""
-        planning = ModelFactory.create_planning(
-            id="factory-plan-123",
-            project_id="proj-123",
-            milestone="Factory Milestone"
-        )
-        assert isinstance(planning, Planning)
-        assert planning.id == "factory-plan-123"
-        assert planning.project_id == "proj-123"
-        assert planning.milestone == "Factory Milestone"
+    @pytest.mark.parametrize("factory, model, kwargs", FACTORY_CASES)
+    def test_factory_creates_model(self, factory, model, kwargs):
+        """Test creating each model using the factory."""
+        instance = factory(**kwargs)
+        assert isinstance(instance, model)
+        for field, value in kwargs.items():
+            assert getattr(instance, field) == value
 
 
 class TestModelSerialization:
@@ -261,7 +201,8 @@ class TestModelSerialization:
     
     def test_project_serialization(self):
         """Test project model serialization."""
-        project = Project(
+        # Only model_dump is under test here, so skip validation on construction
+        project = Project.model_construct(
             id="serialize-123",
             name="Serialization Test",
             status="active"
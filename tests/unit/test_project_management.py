@@ -4,314 +4,356 @@ Unit tests for project management library.
 Follows Article III: Test-First Imperative - Tests written before implementation.
 """
 import pytest
-from unittest.mock import Mock, AsyncMock
-import sys
-from pathlib import Path
 
-# Add libraries to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "libraries"))
+from project_management import ProjectManagementError, ProjectNotFoundError, InvalidProjectDataError
+from graphql_client import DataError
 
-from project_management import ProjectManager, ProjectManagementError, ProjectNotFoundError, InvalidProjectDataError
+pytestmark = pytest.mark.unit
+
+# Canned API responses; the manager only reads them, so tests share one copy
+PROJECTS_RESPONSE = {
+    "projects": {
+        "nodes": [
+            {"ident": "proj-123", "name": "Test Project 1"},
+            {"ident": "proj-456", "name": "Test Project 2"}
+        ],
+        "pageInfo": {"hasNextPage": False, "endCursor": None}
+    }
+}
+
+ACTIVE_PROJECTS_RESPONSE = {
+    "projects": {
+        "nodes": [
+            {"ident": "proj-123", "name": "Active Project"}
+        ],
+        "pageInfo": {"hasNextPage": False, "endCursor": None}
+    }
+}
+
+EMPTY_PROJECTS_RESPONSE = {"projects": {"nodes": [], "pageInfo": {"hasNextPage": False, "endCursor": None}}}
+
+PROJECT_DETAILS_RESPONSE = {
+    "project": {
+        "id": "proj-123",
+        "name": "Test Project",
+        "status": "active",
+        "startDate": "2024-01-01",
+        "endDate": "2024-12-31",
+        "description": "A test construction project",
+        "clientName": "Test Client Inc.",
+        "budget": 1000000.0,
+        "location": "123 Test Street"
+    }
+}
+
+OFFICE_PROJECTS_RESPONSE = {
+    "projects": {
+        "nodes": [
+            {"ident": "proj-123", "name": "Office Building Project"}
+        ],
+        "pageInfo": {"hasNextPage": False, "endCursor": None}
+    }
+}
+
+CLIENT_PROJECTS_RESPONSE = {
+    "projects": {
+        "nodes": [
+            {"ident": "proj-456", "name": "ABC Corporation Headquarters"}
+        ],
+        "pageInfo": {"hasNextPage": False, "endCursor": None}
+    }
+}
+
+DATE_RANGE_PROJECTS_RESPONSE = {
+    "projects": {
+        "nodes": [
+            {"ident": "proj-123", "name": "Project in Range"}
+        ],
+        "pageInfo": {"hasNextPage": False, "endCursor": None}
+    }
+}
+
+PROJECT_STATS_RESPONSE = {"projects": {"totalCount": 10}}
+
+CREATED_PROJECT_RESPONSE = {
+    "createProject": {
+        "id": "proj-new-123",
+        "name": "New Project",
+        "status": "planning",
+        "startDate": "2024-01-01",
+        "endDate": "2024-12-31"
+    }
+}
+
+UPDATED_PROJECT_RESPONSE = {
+    "updateProject": {
+        "id": "proj-123",
+        "name": "Updated Project Name",
+        "status": "active"
+    }
+}
 
 
 class TestProjectManager:
     """Test cases for ProjectManager class."""
     
-    def test_init_with_valid_client(self):
+    def test_init_with_valid_client(self, mock_client, project_manager):
         """Test ProjectManager initialization with valid GraphQL client."""
-        mock_client = Mock()
-        manager = ProjectManager(mock_client)
-        assert manager.client == mock_client
-    
-    @pytest.mark.asyncio
-    async def test_list_projects_success(self):
-        """Test successful project listing."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "projects": [
-                {
-                    "id": "proj-123",
-                    "name": "Test Project 1",
-                    "status": "active",
-                    "startDate": "2024-01-01",
-                    "endDate": "2024-12-31"
-                },
-                {
-                    "id": "proj-456",
-                    "name": "Test Project 2",
-                    "status": "completed",
-                    "startDate": "2023-01-01",
-                    "endDate": "2023-12-31"
-                }
-            ]
-        })
-        
-        manager = ProjectManager(mock_client)
-        result = await manager.list_projects()
-        
-        assert len(result) == 2
-        assert result[0]["id"] == "proj-123"
-        assert result[0]["name"] == "Test Project 1"
-        assert result[1]["id"] == "proj-456"
-        assert result[1]["status"] == "completed"
-    
-    @pytest.mark.asyncio
-    async def test_list_projects_with_filters(self):
-        """Test project listing with status filter."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "projects": [
-                {
-                    "id": "proj-123",
-                    "name": "Active Project",
-                    "status": "active"
-                }
-            ]
-        })
-        
-        manager = ProjectManager(mock_client)
-        result = await manager.list_projects(status="active")
-        
-        assert len(result) == 1
-        assert result[0]["status"] == "active"
+        assert project_manager.client == mock_client
     
-    @pytest.mark.asyncio
-    async def test_list_projects_empty(self):
-        """Test project listing when no projects exist."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"projects": []})
-        
-        manager = ProjectManager(mock_client)
-        result = await manager.list_projects()
-        
-        assert result == []
+    @pytest.mark.parametrize("method, kwargs, response, expected_count, expected_fields", [
+        pytest.param(
+            "list_projects", {}, PROJECTS_RESPONSE, 2,
+            [(0, "ident", "proj-123"), (0, "name", "Test Project 1"), (1, "ident", "proj-456"), (1, "name", "Test Project 2")],
+            id="list"
+        ),
+        pytest.param("list_projects", {"status": "active"}, ACTIVE_PROJECTS_RESPONSE, 1, [(0, "name", "Active Project")], id="list-by-status"),
+        pytest.param("list_projects", {}, EMPTY_PROJECTS_RESPONSE, 0, [], id="list-empty"),
+        pytest.param(
+            "search_projects", {"query": "Office Building"}, OFFICE_PROJECTS_RESPONSE, 1,
+            [(0, "name", "Office Building Project")],
+            id="search-by-name"
+        ),
+        pytest.param(
+            "search_projects", {"query": "ABC Corporation"}, CLIENT_PROJECTS_RESPONSE, 1,
+            [(0, "ident", "proj-456")],
+            id="search-by-client"
+        ),
+        pytest.param("search_projects", {"query": "NonExistent"}, EMPTY_PROJECTS_RESPONSE, 0, [], id="search-empty"),
+        pytest.param("get_projects_by_status", {"status": "active"}, ACTIVE_PROJECTS_RESPONSE, 1, [(0, "name", "Active Project")], id="by-status"),
+        pytest.param(
+            "get_projects_by_date_range", {"start_date": "2024-05-01", "end_date": "2024-09-30"}, DATE_RANGE_PROJECTS_RESPONSE, 1,
+            [(0, "ident", "proj-123")],
+            id="by-date-range"
+        ),
+    ])
+    async def test_project_listing(self, mock_client, project_manager, method, kwargs, response, expected_count, expected_fields):
+        """Test that each project listing returns the projects from the response."""
+        mock_client.query.return_value = response
+        
+        result = await getattr(project_manager, method)(**kwargs)
+        
+        assert len(result) == expected_count
+        for index, field, value in expected_fields:
+            assert result[index][field] == value
     
-    @pytest.mark.asyncio
-    async def test_get_project_details_success(self):
+    async def test_get_project_details_success(self, mock_client, project_manager):
         """Test successful project details retrieval."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "project": {
-                "id": "proj-123",
-                "name": "Test Project",
-                "status": "active",
-                "startDate": "2024-01-01",
-                "endDate": "2024-12-31",
-                "description": "A test construction project",
-                "clientName": "Test Client Inc.",
-                "budget": 1000000.0,
-                "location": "123 Test Street"
-            }
-        })
+        mock_client.query.return_value = PROJECT_DETAILS_RESPONSE
         
-        manager = ProjectManager(mock_client)
-        result = await manager.get_project_details("proj-123")
+        result = await project_manager.get_project_details("proj-123")
         
         assert result["id"] == "proj-123"
         assert result["name"] == "Test Project"
         assert result["status"] == "active"
         assert result["budget"] == 1000000.0
     
-    @pytest.mark.asyncio
-    async def test_get_project_details_not_found(self):
+    async def test_get_project_details_not_found(self, mock_client, project_manager):
         """Test project details retrieval when project doesn't exist."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"project": None})
-        
-        manager = ProjectManager(mock_client)
+        mock_client.query.return_value = {"project": None}
         
         with pytest.raises(ProjectNotFoundError):
-            await manager.get_project_details("invalid-proj")
+            await project_manager.get_project_details("invalid-proj")
     
-    @pytest.mark.asyncio
-    async def test_search_projects_by_name(self):
-        """Test searching projects by name."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "projects": [
-                {
-                    "id": "proj-123",
-                    "name": "Office Building Project",
-                    "status": "active"
-                }
-            ]
-        })
+    async def test_get_project_statistics(self, mock_client, project_manager):
+        """Test getting project statistics."""
+        mock_client.query.return_value = PROJECT_STATS_RESPONSE
         
-        manager = ProjectManager(mock_client)
-        result = await manager.search_projects(query="Office Building")
+        result = await project_manager.get_project_statistics()
         
-        assert len(result) == 1
-        assert "Office Building" in result[0]["name"]
+        assert result["totalProjects"] == 10
+        assert result["activeProjects"] == 0
+        assert result["totalBudget"] == 0
     
-    @pytest.mark.asyncio
-    async def test_search_projects_by_client(self):
-        """Test searching projects by client name."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "projects": [
-                {
-                    "id": "proj-456",
-                    "name": "Client Project",
-                    "clientName": "ABC Corporation",
-                    "status": "active"
-                }
-            ]
-        })
-        
-        manager = ProjectManager(mock_client)
-        result = await manager.search_projects(query="ABC Corporation")
-        
-        assert len(result) == 1
-        assert result[0]["clientName"] == "ABC Corporation"
+    @pytest.mark.parametrize("project_data, response, error, expected", [
+        pytest.param(
+            {
+                "name": "New Project",
+                "status": "planning",
+                "startDate": "2024-01-01",
+                "endDate": "2024-12-31",
+                "description": "A new construction project"
+            },
+            CREATED_PROJECT_RESPONSE,
+            None,
+            {"id": "proj-new-123", "name": "New Project", "status": "planning"},
+            id="success"
+        ),
+        pytest.param(
+            {"name": ""},  # Invalid: empty name
+            None,
+            Exception("Invalid project data"),
+            InvalidProjectDataError,
+            id="invalid-data"
+        ),
+    ])
+    async def test_create_project(self, mock_client, project_manager, project_data, response, error, expected):
+        """Test project creation returning the new project or raising on failure."""
+        mock_client.mutation.return_value = response
+        mock_client.mutation.side_effect = error
+        
+        if isinstance(expected, type) and issubclass(expected, Exception):
+            with pytest.raises(expected):
+                await project_manager.create_project(project_data)
+        else:
+            result = await project_manager.create_project(project_data)
+            assert {field: result[field] for field in expected} == expected
     
-    @pytest.mark.asyncio
-    async def test_search_projects_empty(self):
-        """Test searching projects when no matches found."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"projects": []})
-        
-        manager = ProjectManager(mock_client)
-        result = await manager.search_projects(query="NonExistent")
-        
-        assert result == []
+    @pytest.mark.parametrize("project_id, response, error, expected", [
+        pytest.param(
+            "proj-123",
+            UPDATED_PROJECT_RESPONSE,
+            None,
+            {"id": "proj-123", "name": "Updated Project Name", "status": "active"},
+            id="success"
+        ),
+        pytest.param(
+            "invalid-proj",
+            None,
+            Exception("Project not found"),
+            ProjectNotFoundError,
+            id="not-found"
+        ),
+    ])
+    async def test_update_project(self, mock_client, project_manager, project_id, response, error, expected):
+        """Test project update returning the changed project or raising on failure."""
+        mock_client.mutation.return_value = response
+        mock_client.mutation.side_effect = error
+        update_data = {"name": "Updated Project Name", "status": "active"}
+        
+        if isinstance(expected, type) and issubclass(expected, Exception):
+            with pytest.raises(expected):
+                await project_manager.update_project(project_id, update_data)
+        else:
+            result = await project_manager.update_project(project_id, update_data)
+            assert {field: result[field] for field in expected} == expected
     
-    @pytest.mark.asyncio
-    async def test_get_projects_by_status(self):
-        """Test getting projects filtered by status."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "projects": [
-                {
-                    "id": "proj-123",
-                    "name": "Active Project",
-                    "status": "active"
+    async def test_iter_projects_follows_cursor(self, mock_client, project_manager):
+        """Test streaming projects across multiple cursor pages."""
+        mock_client.query.side_effect = [
+            {
+                "projects": {
+                    "nodes": [{"ident": "proj-1", "name": "Project 1"}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"}
                 }
-            ]
-        })
-        
-        manager = ProjectManager(mock_client)
-        result = await manager.get_projects_by_status("active")
-        
-        assert len(result) == 1
-        assert result[0]["status"] == "active"
-    
-    @pytest.mark.asyncio
-    async def test_get_projects_by_date_range(self):
-        """Test getting projects filtered by date range."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "projects": [
-                {
-                    "id": "proj-123",
-                    "name": "Project in Range",
-                    "startDate": "2024-06-01",
-                    "endDate": "2024-08-31"
+            },
+            {
+                "projects": {
+                    "nodes": [{"ident": "proj-2", "name": "Project 2"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": "cursor-2"}
                 }
-            ]
-        })
+            }
+        ]
         
-        manager = ProjectManager(mock_client)
-        result = await manager.get_projects_by_date_range("2024-05-01", "2024-09-30")
+        result = [project async for project in project_manager.iter_projects(page_size=1)]
         
-        assert len(result) == 1
-        assert result[0]["id"] == "proj-123"
+        assert [p["ident"] for p in result] == ["proj-1", "proj-2"]
+        assert mock_client.query.call_count == 2
+        assert mock_client.query.call_args_list[1].args[1] == {"first": 1, "after": "cursor-1"}
     
-    @pytest.mark.asyncio
-    async def test_get_project_statistics(self):
-        """Test getting project statistics."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "projectStats": {
-                "totalProjects": 10,
-                "activeProjects": 5,
-                "completedProjects": 3,
-                "onHoldProjects": 2,
-                "totalBudget": 5000000.0,
-                "averageProjectDuration": 180.5
+    async def test_iter_projects_stops_early(self, mock_client, project_manager):
+        """Test that breaking out of the stream skips remaining pages."""
+        mock_client.query.return_value = {
+            "projects": {
+                "nodes": [{"ident": "proj-1", "name": "Project 1"}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"}
             }
-        })
+        }
         
-        manager = ProjectManager(mock_client)
-        result = await manager.get_project_statistics()
+        async for project in project_manager.iter_projects():
+            break
         
-        assert result["totalProjects"] == 10
-        assert result["activeProjects"] == 5
-        assert result["completedProjects"] == 3
-        assert result["totalBudget"] == 5000000.0
+        assert project["ident"] == "proj-1"
+        assert mock_client.query.call_count == 1
     
-    @pytest.mark.asyncio
-    async def test_create_project_success(self):
-        """Test successful project creation."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
-            "createProject": {
-                "id": "proj-new-123",
-                "name": "New Project",
-                "status": "planning",
-                "startDate": "2024-01-01",
-                "endDate": "2024-12-31"
+    async def test_list_projects_limit_uses_cursor(self, mock_client, project_manager):
+        """Test that a limited listing fetches one page starting after the cursor."""
+        mock_client.query.return_value = {
+            "projects": {
+                "nodes": [{"ident": "proj-3", "name": "Project 3"}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "cursor-3"}
             }
-        })
-        
-        manager = ProjectManager(mock_client)
-        project_data = {
-            "name": "New Project",
-            "status": "planning",
-            "startDate": "2024-01-01",
-            "endDate": "2024-12-31",
-            "description": "A new construction project"
         }
         
-        result = await manager.create_project(project_data)
+        result = await project_manager.list_projects(limit=1, after="cursor-2")
+        page = await project_manager.get_projects_page(first=1, after="cursor-2")
         
-        assert result["id"] == "proj-new-123"
-        assert result["name"] == "New Project"
-        assert result["status"] == "planning"
+        assert [p["ident"] for p in result] == ["proj-3"]
+        assert page["endCursor"] == "cursor-3"
+        assert page["hasNextPage"] is True
+        assert mock_client.query.call_args_list[0].args[1] == {"first": 1, "after": "cursor-2"}
     
-    @pytest.mark.asyncio
-    async def test_create_project_invalid_data(self):
-        """Test project creation with invalid data."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(side_effect=Exception("Invalid project data"))
+    async def test_get_projects_page_sends_status_filter(self, mock_client, project_manager):
+        """Test that the status filter is sent to the server with the page query."""
+        mock_client.query.return_value = {
+            "projects": {"nodes": [{"ident": "proj-1", "name": "Project 1"}], "pageInfo": {"hasNextPage": False}}
+        }
         
-        manager = ProjectManager(mock_client)
-        project_data = {"name": ""}  # Invalid: empty name
+        await project_manager.get_projects_page(status="active", first=10)
+        await project_manager.get_projects_page(first=10)
         
-        with pytest.raises(InvalidProjectDataError):
-            await manager.create_project(project_data)
+        filtered, unfiltered = mock_client.query.call_args_list
+        assert "ProjectFilter" in filtered.args[0]
+        assert filtered.args[1] == {"first": 10, "after": None, "filter": {"status": {"eq": "active"}}}
+        assert "ProjectFilter" not in unfiltered.args[0]
+        assert unfiltered.args[1] == {"first": 10, "after": None}
     
-    @pytest.mark.asyncio
-    async def test_update_project_success(self):
-        """Test successful project update."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
-            "updateProject": {
-                "id": "proj-123",
-                "name": "Updated Project Name",
-                "status": "active"
+    async def test_iter_projects_keeps_status_filter_across_pages(self, mock_client, project_manager):
+        """Test that streaming with a status filter sends the filter with every page."""
+        mock_client.query.side_effect = [
+            {
+                "projects": {
+                    "nodes": [{"ident": "proj-1", "name": "Project 1"}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"}
+                }
+            },
+            {
+                "projects": {
+                    "nodes": [{"ident": "proj-2", "name": "Project 2"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None}
+                }
             }
-        })
-        
-        manager = ProjectManager(mock_client)
-        update_data = {
-            "name": "Updated Project Name",
-            "status": "active"
-        }
+        ]
         
-        result = await manager.update_project("proj-123", update_data)
+        result = [project async for project in project_manager.iter_projects(status="active", page_size=1)]
         
-        assert result["id"] == "proj-123"
-        assert result["name"] == "Updated Project Name"
-        assert result["status"] == "active"
+        assert [p["ident"] for p in result] == ["proj-1", "proj-2"]
+        assert [call.args[1]["filter"] for call in mock_client.query.call_args_list] == [
+            {"status": {"eq": "active"}},
+            {"status": {"eq": "active"}}
+        ]
+        assert mock_client.query.call_args_list[1].args[1]["after"] == "cursor-1"
     
-    @pytest.mark.asyncio
-    async def test_update_project_not_found(self):
-        """Test project update when project doesn't exist."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(side_effect=Exception("Project not found"))
+    async def test_status_filter_unsupported_raises(self, mock_client, project_manager):
+        """Test that an unsupported status filter raises instead of returning every project."""
+        mock_client.query.side_effect = Exception('Unknown argument "filter" on field "projects"')
         
-        manager = ProjectManager(mock_client)
-        update_data = {"name": "Updated Name"}
+        with pytest.raises(ProjectManagementError, match="status filter not supported"):
+            await project_manager.get_projects_by_status("active")
+    
+    async def test_create_project_missing_name_skips_mutation(self, mock_client, project_manager):
+        """Test that invalid project data fails before any API call."""
+        with pytest.raises(InvalidProjectDataError):
+            await project_manager.create_project({"description": "No name"})
+        mock_client.mutation.assert_not_awaited()
+    
+    async def test_update_project_not_found_error_code(self, mock_client, project_manager):
+        """Test that a NOT_FOUND GraphQL error code maps to ProjectNotFoundError."""
+        mock_client.mutation.side_effect = DataError(
+            "GraphQL errors: No such project",
+            errors=[{"message": "No such project", "extensions": {"code": "NOT_FOUND"}}]
+        )
         
         with pytest.raises(ProjectNotFoundError):
-            await manager.update_project("invalid-proj", update_data)
+            await project_manager.update_project("invalid-proj", {"name": "Updated Name"})
+    
+    async def test_delete_project_other_error_code(self, mock_client, project_manager):
+        """Test that coded errors other than NOT_FOUND are not treated as missing projects."""
+        mock_client.mutation.side_effect = DataError(
+            "GraphQL errors: Related record not found",
+            errors=[{"message": "Related record not found", "extensions": {"code": "FORBIDDEN"}}]
+        )
+        
+        with pytest.raises(ProjectManagementError) as exc_info:
+            await project_manager.delete_project("proj-123")
+        assert not isinstance(exc_info.value, ProjectNotFoundError)
@@ -3,15 +3,89 @@ Unit tests for staff management library.
 
 Follows Article III: Test-First Imperative - Tests written before implementation.
 """
+import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 
-# Add libraries to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "libraries"))
+from staff_management import StaffManager, StaffManagementError, PersonNotFoundError, InvalidPersonDataError, PersonLoader
+from graphql_client import DataError
 
-from staff_management import StaffManager, StaffManagementError, PersonNotFoundError, InvalidPersonDataError
+pytestmark = pytest.mark.unit
+
+# Canned API responses; the manager only reads them, so tests share one copy
+STAFF_RESPONSE = {
+    "persons": {
+        "nodes": [
+            {"ident": "person-123", "formattedName": "John Doe"},
+            {"ident": "person-456", "formattedName": "Jane Smith"}
+        ],
+        "pageInfo": {"hasNextPage": False, "endCursor": None}
+    }
+}
+
+SITE_MANAGER_RESPONSE = {
+    "persons": {
+        "nodes": [
+            {"ident": "person-123", "formattedName": "John Doe"}
+        ],
+        "pageInfo": {"hasNextPage": False, "endCursor": None}
+    }
+}
+
+PROJECT_STAFF_RESPONSE = {
+    "people": [
+        {
+            "id": "person-123",
+            "name": "John Doe",
+            "role": "Site Manager",
+            "assignedProjects": ["proj-123"]
+        }
+    ]
+}
+
+PERSON_DETAILS_RESPONSE = {
+    "person": {
+        "id": "person-123",
+        "name": "John Doe",
+        "role": "Site Manager",
+        "email": "john.doe@example.com",
+        "phone": "+1234567890",
+        "department": "Construction",
+        "isActive": True,
+        "hireDate": "2023-01-15",
+        "skills": ["Project Management", "Safety Training"]
+    }
+}
+
+STAFF_STATS_RESPONSE = {"persons": {"totalCount": 25}}
+
+CREATED_PERSON_RESPONSE = {
+    "createPerson": {
+        "id": "person-new-123",
+        "name": "New Person",
+        "role": "Engineer",
+        "email": "new.person@example.com",
+        "isActive": True
+    }
+}
+
+UPDATED_PERSON_RESPONSE = {
+    "updatePerson": {
+        "id": "person-123",
+        "name": "Updated Name",
+        "role": "Senior Engineer"
+    }
+}
+
+
+def person_node(ident: str = "person-123", name: str = "John Doe") -> dict:
+    """Build a fresh persons node; the manager may add derived fields in place."""
+    return {"ident": ident, "formattedName": name}
+
+
+def persons_response(*nodes, **connection_fields) -> dict:
+    """Wrap person nodes in a persons connection response."""
+    return {"persons": {"nodes": list(nodes), **connection_fields}}
 
 
 class TestStaffManager:
@@ -19,97 +93,41 @@ class TestStaffManager:
     
     def test_init_with_valid_client(self):
         """Test StaffManager initialization with valid GraphQL client."""
-        mock_client = Mock()
-        manager = StaffManager(mock_client)
-        assert manager.client == mock_client
-    
-    @pytest.mark.asyncio
-    async def test_list_staff_success(self):
-        """Test successful staff listing."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "people": [
-                {
-                    "id": "person-123",
-                    "name": "John Doe",
-                    "role": "Site Manager",
-                    "email": "john.doe@example.com",
-                    "phone": "+1234567890",
-                    "isActive": True
-                },
-                {
-                    "id": "person-456",
-                    "name": "Jane Smith",
-                    "role": "Engineer",
-                    "email": "jane.smith@example.com",
-                    "phone": "+0987654321",
-                    "isActive": True
-                }
-            ]
-        })
-        
-        manager = StaffManager(mock_client)
-        result = await manager.list_staff()
-        
-        assert len(result) == 2
-        assert result[0]["id"] == "person-123"
-        assert result[0]["name"] == "John Doe"
-        assert result[0]["role"] == "Site Manager"
-        assert result[1]["id"] == "person-456"
-        assert result[1]["name"] == "Jane Smith"
+        client = SimpleNamespace()
+        manager = StaffManager(client)
+        assert manager.client is client
     
-    @pytest.mark.asyncio
-    async def test_list_staff_with_filters(self):
-        """Test staff listing with role filter."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "people": [
-                {
-                    "id": "person-123",
-                    "name": "John Doe",
-                    "role": "Site Manager",
-                    "isActive": True
-                }
-            ]
-        })
-        
-        manager = StaffManager(mock_client)
-        result = await manager.list_staff(role="Site Manager")
-        
-        assert len(result) == 1
-        assert result[0]["role"] == "Site Manager"
+    @pytest.mark.parametrize("method, kwargs, response, expected_count, field, value", [
+        pytest.param("list_staff", {}, STAFF_RESPONSE, 2, "formattedName", "John Doe", id="list"),
+        pytest.param("list_staff", {"role": "Site Manager"}, SITE_MANAGER_RESPONSE, 1, "ident", "person-123", id="list-by-role"),
+        pytest.param("search_staff", {"query": "John"}, SITE_MANAGER_RESPONSE, 1, "formattedName", "John Doe", id="search-by-name"),
+        pytest.param("search_staff", {"query": "Site Manager"}, SITE_MANAGER_RESPONSE, 1, "ident", "person-123", id="search-by-role"),
+        pytest.param("get_staff_by_role", {"role": "Site Manager"}, SITE_MANAGER_RESPONSE, 1, "ident", "person-123", id="by-role"),
+        pytest.param("get_active_staff", {}, SITE_MANAGER_RESPONSE, 1, "ident", "person-123", id="active"),
+        pytest.param("get_staff_by_project", {"project_id": "proj-123"}, PROJECT_STAFF_RESPONSE, 1, "assignedProjects", ["proj-123"], id="by-project"),
+    ])
+    async def test_staff_listing(self, mock_client, staff_manager, method, kwargs, response, expected_count, field, value):
+        """Test that each staff listing returns the persons from the response."""
+        mock_client.query.return_value = response
+        
+        result = await getattr(staff_manager, method)(**kwargs)
+        
+        assert len(result) == expected_count
+        assert result[0][field] == value
     
-    @pytest.mark.asyncio
-    async def test_list_staff_empty(self):
+    async def test_list_staff_empty(self, mock_client, staff_manager):
         """Test staff listing when no staff exist."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"people": []})
+        mock_client.query.return_value = persons_response()
         
-        manager = StaffManager(mock_client)
-        result = await manager.list_staff()
+        result = await staff_manager.list_staff()
         
         assert result == []
     
-    @pytest.mark.asyncio
-    async def test_get_person_details_success(self):
+    async def test_get_person_details_success(self, mock_client, staff_manager):
         """Test successful person details retrieval."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "person": {
-                "id": "person-123",
-                "name": "John Doe",
-                "role": "Site Manager",
-                "email": "john.doe@example.com",
-                "phone": "+1234567890",
-                "department": "Construction",
-                "isActive": True,
-                "hireDate": "2023-01-15",
-                "skills": ["Project Management", "Safety Training"]
-            }
-        })
+        mock_client.query.return_value = PERSON_DETAILS_RESPONSE
         
-        manager = StaffManager(mock_client)
-        result = await manager.get_person_details("person-123")
+        result = await staff_manager.get_person_details("person-123")
         
         assert result["id"] == "person-123"
         assert result["name"] == "John Doe"
@@ -117,153 +135,35 @@ class TestStaffManager:
         assert result["email"] == "john.doe@example.com"
         assert result["isActive"] is True
     
-    @pytest.mark.asyncio
-    async def test_get_person_details_not_found(self):
+    async def test_get_person_details_not_found(self, mock_client, staff_manager):
         """Test person details retrieval when person doesn't exist."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"person": None})
-        
-        manager = StaffManager(mock_client)
+        mock_client.query.return_value = {"person": None}
         
         with pytest.raises(PersonNotFoundError):
-            await manager.get_person_details("invalid-person")
-    
-    @pytest.mark.asyncio
-    async def test_search_staff_by_name(self):
-        """Test searching staff by name."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "people": [
-                {
-                    "id": "person-123",
-                    "name": "John Doe",
-                    "role": "Site Manager",
-                    "isActive": True
-                }
-            ]
-        })
-        
-        manager = StaffManager(mock_client)
-        result = await manager.search_staff(query="John")
-        
-        assert len(result) == 1
-        assert "John" in result[0]["name"]
-    
-    @pytest.mark.asyncio
-    async def test_search_staff_by_role(self):
-        """Test searching staff by role."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "people": [
-                {
-                    "id": "person-123",
-                    "name": "John Doe",
-                    "role": "Site Manager",
-                    "isActive": True
-                }
-            ]
-        })
-        
-        manager = StaffManager(mock_client)
-        result = await manager.search_staff(query="Site Manager")
-        
-        assert len(result) == 1
-        assert result[0]["role"] == "Site Manager"
+            await staff_manager.get_person_details("invalid-person")
     
-    @pytest.mark.asyncio
-    async def test_search_staff_empty(self):
+    async def test_search_staff_empty(self, mock_client, staff_manager):
         """Test searching staff when no matches found."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"people": []})
+        mock_client.query.return_value = persons_response()
         
-        manager = StaffManager(mock_client)
-        result = await manager.search_staff(query="NonExistent")
+        result = await staff_manager.search_staff(query="NonExistent")
         
         assert result == []
     
-    @pytest.mark.asyncio
-    async def test_get_staff_by_role(self):
-        """Test getting staff filtered by role."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "people": [
-                {
-                    "id": "person-123",
-                    "name": "John Doe",
-                    "role": "Site Manager",
-                    "isActive": True
-                }
-            ]
-        })
-        
-        manager = StaffManager(mock_client)
-        result = await manager.get_staff_by_role("Site Manager")
-        
-        assert len(result) == 1
-        assert result[0]["role"] == "Site Manager"
-    
-    @pytest.mark.asyncio
-    async def test_get_active_staff(self):
-        """Test getting active staff members."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "people": [
-                {
-                    "id": "person-123",
-                    "name": "John Doe",
-                    "role": "Site Manager",
-                    "isActive": True
-                }
-            ]
-        })
-        
-        manager = StaffManager(mock_client)
-        result = await manager.get_active_staff()
-        
-        assert len(result) == 1
-        assert result[0]["isActive"] is True
-    
-    @pytest.mark.asyncio
-    async def test_get_staff_statistics(self):
+    async def test_get_staff_statistics(self, mock_client, staff_manager):
         """Test getting staff statistics."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "staffStats": {
-                "totalStaff": 25,
-                "activeStaff": 20,
-                "inactiveStaff": 5,
-                "staffByRole": [
-                    {"role": "Site Manager", "count": 3},
-                    {"role": "Engineer", "count": 8},
-                    {"role": "Worker", "count": 9}
-                ],
-                "averageTenure": 2.5
-            }
-        })
+        mock_client.query.return_value = STAFF_STATS_RESPONSE
         
-        manager = StaffManager(mock_client)
-        result = await manager.get_staff_statistics()
+        result = await staff_manager.get_staff_statistics()
         
         assert result["totalStaff"] == 25
-        assert result["activeStaff"] == 20
-        assert result["inactiveStaff"] == 5
-        assert result["averageTenure"] == 2.5
+        assert result["activeStaff"] == 0
+        assert result["staffByRole"] == []
     
-    @pytest.mark.asyncio
-    async def test_create_person_success(self):
+    async def test_create_person_success(self, mock_client, staff_manager):
         """Test successful person creation."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
-            "createPerson": {
-                "id": "person-new-123",
-                "name": "New Person",
-                "role": "Engineer",
-                "email": "new.person@example.com",
-                "isActive": True
-            }
-        })
+        mock_client.mutation.return_value = CREATED_PERSON_RESPONSE
         
-        manager = StaffManager(mock_client)
         person_data = {
             "name": "New Person",
             "role": "Engineer",
@@ -271,78 +171,314 @@ class TestStaffManager:
             "phone": "+1234567890"
         }
         
-        result = await manager.create_person(person_data)
+        result = await staff_manager.create_person(person_data)
         
         assert result["id"] == "person-new-123"
         assert result["name"] == "New Person"
         assert result["role"] == "Engineer"
     
-    @pytest.mark.asyncio
-    async def test_create_person_invalid_data(self):
-        """Test person creation with invalid data."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(side_effect=Exception("Invalid person data"))
-        
-        manager = StaffManager(mock_client)
-        person_data = {"name": ""}  # Invalid: empty name
-        
-        with pytest.raises(InvalidPersonDataError):
-            await manager.create_person(person_data)
-    
-    @pytest.mark.asyncio
-    async def test_update_person_success(self):
+    async def test_update_person_success(self, mock_client, staff_manager):
         """Test successful person update."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
-            "updatePerson": {
-                "id": "person-123",
-                "name": "Updated Name",
-                "role": "Senior Engineer"
-            }
-        })
+        mock_client.mutation.return_value = UPDATED_PERSON_RESPONSE
         
-        manager = StaffManager(mock_client)
         update_data = {
             "name": "Updated Name",
             "role": "Senior Engineer"
         }
         
-        result = await manager.update_person("person-123", update_data)
+        result = await staff_manager.update_person("person-123", update_data)
         
         assert result["id"] == "person-123"
         assert result["name"] == "Updated Name"
         assert result["role"] == "Senior Engineer"
     
-    @pytest.mark.asyncio
-    async def test_update_person_not_found(self):
-        """Test person update when person doesn't exist."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(side_effect=Exception("Person not found"))
+    @pytest.mark.parametrize("method, args, error, expected", [
+        pytest.param("create_person", ({"name": ""},), Exception("Invalid person data"), InvalidPersonDataError, id="create-invalid-data"),
+        pytest.param("update_person", ("invalid-person", {"name": "Updated Name"}), Exception("Person not found"), PersonNotFoundError, id="update-not-found"),
+    ])
+    async def test_person_mutation_errors(self, mock_client, staff_manager, method, args, error, expected):
+        """Test that failed person mutations raise the matching staff error."""
+        mock_client.mutation.side_effect = error
+        
+        with pytest.raises(expected):
+            await getattr(staff_manager, method)(*args)
+    
+    async def test_search_staff_sends_filter_variables(self, mock_client, staff_manager):
+        """Test that search filters and limit are sent to the server."""
+        mock_client.query.return_value = persons_response(person_node())
+        
+        result = await staff_manager.search_staff(query="John", is_active=True, limit=5)
+        
+        assert result == [person_node()]
+        variables = mock_client.query.call_args.args[1]
+        assert variables["first"] == 5
+        assert variables["filter"] == {
+            "isActive": {"eq": True},
+            "formattedName": {"contains": "John"}
+        }
+    
+    async def test_search_staff_falls_back_without_filter_support(self, mock_client, staff_manager):
+        """Test local filtering when the schema rejects the filter argument."""
+        mock_client.query.side_effect = [
+            Exception('Unknown argument "filter" on field "persons"'),
+            persons_response(person_node(), person_node("person-456", "Jane Smith"))
+        ]
         
-        manager = StaffManager(mock_client)
-        update_data = {"name": "Updated Name"}
+        result = await staff_manager.search_staff(query="john")
         
-        with pytest.raises(PersonNotFoundError):
-            await manager.update_person("invalid-person", update_data)
+        assert [p["ident"] for p in result] == ["person-123"]
+        assert mock_client.query.call_count == 2
+    
+    async def test_list_staff_unfiltered_does_not_declare_filter(self, mock_client, staff_manager):
+        """Test that an unfiltered listing neither declares nor sends the filter variable."""
+        mock_client.query.return_value = persons_response(person_node())
+        
+        await staff_manager.list_staff(limit=1)
+        
+        query, variables = mock_client.query.call_args.args
+        assert "PersonFilter" not in query
+        assert "filter" not in variables
+    
+    async def test_list_staff_falls_back_without_paging_support(self, mock_client, staff_manager):
+        """Test that an unfiltered listing still works when the schema rejects paging arguments."""
+        mock_client.query.side_effect = [
+            Exception('Unknown argument "first" on field "persons"'),
+            persons_response(person_node(), person_node("person-456", "Jane Smith"))
+        ]
+        
+        result = await staff_manager.list_staff()
+        
+        assert [p["ident"] for p in result] == ["person-123", "person-456"]
+        assert mock_client.query.call_args.args[0].strip().startswith("query GetAllStaff")
+    
+    async def test_list_staff_role_filter_unsupported_raises(self, mock_client, staff_manager):
+        """Test that a role filter the API rejects raises instead of returning unfiltered staff."""
+        mock_client.query.side_effect = Exception('Unknown argument "filter" on field "persons"')
+        
+        with pytest.raises(StaffManagementError):
+            await staff_manager.list_staff(role="Site Manager")
+        with pytest.raises(StaffManagementError):
+            await staff_manager.search_staff(query="John", is_active=True, limit=5)
+        assert mock_client.query.await_count == 2
     
-    @pytest.mark.asyncio
-    async def test_get_staff_by_project(self):
-        """Test getting staff assigned to a specific project."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "people": [
-                {
-                    "id": "person-123",
-                    "name": "John Doe",
-                    "role": "Site Manager",
-                    "assignedProjects": ["proj-123"]
+    async def test_get_person_details_batches_concurrent_calls(self, mock_client, staff_manager):
+        """Test that concurrent detail lookups share one GraphQL query."""
+        mock_client.query.return_value = persons_response(
+            person_node(),
+            person_node("person-456", "Jane Smith")
+        )
+        
+        results = await asyncio.gather(
+            staff_manager.get_person_details("person-123"),
+            staff_manager.get_person_details("person-456"),
+            staff_manager.get_person_details("person-123"),
+            staff_manager.get_person_details("person-789"),
+            return_exceptions=True
+        )
+        
+        assert mock_client.query.call_count == 1
+        assert mock_client.query.call_args.args[1] == {"ids": ["person-123", "person-456", "person-789"]}
+        assert results[0]["formattedName"] == "John Doe"
+        assert results[1]["formattedName"] == "Jane Smith"
+        assert results[2] is results[0]
+        assert isinstance(results[3], PersonNotFoundError)
+    
+    async def test_managers_sharing_a_loader_batch_lookups(self, mock_client):
+        """Test that lookups through separate managers with one loader share a query."""
+        loader = PersonLoader(mock_client)
+        mock_client.query.return_value = persons_response(
+            person_node(),
+            person_node("person-456", "Jane Smith")
+        )
+        
+        first, second = await asyncio.gather(
+            StaffManager(mock_client, loader).get_person_details("person-123"),
+            StaffManager(mock_client, loader).get_person_details("person-456")
+        )
+        
+        assert mock_client.query.call_count == 1
+        assert first["formattedName"] == "John Doe"
+        assert second["formattedName"] == "Jane Smith"
+    
+    async def test_list_staff_with_stats_single_request(self, mock_client, staff_manager):
+        """Test that staff and statistics come from one GraphQL request."""
+        mock_client.query.return_value = persons_response(person_node(), totalCount=25)
+        
+        result = await staff_manager.list_staff_with_stats(limit=1)
+        
+        assert mock_client.query.call_count == 1
+        assert result["staff"] == [person_node()]
+        assert result["statistics"]["totalStaff"] == 25
+    
+    async def test_search_staff_fallback_matches_case_insensitively(self, mock_client, staff_manager):
+        """Test that the local fallback matches names case-insensitively up to the limit."""
+        mock_client.query.side_effect = [
+            Exception('Unknown argument "filter" on field "persons"'),
+            persons_response(
+                person_node("person-1", "Anna Weiß"),
+                person_node("person-2", "Bob Builder"),
+                person_node("person-3", "ANNA Schmidt"),
+                person_node("person-4", "Anna Berg")
+            )
+        ]
+        
+        result = await staff_manager.search_staff(query="anna", limit=2)
+        
+        assert [p["ident"] for p in result] == ["person-1", "person-3"]
+    
+    async def test_search_staff_fallback_stops_at_limit(self, mock_client, staff_manager):
+        """Test that the local fallback stops matching once the limit is reached."""
+        class ScannedPastLimit(dict):
+            def get(self, *args):
+                raise AssertionError("matched past the limit")
+        
+        mock_client.query.side_effect = [
+            Exception('Unknown argument "filter" on field "persons"'),
+            persons_response(
+                person_node("person-1", "Anna Weiß"),
+                person_node("person-2", "Anna Berg"),
+                ScannedPastLimit(person_node("person-3", "Anna Schmidt"))
+            )
+        ]
+        
+        result = await staff_manager.search_staff(query="anna", limit=2)
+        
+        assert [p["ident"] for p in result] == ["person-1", "person-2"]
+    
+    async def test_iter_staff_follows_cursor(self, mock_client, staff_manager):
+        """Test streaming staff across multiple cursor pages."""
+        mock_client.query.side_effect = [
+            {
+                "persons": {
+                    "nodes": [{"ident": "person-1"}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"}
+                }
+            },
+            {
+                "persons": {
+                    "nodes": [{"ident": "person-2"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": "cursor-2"}
                 }
-            ]
-        })
+            }
+        ]
+        
+        result = [person async for person in staff_manager.iter_staff(is_active=True, page_size=1)]
         
-        manager = StaffManager(mock_client)
-        result = await manager.get_staff_by_project("proj-123")
+        assert [p["ident"] for p in result] == ["person-1", "person-2"]
+        assert mock_client.query.call_args_list[1].args[1] == {
+            "first": 1,
+            "after": "cursor-1",
+            "filter": {"isActive": {"eq": True}}
+        }
+    
+    async def test_get_dashboard_combines_reads(self, mock_client, staff_manager):
+        """Test that the dashboard merges staff, statistics and active staff."""
+        mock_client.query.return_value = persons_response(person_node(), totalCount=1)
+        
+        result = await staff_manager.get_dashboard()
+        
+        assert mock_client.query.call_count == 2
+        assert result["staff"] == [person_node()]
+        assert result["statistics"]["totalStaff"] == 1
+        assert result["activeStaff"] == [person_node()]
+    
+    async def test_search_staff_fallback_large_collection(self, mock_client, staff_manager):
+        """Test local filtering of a large collection when the filter is unsupported."""
+        persons = [person_node(f"person-{i}", f"Worker {i}") for i in range(1500)]
+        persons.append(person_node("person-anna", "Anna Weiß"))
+        mock_client.query.side_effect = [
+            Exception('Unknown argument "filter" on field "persons"'),
+            persons_response(*persons)
+        ]
+        
+        result = await staff_manager.search_staff(query="anna")
+        
+        assert [p["ident"] for p in result] == ["person-anna"]
+    
+    async def test_list_staff_selects_requested_fields(self, mock_client, staff_manager):
+        """Test that only the requested fields are selected and names are derived locally."""
+        mock_client.query.return_value = persons_response(
+            {"ident": "person-123", "firstname": "John", "lastname": "Doe"}
+        )
+        
+        result = await staff_manager.list_staff(limit=1)
+        
+        sent_query = mock_client.query.call_args.args[0]
+        assert "firstname" in sent_query
+        assert "formattedName" not in sent_query
+        assert result[0]["formattedName"] == "John Doe"
+    
+    async def test_list_staff_rejects_unknown_fields(self, mock_client, staff_manager):
+        """Test that fields outside the allow-list are rejected before any request."""
+        with pytest.raises(StaffManagementError):
+            await staff_manager.list_staff(limit=1, fields=("ident", "salary"))
+        mock_client.query.assert_not_awaited()
+    
+    async def test_get_staff_by_role_uses_dedicated_query(self, mock_client, staff_manager):
+        """Test that the role filter is part of a dedicated query."""
+        mock_client.query.return_value = persons_response(
+            {"ident": "person-123", "firstname": "John", "lastname": "Doe"}
+        )
+        
+        result = await staff_manager.get_staff_by_role("Site Manager")
+        
+        query, variables = mock_client.query.call_args.args
+        assert "GetStaffByRole" in query
+        assert variables["role"] == "Site Manager"
+        assert result[0]["formattedName"] == "John Doe"
+    
+    async def test_create_and_assign_single_mutation(self, mock_client, staff_manager):
+        """Test that creating and assigning a person takes one mutation."""
+        mock_client.mutation.return_value = {
+            "createPerson": {"id": "person-789", "name": "New Person", "assignedProjects": ["proj-123"]}
+        }
+        
+        result = await staff_manager.create_and_assign({"name": "New Person"}, "proj-123")
+        
+        assert result["id"] == "person-789"
+        assert mock_client.mutation.await_count == 1
+        variables = mock_client.mutation.call_args.args[1]
+        assert variables["input"] == {"name": "New Person", "assignedProjects": ["proj-123"]}
+    
+    async def test_create_and_assign_falls_back_to_separate_assignment(self, mock_client, staff_manager):
+        """Test that create_and_assign creates then assigns when the input has no assignedProjects."""
+        mock_client.mutation.side_effect = [
+            DataError(
+                'Field "assignedProjects" is not defined by type "CreatePersonInput"',
+                [{"extensions": {"code": "GRAPHQL_VALIDATION_FAILED"}}]
+            ),
+            {"createPerson": {"id": "person-789", "name": "New Person"}},
+            {"assignPersonToProject": {"success": True, "message": "ok"}}
+        ]
+        
+        result = await staff_manager.create_and_assign({"name": "New Person"}, "proj-123")
+        
+        assert result["id"] == "person-789"
+        create_call, assign_call = mock_client.mutation.call_args_list[1:]
+        assert create_call.args[1] == {"input": {"name": "New Person"}}
+        assert assign_call.args[1] == {"personId": "person-789", "projectId": "proj-123"}
+    
+    async def test_create_and_assign_requires_name(self, mock_client, staff_manager):
+        """Test that create_and_assign validates the person data like create_person."""
+        with pytest.raises(InvalidPersonDataError):
+            await staff_manager.create_and_assign({"name": ""}, "proj-123")
+        
+        mock_client.mutation.assert_not_awaited()
+    
+    async def test_get_staff_statistics_uses_client_retries(self, server, client):
+        """Test that a read recovers through the client's own retry of server errors."""
+        server.respond({}, status_code=503)
+        server.respond({"data": {"persons": {"totalCount": 3}}})
+        
+        stats = await StaffManager(client).get_staff_statistics()
+        
+        assert stats["totalStaff"] == 3
+        assert len(server.requests) == 2
+    
+    async def test_get_staff_statistics_does_not_repeat_client_retries(self, server, client):
+        """Test that a NetworkError after the client's retries is not retried again."""
+        server.respond({}, status_code=503)
         
-        assert len(result) == 1
-        assert result[0]["id"] == "person-123"
-        assert "proj-123" in result[0]["assignedProjects"]
+        with pytest.raises(StaffManagementError):
+            await StaffManager(client).get_staff_statistics()
+        assert len(server.requests) == 3
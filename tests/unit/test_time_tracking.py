@@ -5,259 +5,204 @@ Follows Article III: Test-First Imperative - Tests written before implementation
 """
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch, AsyncMock
-import sys
-from pathlib import Path
-
-# Add libraries to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "libraries"))
+from types import SimpleNamespace
 
 from time_tracking import TimeTracker, TimeTrackingError, InvalidProjectError, TimeTrackingActiveError, TimeTrackingNotActiveError
 
+pytestmark = pytest.mark.unit
+
+# Canned API responses; the manager only reads them, so tests share one copy
+STARTED_TIME_RESPONSE = {
+    "createStaffTime": {
+        "id": "time-123",
+        "projectId": "proj-123",
+        "personId": "person-456",
+        "startTime": "2024-01-01T09:00:00Z",
+        "isActive": True
+    }
+}
+
+STOPPED_TIME_RESPONSE = {
+    "updateStaffTime": {
+        "id": "time-123",
+        "endTime": "2024-01-01T17:00:00Z",
+        "durationHours": 8.0,
+        "isActive": False
+    }
+}
+
+TIMES_RESPONSE = {
+    "times": {
+        "nodes": [
+            {
+                "ident": "time-123",
+                "person": {"firstname": "Jane", "lastname": "Smith", "formattedName": "Jane Smith"},
+                "project": {"name": "Office Building"}
+            }
+        ],
+        "totalCount": 1
+    }
+}
+
 
 class TestTimeTracker:
     """Test cases for TimeTracker class."""
     
     def test_init_with_valid_client(self):
         """Test TimeTracker initialization with valid GraphQL client."""
-        mock_client = Mock()
-        tracker = TimeTracker(mock_client)
-        assert tracker.client == mock_client
+        client = SimpleNamespace()
+        tracker = TimeTracker(client)
+        assert tracker.client is client
         assert tracker.active_tracking is None
     
-    @pytest.mark.asyncio
-    async def test_start_time_tracking_success(self):
+    async def test_start_time_tracking_success(self, mock_client, time_tracker):
         """Test successful time tracking start."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
-            "createStaffTime": {
-                "id": "time-123",
-                "projectId": "proj-123",
-                "personId": "person-456",
-                "startTime": "2024-01-01T09:00:00Z",
-                "isActive": True
-            }
-        })
+        mock_client.mutation.return_value = STARTED_TIME_RESPONSE
         
-        tracker = TimeTracker(mock_client)
-        result = await tracker.start_time_tracking("proj-123", "person-456")
+        result = await time_tracker.start_time_tracking("proj-123", "person-456")
         
         assert result["id"] == "time-123"
         assert result["projectId"] == "proj-123"
         assert result["personId"] == "person-456"
         assert result["isActive"] is True
-        assert tracker.active_tracking == "time-123"
+        assert time_tracker.active_tracking == "time-123"
     
-    @pytest.mark.asyncio
-    async def test_start_time_tracking_when_already_active(self):
+    async def test_start_time_tracking_when_already_active(self, time_tracker):
         """Test starting time tracking when already active raises error."""
-        mock_client = Mock()
-        tracker = TimeTracker(mock_client)
-        tracker.active_tracking = "existing-time-123"
+        time_tracker.active_tracking = "existing-time-123"
         
         with pytest.raises(TimeTrackingActiveError):
-            await tracker.start_time_tracking("proj-123", "person-456")
+            await time_tracker.start_time_tracking("proj-123", "person-456")
     
-    @pytest.mark.asyncio
-    async def test_stop_time_tracking_success(self):
+    async def test_stop_time_tracking_success(self, mock_client, time_tracker):
         """Test successful time tracking stop."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(return_value={
-            "updateStaffTime": {
-                "id": "time-123",
-                "endTime": "2024-01-01T17:00:00Z",
-                "durationHours": 8.0,
-                "isActive": False
-            }
-        })
+        mock_client.mutation.return_value = STOPPED_TIME_RESPONSE
         
-        tracker = TimeTracker(mock_client)
-        tracker.active_tracking = "time-123"
+        time_tracker.active_tracking = "time-123"
         
-        result = await tracker.stop_time_tracking()
+        result = await time_tracker.stop_time_tracking()
         
         assert result["id"] == "time-123"
         assert result["endTime"] == "2024-01-01T17:00:00Z"
         assert result["durationHours"] == 8.0
         assert result["isActive"] is False
-        assert tracker.active_tracking is None
+        assert time_tracker.active_tracking is None
     
-    @pytest.mark.asyncio
-    async def test_stop_time_tracking_when_not_active(self):
+    async def test_stop_time_tracking_when_not_active(self, time_tracker):
         """Test stopping time tracking when not active raises error."""
-        mock_client = Mock()
-        tracker = TimeTracker(mock_client)
-        tracker.active_tracking = None
+        time_tracker.active_tracking = None
         
         with pytest.raises(TimeTrackingNotActiveError):
-            await tracker.stop_time_tracking()
+            await time_tracker.stop_time_tracking()
     
-    @pytest.mark.asyncio
-    async def test_get_current_times_success(self):
-        """Test getting current time tracking data."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "staffTimes": [
-                {
-                    "id": "time-123",
-                    "projectId": "proj-123",
-                    "personId": "person-456",
-                    "startTime": "2024-01-01T09:00:00Z",
-                    "endTime": None,
-                    "durationHours": None,
-                    "isActive": True
-                }
-            ]
-        })
-        
-        tracker = TimeTracker(mock_client)
-        result = await tracker.get_current_times()
+    @pytest.mark.parametrize("method, kwargs, response, field, value", [
+        pytest.param("get_current_times", {}, TIMES_RESPONSE, "ident", "time-123", id="current"),
+        pytest.param("get_current_times", {"project_id": "proj-123"}, TIMES_RESPONSE, "project", {"name": "Office Building"}, id="current-for-project"),
+        pytest.param("get_current_times", {"person_id": "person-456"}, TIMES_RESPONSE, "person", {"firstname": "Jane", "lastname": "Smith", "formattedName": "Jane Smith"}, id="current-for-person"),
+        pytest.param("get_time_tracking_history", {}, TIMES_RESPONSE, "ident", "time-123", id="history"),
+        pytest.param(
+            "get_time_tracking_history",
+            {
+                "project_id": "proj-123",
+                "person_id": "person-456",
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-31"
+            },
+            TIMES_RESPONSE,
+            "project",
+            {"name": "Office Building"},
+            id="history-with-filters"
+        ),
+    ])
+    async def test_time_entries(self, mock_client, time_tracker, method, kwargs, response, field, value):
+        """Test that current times and history return the entries from the response."""
+        mock_client.query.return_value = response
+        
+        result = await getattr(time_tracker, method)(**kwargs)
         
         assert len(result) == 1
-        assert result[0]["id"] == "time-123"
-        assert result[0]["isActive"] is True
+        assert result[0]["ident"] == "time-123"
+        assert result[0][field] == value
     
-    @pytest.mark.asyncio
-    async def test_get_current_times_empty(self):
+    async def test_get_current_times_empty(self, mock_client, time_tracker):
         """Test getting current times when none are active."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={"staffTimes": []})
+        mock_client.query.return_value = {"times": {"nodes": []}}
         
-        tracker = TimeTracker(mock_client)
-        result = await tracker.get_current_times()
+        result = await time_tracker.get_current_times()
         
         assert result == []
     
-    @pytest.mark.asyncio
-    async def test_get_current_times_for_project(self):
-        """Test getting current times for specific project."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "staffTimes": [
-                {
-                    "id": "time-123",
-                    "projectId": "proj-123",
-                    "personId": "person-456",
-                    "startTime": "2024-01-01T09:00:00Z",
-                    "isActive": True
-                }
-            ]
-        })
-        
-        tracker = TimeTracker(mock_client)
-        result = await tracker.get_current_times(project_id="proj-123")
-        
-        assert len(result) == 1
-        assert result[0]["projectId"] == "proj-123"
-    
-    @pytest.mark.asyncio
-    async def test_get_current_times_for_person(self):
-        """Test getting current times for specific person."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "staffTimes": [
-                {
-                    "id": "time-123",
-                    "projectId": "proj-123",
-                    "personId": "person-456",
-                    "startTime": "2024-01-01T09:00:00Z",
-                    "isActive": True
-                }
-            ]
-        })
-        
-        tracker = TimeTracker(mock_client)
-        result = await tracker.get_current_times(person_id="person-456")
-        
-        assert len(result) == 1
-        assert result[0]["personId"] == "person-456"
-    
-    @pytest.mark.asyncio
-    async def test_start_time_tracking_invalid_project(self):
+    async def test_start_time_tracking_invalid_project(self, mock_client, time_tracker):
         """Test starting time tracking with invalid project raises error."""
-        mock_client = Mock()
-        mock_client.mutation = AsyncMock(side_effect=Exception("Project not found"))
-        
-        tracker = TimeTracker(mock_client)
+        mock_client.mutation.side_effect = Exception("Project not found")
         
         with pytest.raises(InvalidProjectError):
-            await tracker.start_time_tracking("invalid-proj", "person-456")
+            await time_tracker.start_time_tracking("invalid-proj", "person-456")
     
-    @pytest.mark.asyncio
-    async def test_get_time_tracking_history(self):
-        """Test getting time tracking history."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "staffTimes": [
-                {
-                    "id": "time-123",
-                    "projectId": "proj-123",
-                    "personId": "person-456",
-                    "startTime": "2024-01-01T09:00:00Z",
-                    "endTime": "2024-01-01T17:00:00Z",
-                    "durationHours": 8.0,
-                    "isActive": False
-                }
-            ]
-        })
-        
-        tracker = TimeTracker(mock_client)
-        result = await tracker.get_time_tracking_history()
+    def test_active_tracking_state(self, time_tracker):
+        """Test the active tracking getters before and after tracking starts."""
+        # Initially no active tracking
+        assert not time_tracker.is_tracking_active()
+        assert time_tracker.get_active_tracking_id() is None
         
-        assert len(result) == 1
-        assert result[0]["durationHours"] == 8.0
-        assert result[0]["isActive"] is False
+        # Set active tracking
+        time_tracker.active_tracking = "time-123"
+        assert time_tracker.is_tracking_active()
+        assert time_tracker.get_active_tracking_id() == "time-123"
     
-    @pytest.mark.asyncio
-    async def test_get_time_tracking_history_with_filters(self):
-        """Test getting time tracking history with filters."""
-        mock_client = Mock()
-        mock_client.query = AsyncMock(return_value={
-            "staffTimes": [
-                {
-                    "id": "time-123",
-                    "projectId": "proj-123",
-                    "personId": "person-456",
-                    "startTime": "2024-01-01T09:00:00Z",
-                    "endTime": "2024-01-01T17:00:00Z",
-                    "durationHours": 8.0,
-                    "isActive": False
+    async def test_iter_time_tracking_history_follows_cursor(self, mock_client, time_tracker):
+        """Test streaming time tracking history across cursor pages."""
+        mock_client.query.side_effect = [
+            {
+                "times": {
+                    "nodes": [{"ident": "time-1"}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"}
+                }
+            },
+            {
+                "times": {
+                    "nodes": [{"ident": "time-2"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None}
                 }
-            ]
-        })
+            }
+        ]
         
-        tracker = TimeTracker(mock_client)
-        result = await tracker.get_time_tracking_history(
-            project_id="proj-123",
-            person_id="person-456",
-            start_date="2024-01-01",
-            end_date="2024-01-31"
-        )
+        result = [record async for record in time_tracker.iter_time_tracking_history(page_size=1)]
         
-        assert len(result) == 1
-        assert result[0]["projectId"] == "proj-123"
-        assert result[0]["personId"] == "person-456"
+        assert [r["ident"] for r in result] == ["time-1", "time-2"]
+        assert mock_client.query.call_args_list[1].args[1] == {"first": 1, "after": "cursor-1"}
     
-    def test_is_tracking_active(self):
-        """Test checking if time tracking is active."""
-        mock_client = Mock()
-        tracker = TimeTracker(mock_client)
+    async def test_time_tracking_history_warns_about_unapplied_filters(self, mock_client, time_tracker, caplog):
+        """Test that history filters are reported as not applied instead of silently ignored."""
+        mock_client.query.return_value = {"times": {"nodes": [{"ident": "time-1"}]}}
         
-        # Initially not active
-        assert not tracker.is_tracking_active()
+        result = await time_tracker.get_time_tracking_history(project_id="proj-123")
         
-        # Set active tracking
-        tracker.active_tracking = "time-123"
-        assert tracker.is_tracking_active()
+        assert result == [{"ident": "time-1"}]
+        assert "filters are not applied" in caplog.text
     
-    def test_get_active_tracking_id(self):
-        """Test getting active tracking ID."""
-        mock_client = Mock()
-        tracker = TimeTracker(mock_client)
+    async def test_get_current_times_reads_through_to_client(self, mock_client, time_tracker):
+        """Test that repeated reads query the client each time, leaving caching to it."""
+        mock_client.query.return_value = {
+            "times": {"nodes": [{"ident": "time-1"}], "totalCount": 1}
+        }
         
-        # Initially no active tracking
-        assert tracker.get_active_tracking_id() is None
+        first = await time_tracker.get_current_times()
+        second = await time_tracker.get_current_times()
         
-        # Set active tracking
-        tracker.active_tracking = "time-123"
-        assert tracker.get_active_tracking_id() == "time-123"
+        assert first == second == [{"ident": "time-1"}]
+        assert mock_client.query.await_count == 2
+    
+    async def test_start_time_tracking_sends_utc_timestamp(self, mock_client, time_tracker):
+        """Test that the start time is sent as a timezone-aware UTC timestamp."""
+        mock_client.mutation.return_value = {
+            "createStaffTime": {"id": "time-123", "projectId": "proj-123", "personId": "person-456"}
+        }
+        
+        await time_tracker.start_time_tracking("proj-123", "person-456")
+        
+        mutation, variables = mock_client.mutation.call_args.args
+        start_time = variables["startTime"]
+        assert "$startTime: String!" in mutation
+        assert start_time.endswith("+00:00")
+        assert datetime.fromisoformat(start_time).microsecond == 0